@@ -1,10 +1,13 @@
 from rest_framework import serializers
+
+from apps.media.serializers import SignedFileField
 from .models import Announcement
 
 
 class AnnouncementListSerializer(serializers.ModelSerializer):
     teacher_name = serializers.CharField(source='teacher.name', read_only=True)
     course_title = serializers.CharField(source='course.title', read_only=True, default=None)
+    attachment = SignedFileField()
 
     class Meta:
         model = Announcement
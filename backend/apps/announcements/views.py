@@ -6,9 +6,11 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.core.conditional import ConditionalRetrieveMixin
 from apps.core.pagination import StandardPagination
 from apps.core.permissions import IsTeacher, IsTeacherOrReadOnly
 from apps.enrollments.models import Enrollment
+from apps.media.signing import current_expiry
 
 from .models import Announcement
 from .serializers import AnnouncementCreateSerializer, AnnouncementListSerializer
@@ -85,7 +87,7 @@ class AnnouncementListCreateView(generics.ListCreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class AnnouncementDetailView(generics.RetrieveUpdateDestroyAPIView):
+class AnnouncementDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """GET/PUT/DELETE /api/v1/announcements/<id>/"""
     serializer_class = AnnouncementListSerializer
     permission_classes = [IsAuthenticated]
@@ -94,9 +96,15 @@ class AnnouncementDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         return Announcement.objects.select_related('teacher', 'course')
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        return Response({'success': True, 'data': AnnouncementListSerializer(instance).data})
+    def get_validators(self, instance):
+        # teacher_name and course_title are embedded. The attachment URL is
+        # signed until current_expiry(), which no timestamp reflects.
+        related = [instance.teacher] + ([instance.course] if instance.course_id else [])
+        stamps = [instance.updated_at] + [obj.updated_at for obj in related]
+        return (instance.pk, *stamps, current_expiry()), None
+
+    def get_retrieve_data(self, instance):
+        return AnnouncementListSerializer(instance).data
 
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
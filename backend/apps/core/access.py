@@ -0,0 +1,67 @@
+"""
+Per-user course access cache.
+Holds the IDs of courses a user is actively enrolled in and the courses they
+own, loaded in one query and kept in the cache so permission checks are set
+lookups. Call `invalidate_course_access` whenever enrollment or ownership changes.
+"""
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.models import Q
+
+ACCESS_CACHE_TIMEOUT = 60 * 5
+_ATTR = '_course_access'
+
+
+@dataclass(frozen=True)
+class CourseAccess:
+    enrolled: frozenset
+    owned: frozenset
+
+    def can_view(self, course_id):
+        return course_id in self.enrolled or course_id in self.owned
+
+
+def _cache_key(user_id):
+    return f'course_access:{user_id}'
+
+
+def _load(user_id):
+    from apps.courses.models import Course
+    rows = (
+        Course.objects.filter(
+            Q(teacher_id=user_id) | Q(enrollments__student_id=user_id, enrollments__is_active=True)
+        )
+        .values_list('id', 'teacher_id')
+        .distinct()
+    )
+    enrolled, owned = set(), set()
+    for course_id, teacher_id in rows:
+        (owned if teacher_id == user_id else enrolled).add(course_id)
+    return CourseAccess(enrolled=frozenset(enrolled), owned=frozenset(owned))
+
+
+def get_course_access(user):
+    """Return the cached CourseAccess for `user`, memoized on the user object for the request."""
+    access = getattr(user, _ATTR, None)
+    if access is not None:
+        return access
+    key = _cache_key(user.pk)
+    access = cache.get(key)
+    if access is None:
+        access = _load(user.pk)
+        cache.set(key, access, ACCESS_CACHE_TIMEOUT)
+    setattr(user, _ATTR, access)
+    return access
+
+
+def invalidate_course_access(*users):
+    """Drop cached access for the given users (User instances or IDs)."""
+    keys = []
+    for user in users:
+        if hasattr(user, 'pk'):
+            user.__dict__.pop(_ATTR, None)
+            keys.append(_cache_key(user.pk))
+        else:
+            keys.append(_cache_key(user))
+    cache.delete_many(keys)
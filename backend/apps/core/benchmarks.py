@@ -0,0 +1,382 @@
+"""
+Endpoint latency benchmark harness.
+Seeds a synthetic tenant, then measures p50/p95 latency and query counts for
+every GET endpoint under /api/v1/ and compares them against a stored baseline.
+"""
+import json
+import math
+import random
+import re
+import statistics
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+
+BENCH_EMAIL_DOMAIN = 'bench.mentiq.local'
+BATCH_SIZE = 2000
+
+_CONVERTER_RE = re.compile(r'<(?:(?P<converter>\w+):)?(?P<name>\w+)>')
+
+# URL namespace -> sample object used for an `<uuid:id>` kwarg on that app's routes
+_ID_SAMPLES = {
+    'courses': 'course',
+    'lessons': 'lesson',
+    'quizzes': 'quiz',
+    'announcements': 'announcement',
+}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# ---------------------------------------------------------------------------
+# Seeding
+# ---------------------------------------------------------------------------
+
+def _batched_create(model, objects):
+    model.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+
+
+def flush_tenant():
+    """Delete every user created by `seed_tenant` (cascades to their data)."""
+    from apps.users.models import User
+    return User.objects.filter(email__endswith=f'@{BENCH_EMAIL_DOMAIN}').delete()[0]
+
+
+def seed_tenant(teachers=10, courses_per_teacher=5, lessons_per_course=20, quizzes_per_course=3,
+                questions_per_quiz=10, students=10000, enrollments_per_student=3,
+                completion_rate=0.5, attempts_per_enrollment=1, seed=42, stdout=None):
+    """
+    Create a synthetic tenant with bulk inserts and return a summary of row counts.
+    All users share one password hash ('benchmark') so seeding stays fast.
+    """
+    from apps.announcements.models import Announcement
+    from apps.courses.models import Course
+    from apps.enrollments.models import Enrollment
+    from apps.lessons.models import Lesson
+    from apps.progress.models import CourseProgress, LessonProgress
+    from apps.quizzes.models import Quiz, QuizAttempt, QuizQuestion
+    from apps.users.models import User
+
+    rng = random.Random(seed)
+    password = make_password('benchmark')
+    categories = [c for c, _ in Course.CategoryChoices.choices]
+    levels = [lv for lv, _ in Course.LevelChoices.choices]
+
+    def log(message):
+        if stdout is not None:
+            stdout.write(message)
+
+    with transaction.atomic():
+        teacher_objs = [
+            User(email=f'teacher{i}@{BENCH_EMAIL_DOMAIN}', name=f'Bench Teacher {i}',
+                 role='teacher', password=password)
+            for i in range(teachers)
+        ]
+        _batched_create(User, teacher_objs)
+        log(f'  teachers: {len(teacher_objs)}')
+
+        course_objs = [
+            Course(
+                teacher=teacher,
+                title=f'Bench Course {t}-{c}',
+                description=f'Synthetic benchmark course {t}-{c}. ' * 5,
+                category=rng.choice(categories),
+                level=rng.choice(levels),
+                is_published=True,
+            )
+            for t, teacher in enumerate(teacher_objs)
+            for c in range(courses_per_teacher)
+        ]
+        _batched_create(Course, course_objs)
+        log(f'  courses: {len(course_objs)}')
+
+        lesson_objs = [
+            Lesson(
+                course=course,
+                title=f'Lesson {n}',
+                description='Synthetic lesson.',
+                content='Lorem ipsum dolor sit amet. ' * 200,
+                sequence_number=n,
+                duration=rng.randint(5, 60),
+            )
+            for course in course_objs
+            for n in range(1, lessons_per_course + 1)
+        ]
+        _batched_create(Lesson, lesson_objs)
+        log(f'  lessons: {len(lesson_objs)}')
+
+        quiz_objs = [
+            Quiz(course=course, title=f'Quiz {n}', is_published=True)
+            for course in course_objs
+            for n in range(1, quizzes_per_course + 1)
+        ]
+        _batched_create(Quiz, quiz_objs)
+        question_objs = [
+            QuizQuestion(
+                quiz=quiz,
+                question_text=f'Question {n}?',
+                option_a='A', option_b='B', option_c='C', option_d='D',
+                correct_answer=rng.choice('abcd'),
+                sequence_number=n,
+            )
+            for quiz in quiz_objs
+            for n in range(1, questions_per_quiz + 1)
+        ]
+        _batched_create(QuizQuestion, question_objs)
+        log(f'  quizzes: {len(quiz_objs)} ({len(question_objs)} questions)')
+
+        announcement_objs = [
+            Announcement(teacher=course.teacher, course=course, title='Welcome', content='Synthetic announcement.')
+            for course in course_objs
+        ]
+        _batched_create(Announcement, announcement_objs)
+
+        student_objs = [
+            User(email=f'student{i}@{BENCH_EMAIL_DOMAIN}', name=f'Bench Student {i}',
+                 role='student', password=password)
+            for i in range(students)
+        ]
+        _batched_create(User, student_objs)
+        log(f'  students: {len(student_objs)}')
+
+        lessons_by_course = {}
+        for lesson in lesson_objs:
+            lessons_by_course.setdefault(lesson.course_id, []).append(lesson)
+        quizzes_by_course = {}
+        for quiz in quiz_objs:
+            quizzes_by_course.setdefault(quiz.course_id, []).append(quiz)
+
+        per_student = min(enrollments_per_student, len(course_objs))
+        now = timezone.now()
+        enrollments, course_progresses, lesson_progresses, attempts = [], [], [], []
+        for student in student_objs:
+            for course in rng.sample(course_objs, per_student):
+                enrollments.append(Enrollment(student=student, course=course))
+                course_lessons = lessons_by_course.get(course.id, [])
+                completed = course_lessons[:int(len(course_lessons) * rng.random() * completion_rate * 2)]
+                lesson_progresses.extend(
+                    LessonProgress(student=student, lesson=lesson, completed=True, completed_at=now,
+                                   time_spent=rng.randint(60, 1800))
+                    for lesson in completed
+                )
+                course_progresses.append(CourseProgress(
+                    student=student, course=course,
+                    progress_percentage=round(len(completed) / len(course_lessons) * 100, 1) if course_lessons else 0,
+                ))
+                for quiz in quizzes_by_course.get(course.id, [])[:attempts_per_enrollment]:
+                    attempts.append(QuizAttempt(
+                        quiz=quiz, student=student,
+                        score=rng.randint(0, questions_per_quiz),
+                        total_questions=questions_per_quiz,
+                        time_taken=rng.randint(60, 1200),
+                    ))
+
+            if len(lesson_progresses) >= BATCH_SIZE * 5:
+                _batched_create(LessonProgress, lesson_progresses)
+                lesson_progresses = []
+
+        _batched_create(Enrollment, enrollments)
+        _batched_create(CourseProgress, course_progresses)
+        _batched_create(LessonProgress, lesson_progresses)
+        _batched_create(QuizAttempt, attempts)
+        log(f'  enrollments: {len(enrollments)}, quiz attempts: {len(attempts)}')
+
+        # Bulk inserts bypass the counter updates; recompute them in one pass.
+        Course.objects.filter(pk__in=[c.pk for c in course_objs]).reconcile_counters()
+
+    return {
+        'teachers': len(teacher_objs),
+        'courses': len(course_objs),
+        'lessons': len(lesson_objs),
+        'quizzes': len(quiz_objs),
+        'questions': len(question_objs),
+        'students': len(student_objs),
+        'enrollments': len(enrollments),
+        'quiz_attempts': len(attempts),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Endpoint discovery
+# ---------------------------------------------------------------------------
+
+def _iter_patterns(patterns, prefix='', namespace=None):
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from _iter_patterns(
+                entry.url_patterns,
+                prefix + str(entry.pattern),
+                entry.namespace or namespace,
+            )
+        elif isinstance(entry, URLPattern):
+            yield prefix + str(entry.pattern), namespace, entry
+
+
+def discover_endpoints(prefix='api/v1/'):
+    """Return [(route, namespace, view_class)] for every GET-capable API route."""
+    endpoints = []
+    for route, namespace, pattern in _iter_patterns(get_resolver().url_patterns):
+        if not route.startswith(prefix):
+            continue
+        view_class = getattr(pattern.callback, 'view_class', None) or getattr(pattern.callback, 'cls', None)
+        if view_class is None or not hasattr(view_class, 'get'):
+            continue
+        endpoints.append((route, namespace, view_class))
+    return endpoints
+
+
+def load_samples():
+    """Pick a representative teacher, student and content rows from the seeded tenant."""
+    from apps.announcements.models import Announcement
+    from apps.enrollments.models import Enrollment
+    from apps.lessons.models import Lesson
+    from apps.quizzes.models import Quiz
+
+    enrollment = (
+        Enrollment.objects.filter(student__email__endswith=f'@{BENCH_EMAIL_DOMAIN}', is_active=True)
+        .select_related('student', 'course', 'course__teacher')
+        .first()
+    )
+    if enrollment is None:
+        return None
+    course = enrollment.course
+    return {
+        'student': enrollment.student,
+        'teacher': course.teacher,
+        'course': course,
+        'lesson': Lesson.objects.filter(course=course).first(),
+        'quiz': Quiz.objects.filter(course=course).first(),
+        'announcement': Announcement.objects.filter(course=course).first(),
+    }
+
+
+def resolve_route(route, namespace, samples):
+    """Substitute path converters with sample ids; returns None when no sample fits."""
+    def sample_for(name):
+        if name == 'id':
+            obj = samples.get(_ID_SAMPLES.get(namespace, ''))
+        elif name.endswith('_id'):
+            obj = samples.get(name[:-3])
+        else:
+            obj = None
+        return str(obj.pk) if obj is not None else None
+
+    missing = []
+
+    def replace(match):
+        value = sample_for(match.group('name'))
+        if value is None:
+            missing.append(match.group('name'))
+            return ''
+        return value
+
+    path = _CONVERTER_RE.sub(replace, route)
+    return None if missing else '/' + path
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _auth_header(user):
+    from rest_framework_simplejwt.tokens import RefreshToken
+    return f'Bearer {RefreshToken.for_user(user).access_token}'
+
+
+def measure(client, path, auth, iterations, warmup=2):
+    """Time `iterations` GETs of `path`; returns latency percentiles and query count."""
+    for _ in range(warmup):
+        client.get(path, HTTP_AUTHORIZATION=auth, secure=True)
+
+    latencies = []
+    status_code = None
+    with CaptureQueriesContext(connection) as ctx:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = client.get(path, HTTP_AUTHORIZATION=auth, secure=True)
+            latencies.append((time.perf_counter() - start) * 1000)
+            status_code = response.status_code
+
+    return {
+        'status': status_code,
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'mean_ms': round(statistics.fmean(latencies), 2),
+        'queries': len(ctx.captured_queries) // iterations,
+    }
+
+
+def run_suite(iterations=20, warmup=2, roles=('student', 'teacher'), only=None, stdout=None):
+    """Benchmark every discovered endpoint for each role; returns {key: result}."""
+    samples = load_samples()
+    if samples is None:
+        raise RuntimeError('No benchmark tenant found. Run `manage.py seed_benchmark_data` first.')
+    unknown = set(roles) - {'student', 'teacher'}
+    if unknown:
+        raise RuntimeError(f"Unknown role(s): {', '.join(sorted(unknown))}")
+
+    from django.conf import settings
+    rest_framework = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_CLASSES': []}
+
+    results = {}
+    with override_settings(REST_FRAMEWORK=rest_framework, ALLOWED_HOSTS=['*']):
+        client = Client()
+        auth = {role: _auth_header(samples[role]) for role in roles}
+        for route, namespace, _view in discover_endpoints():
+            if only and not re.search(only, route):
+                continue
+            path = resolve_route(route, namespace, samples)
+            if path is None:
+                continue
+            for role in roles:
+                result = measure(client, path, auth[role], iterations, warmup)
+                if result['status'] in (403, 405):
+                    continue
+                key = f'GET /{route} [{role}]'
+                results[key] = result
+                if stdout is not None:
+                    stdout.write(
+                        f"  {key:<70} p50={result['p50_ms']:>8}ms p95={result['p95_ms']:>8}ms "
+                        f"queries={result['queries']:>4} status={result['status']}"
+                    )
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2, query_tolerance=0):
+    """
+    Return a list of regression messages. A result regresses when its p95 grows
+    by more than `tolerance` (fraction) or its query count grows by more than
+    `query_tolerance` over the baseline entry with the same key.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            regressions.append(f"{key}: p95 {base['p95_ms']}ms -> {result['p95_ms']}ms")
+        if result['queries'] > base['queries'] + query_tolerance:
+            regressions.append(f"{key}: queries {base['queries']} -> {result['queries']}")
+    return regressions
+
+
+def write_results(path, results, meta=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as fh:
+        json.dump({'meta': meta or {}, 'results': results}, fh, indent=2, sort_keys=True)
+
+
+def read_results(path):
+    with open(path) as fh:
+        return json.load(fh).get('results', {})
@@ -0,0 +1,298 @@
+"""
+Two-tier cache backend: a small bounded in-process LRU (L1) in front of a
+shared cache alias (L2, Redis in production, LocMemCache as a local stand-in).
+
+Writes go to L2 and publish the touched keys on a Redis pub/sub channel; every
+worker process runs a subscriber thread that evicts those keys from its L1.
+L1 entries live at most L1_TIMEOUT seconds, which bounds staleness if an
+invalidation message is ever missed, and never past the key's expiry in L2:
+values read from L2 are kept for at most its remaining ttl() (django-redis),
+and not kept in L1 at all when the L2 backend cannot report one.
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.cache.TieredCache',
+            'LOCATION': 'mentiq-tiered',
+            'OPTIONS': {
+                'L2_ALIAS': 'shared',
+                'L1_MAX_ENTRIES': 1000,
+                'L1_TIMEOUT': 30,
+                'INVALIDATION_URL': 'redis://localhost:6379/0',
+                'INVALIDATION_CHANNEL': 'mentiq:cache:invalidate',
+            },
+        },
+        'shared': {'BACKEND': 'django_redis.cache.RedisCache', 'LOCATION': 'redis://...'},
+    }
+"""
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# One L1 store per LOCATION, shared by all threads of the process (like LocMemCache).
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class LocalStore:
+    """Bounded, thread-safe LRU of pickled values with per-entry expiry."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.bus = None
+        self.stats = {
+            'l1_hits': 0,
+            'l1_misses': 0,
+            'l2_hits': 0,
+            'l2_misses': 0,
+            'invalidations_received': 0,
+            'evictions': 0,
+        }
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.stats['l1_hits'] += 1
+                    return pickle.loads(payload)
+                del self._data[key]
+            self.stats['l1_misses'] += 1
+            return _MISSING
+
+    def set(self, key, value, ttl):
+        if ttl <= 0:
+            self.discard(key)
+            return
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def discard(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {**self.stats, 'l1_size': len(self._data), 'l1_max_entries': self.max_entries}
+
+
+class InvalidationBus:
+    """
+    Redis pub/sub fan-out of evicted keys. Each process subscribes once per
+    store and ignores its own messages. Restarted after fork.
+    """
+
+    def __init__(self, url, channel, store):
+        self.url = url
+        self.channel = channel
+        self.store = store
+        self.origin = uuid.uuid4().hex
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            import redis
+            self._client = redis.Redis.from_url(self.url)
+            self.origin = uuid.uuid4().hex
+            thread = threading.Thread(target=self._listen, name='cache-invalidation', daemon=True)
+            thread.start()
+            self._pid = os.getpid()
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    self._handle(message.get('data'))
+            except Exception as e:
+                logger.warning(f"Cache invalidation subscriber error, resubscribing: {e}")
+                # Anything may have changed while disconnected.
+                self.store.clear()
+                time.sleep(1)
+
+    def _handle(self, data):
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get('origin') == self.origin:
+            return
+        self.store.count('invalidations_received')
+        if message.get('clear'):
+            self.store.clear()
+            return
+        for key in message.get('keys', []):
+            self.store.discard(key)
+
+    def publish(self, keys=None, clear=False):
+        try:
+            self.ensure_started()
+            payload = {'origin': self.origin, 'keys': list(keys or []), 'clear': clear}
+            self._client.publish(self.channel, json.dumps(payload))
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+
+class TieredCache(BaseCache):
+    """Django cache backend combining an in-process LRU with a shared L2 alias."""
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.l2_alias = options.get('L2_ALIAS', 'shared')
+        self.l1_timeout = options.get('L1_TIMEOUT', 30)
+        name = location or self.l2_alias
+
+        with _stores_lock:
+            if name not in _stores:
+                store = LocalStore(options.get('L1_MAX_ENTRIES', 1000))
+                url = options.get('INVALIDATION_URL')
+                if url:
+                    channel = options.get('INVALIDATION_CHANNEL', f'cache:invalidate:{name}')
+                    store.bus = InvalidationBus(url, channel, store)
+                _stores[name] = store
+            self._store = _stores[name]
+
+    @property
+    def l2(self):
+        return caches[self.l2_alias]
+
+    def _l1_ttl(self, timeout):
+        timeout = self.get_backend_timeout(timeout)
+        if timeout is None:
+            return self.l1_timeout
+        return min(self.l1_timeout, timeout - time.time())
+
+    def _l1_ttl_from_l2(self, key, version):
+        # django-redis ttl(): None for keys without expiry, 0 for missing ones.
+        ttl = getattr(self.l2, 'ttl', None)
+        if ttl is None:
+            return 0
+        remaining = ttl(key, version=version)
+        return self.l1_timeout if remaining is None else min(self.l1_timeout, remaining)
+
+    def _l1_available(self):
+        if self._store.bus is None:
+            return True
+        # L1 is only trustworthy once this process listens for invalidations.
+        try:
+            self._store.bus.ensure_started()
+        except Exception as e:
+            logger.warning(f"Cache invalidation subscriber unavailable, bypassing L1: {e}")
+            return False
+        return True
+
+    def _invalidate(self, keys):
+        for key in keys:
+            self._store.discard(key)
+        if self._store.bus is not None:
+            self._store.bus.publish(keys=keys)
+
+    def get(self, key, default=None, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        if not self._l1_available():
+            return self.l2.get(key, default, version=version)
+        value = self._store.get(full_key)
+        if value is not _MISSING:
+            return value
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._store.count('l2_misses')
+            return default
+        self._store.count('l2_hits')
+        self._store.set(full_key, value, self._l1_ttl_from_l2(key, version))
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        self.l2.set(key, value, timeout=self._l2_timeout(timeout), version=version)
+        self._invalidate([full_key])
+        self._store.set(full_key, value, self._l1_ttl(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        added = self.l2.add(key, value, timeout=self._l2_timeout(timeout), version=version)
+        if added:
+            self._invalidate([full_key])
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        touched = self.l2.touch(key, timeout=self._l2_timeout(timeout), version=version)
+        self._invalidate([full_key])
+        return touched
+
+    def delete(self, key, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        deleted = self.l2.delete(key, version=version)
+        self._invalidate([full_key])
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        full_keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        self.l2.delete_many(keys, version=version)
+        self._invalidate(full_keys)
+
+    def has_key(self, key, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        if self._l1_available() and self._store.get(full_key) is not _MISSING:
+            return True
+        return self.l2.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        full_key = self.make_and_validate_key(key, version=version)
+        value = self.l2.incr(key, delta, version=version)
+        self._invalidate([full_key])
+        return value
+
+    def clear(self):
+        self.l2.clear()
+        self._store.clear()
+        if self._store.bus is not None:
+            self._store.bus.publish(clear=True)
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+    def _l2_timeout(self, timeout):
+        # Resolve DEFAULT_TIMEOUT against this backend's TIMEOUT, not the L2 alias'.
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def stats(self):
+        """Per-process hit/miss counters for both tiers."""
+        return self._store.snapshot()
@@ -0,0 +1,53 @@
+"""
+Conditional GET for detail views.
+
+Validators are computed from `updated_at` values (plus versions of embedded
+related data) before any serialization, so a matching If-None-Match or
+If-Modified-Since is answered with an empty 304.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    return quote_etag(hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest())
+
+
+class ConditionalRetrieveMixin:
+    """
+    Replaces retrieve() with a validator check followed by get_retrieve_data(),
+    which serializes with get_serializer() unless overridden.
+
+    get_validators(instance) returns (etag_parts, last_modified). Views whose
+    representation embeds data without its own timestamp (stored counters,
+    deleted children) return last_modified=None so only the ETag is used,
+    since If-Modified-Since alone could not notice those changes.
+    """
+
+    def get_validators(self, instance):
+        return (instance.pk, instance.updated_at), instance.updated_at
+
+    def get_retrieve_data(self, instance):
+        return self.get_serializer(instance).data
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag_parts, last_modified = self.get_validators(instance)
+        etag = make_etag(*etag_parts)
+        # HTTP dates have whole-second precision.
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = Response({'success': True, 'data': self.get_retrieve_data(instance)})
+
+        response.headers['ETag'] = etag
+        if timestamp is not None:
+            response.headers['Last-Modified'] = http_date(timestamp)
+        # Per-user data: clients may keep it but must revalidate every time.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
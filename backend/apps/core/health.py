@@ -0,0 +1,154 @@
+"""
+Background dependency probes for the health endpoints.
+
+Each process runs the probes on a daemon thread every HEALTH_CHECK_INTERVAL
+seconds and keeps the latest results in memory, so health requests never
+touch the database, cache or broker themselves. The Celery probe is a
+broker broadcast; it runs in at most one process per interval (guarded by a
+lock in the shared cache) and its result is shared through that cache.
+"""
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Dependencies the instance cannot serve traffic without.
+CRITICAL_SERVICES = ('database', 'cache')
+
+_CELERY_RESULT_KEY = 'health:celery'
+_CELERY_LOCK_KEY = 'health:celery:lock'
+
+
+def check_database():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    return {'type': connection.vendor}
+
+
+def check_cache():
+    cache.set('health_check', 'ok', 10)
+    if cache.get('health_check') != 'ok':
+        raise RuntimeError('cache read-back mismatch')
+    details = {}
+    if hasattr(cache, 'stats'):
+        details['stats'] = cache.stats()
+    return details
+
+
+def check_celery():
+    shared = caches['shared']
+    interval = settings.HEALTH_CHECK_INTERVAL
+    if not shared.add(_CELERY_LOCK_KEY, os.getpid(), interval):
+        result = shared.get(_CELERY_RESULT_KEY)
+        if result is not None:
+            if 'error' in result:
+                raise RuntimeError(result['error'])
+            return result
+    from config.celery import app as celery_app
+    try:
+        with celery_app.connection_for_write() as conn:
+            # Fail fast instead of the broker's default reconnect backoff.
+            conn.ensure_connection(max_retries=1)
+            replies = celery_app.control.inspect(timeout=1.0, connection=conn).ping()
+        if not replies:
+            raise RuntimeError('no workers replied')
+    except Exception as e:
+        shared.set(_CELERY_RESULT_KEY, {'error': str(e)}, interval * 3)
+        raise
+    result = {'workers': len(replies)}
+    shared.set(_CELERY_RESULT_KEY, result, interval * 3)
+    return result
+
+
+PROBES = {
+    'database': check_database,
+    'cache': check_cache,
+    'celery': check_celery,
+}
+
+
+class HealthMonitor:
+    """Per-process snapshot of dependency health, refreshed in the background."""
+
+    def __init__(self, probes):
+        self.probes = probes
+        self._results = {}
+        self._checked_at = {}
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self):
+        return settings.HEALTH_CHECK_INTERVAL
+
+    def run_probes(self):
+        for name, probe in self.probes.items():
+            close_old_connections()
+            start = time.perf_counter()
+            try:
+                entry = {'status': 'up', **probe()}
+            except Exception as e:
+                entry = {'status': 'down', 'error': str(e)}
+            entry['latency_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            entry['last_checked'] = timezone.now().isoformat()
+            # Published per probe so a slow one does not hold back the others.
+            self._results[name] = entry
+            self._checked_at[name] = time.time()
+        close_old_connections()
+
+    def _loop(self):
+        while True:
+            try:
+                self.run_probes()
+            except Exception as e:
+                logger.warning(f"Health probe loop error: {e}")
+            time.sleep(self.interval)
+
+    def ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._results, self._checked_at = {}, {}
+            threading.Thread(target=self._loop, name='health-monitor', daemon=True).start()
+            self._pid = os.getpid()
+
+    def snapshot(self):
+        """
+        Latest results with an overall status. Not ready until every critical
+        service has been probed, or when one is down or its result is older
+        than three intervals.
+        """
+        self.ensure_started()
+        services = dict(self._results)
+        now = time.time()
+        ages = [now - self._checked_at[name] for name in CRITICAL_SERVICES if name in self._checked_at]
+        pending = len(ages) < len(CRITICAL_SERVICES)
+        stale = any(age > self.interval * 3 for age in ages)
+        critical_down = any(
+            services[name]['status'] != 'up' for name in CRITICAL_SERVICES if name in services
+        )
+        ready = not (pending or stale or critical_down)
+        if not ready:
+            overall = 'starting' if pending and not critical_down else 'unhealthy'
+        elif any(s['status'] != 'up' for s in services.values()):
+            overall = 'degraded'
+        else:
+            overall = 'healthy'
+        return {
+            'status': overall,
+            'ready': ready,
+            'snapshot_age_seconds': round(max(ages), 2) if ages else None,
+            'services': services,
+        }
+
+
+monitor = HealthMonitor(PROBES)
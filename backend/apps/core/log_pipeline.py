@@ -0,0 +1,162 @@
+"""
+Non-blocking logging pipeline.
+
+Request threads only append records to an in-memory queue (QueuedHandler);
+a per-process listener thread serializes them to JSON lines and writes them
+to stdout or a file. A full queue drops records instead of blocking.
+RequestSampleFilter thins out fast successful request logs while always
+keeping slow or failed ones.
+
+    'handlers': {
+        'queue': {
+            'class': 'apps.core.log_pipeline.QueuedHandler',
+            'output': 'stdout',          # or 'file' + 'filename'
+            'queue_size': 10000,
+            'filters': ['request_sampling'],
+        },
+    },
+    'filters': {
+        'request_sampling': {
+            '()': 'apps.core.log_pipeline.RequestSampleFilter',
+            'sample_rate': 0.1,
+            'slow_ms': 1000,
+        },
+    },
+
+File output uses WatchedFileHandler: every gunicorn worker appends to the
+same file and rotation is left to logrotate, so workers never race on
+renaming it.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+
+# LogRecord attributes that are not user-supplied `extra` fields.
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message plus any `extra` fields."""
+
+    def format(self, record):
+        payload = {
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'process': record.process,
+            'thread': record.thread,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_text:
+            payload['exc_info'] = record.exc_text
+        if record.stack_info:
+            payload['stack_info'] = record.stack_info
+        return json.dumps(payload, default=str)
+
+
+class RequestSampleFilter(logging.Filter):
+    """
+    Keeps a `sample_rate` fraction of request log records (those carrying
+    `status_code` and `duration_ms`) that are successful and faster than
+    `slow_ms`. Failed, slow and non-request records always pass.
+    """
+
+    def __init__(self, sample_rate=1.0, slow_ms=1000, name=''):
+        super().__init__(name)
+        self.sample_rate = float(sample_rate)
+        self.slow_ms = slow_ms
+
+    def filter(self, record):
+        if self.sample_rate >= 1 or record.levelno >= logging.WARNING:
+            return True
+        status_code = getattr(record, 'status_code', None)
+        duration_ms = getattr(record, 'duration_ms', None)
+        if status_code is None or duration_ms is None:
+            return True
+        if status_code >= 400 or duration_ms >= self.slow_ms:
+            return True
+        return random.random() < self.sample_rate
+
+
+class QueuedHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler whose listener thread is owned by the handler and started
+    lazily in each process, so it survives gunicorn's fork.
+    """
+
+    def __init__(self, output='stdout', filename=None, queue_size=10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.output = output
+        self.filename = filename
+        self.dropped = 0
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _build_target(self):
+        if self.output == 'file':
+            target = logging.handlers.WatchedFileHandler(self.filename, delay=True)
+        else:
+            target = logging.StreamHandler(sys.stdout)
+        target.setFormatter(JSONFormatter())
+        return target
+
+    def _ensure_listener(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # A queue inherited from the parent may hold records it already wrote.
+            self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self._listener = logging.handlers.QueueListener(
+                self.queue, self._build_target(), respect_handler_level=True
+            )
+            self._listener.start()
+            self._pid = os.getpid()
+            atexit.register(self._stop_listener)
+
+    def _stop_listener(self):
+        # Drains whatever is still queued before the process exits.
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+        self._listener = None
+        self._pid = None
+
+    def prepare(self, record):
+        # Message formatting and serialization happen on the listener thread;
+        # only tracebacks are rendered here since they reference live frames.
+        # Log args are therefore expected to be immutable values.
+        record = logging.makeLogRecord(record.__dict__)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def emit(self, record):
+        try:
+            self._ensure_listener()
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_listener()
+        super().close()
@@ -0,0 +1,82 @@
+"""
+EXPLAIN every query behind the /api/v1/ GET endpoints and propose indexes.
+
+    python manage.py audit_query_plans
+    python manage.py audit_query_plans --only courses --min-rows 5000
+    python manage.py audit_query_plans --write-migrations
+
+Run against the seeded benchmark tenant (seed_benchmark_data), ideally on
+PostgreSQL: other backends report scans and sorts without proposals.
+Generated migrations must be mirrored in the model's Meta.indexes (the
+command prints the line to add), otherwise makemigrations will drop them.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.core.query_audit import audit, write_migrations
+
+_KIND_LABELS = {
+    'seq_scan': 'SEQ SCAN',
+    'sort_spill': 'SORT SPILL',
+    'sort': 'SORT',
+    'covered': 'INDEXED',
+}
+
+
+class Command(BaseCommand):
+    help = 'Run EXPLAIN on the queries of every API GET endpoint and propose missing indexes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--roles', default='student,teacher',
+                            help='Comma-separated roles to authenticate as.')
+        parser.add_argument('--only', default=None, help='Regex filter on the route.')
+        parser.add_argument('--min-rows', type=int, default=1000,
+                            help='Ignore scans and sorts over fewer rows than this.')
+        parser.add_argument('--write-migrations', action='store_true',
+                            help='Write AddIndex migrations for the proposed indexes.')
+
+    def handle(self, *args, **options):
+        roles = tuple(r.strip() for r in options['roles'].split(',') if r.strip())
+        self.stdout.write(f'Explaining endpoint queries on {connection.vendor}...')
+        try:
+            findings, explained = audit(roles=roles, only=options['only'], min_rows=options['min_rows'])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+        self.stdout.write(f'{explained} distinct queries explained, {len(findings)} finding(s).')
+
+        proposals = []
+        for finding in sorted(findings, key=lambda f: (f.kind == 'covered', f.table, f.kind)):
+            label = _KIND_LABELS[finding.kind]
+            style = self.style.SUCCESS if finding.kind == 'covered' else self.style.WARNING
+            self.stdout.write(style(f'  {label:<10} {finding.table:<24} {finding.detail[:140]}'))
+            for endpoint in sorted(finding.endpoints)[:5]:
+                self.stdout.write(f'             {endpoint}')
+            if len(finding.endpoints) > 5:
+                self.stdout.write(f'             ... and {len(finding.endpoints) - 5} more')
+            if finding.proposal is not None:
+                verb = 'served by an existing index' if finding.kind == 'covered' else 'proposed'
+                self.stdout.write(f'             {verb}: {finding.proposal.describe()}')
+                if finding.kind != 'covered' and finding.proposal not in proposals:
+                    proposals.append(finding.proposal)
+
+        if not proposals:
+            if connection.vendor != 'postgresql':
+                self.stdout.write('Index proposals need EXPLAIN ANALYZE plans from PostgreSQL.')
+            self.stdout.write(self.style.SUCCESS('No index proposals.'))
+            return
+
+        self.stdout.write('\nProposed indexes (add to Meta.indexes):')
+        for proposal in proposals:
+            index = proposal.as_index()
+            condition = ''
+            if proposal.condition:
+                terms = ', '.join(f'{name}={value!r}' for name, value in proposal.condition)
+                condition = f', condition=models.Q({terms})'
+            self.stdout.write(
+                f'  {proposal.model._meta.label}: '
+                f'models.Index(fields={list(index.fields)!r}{condition}, name={index.name!r}),'
+            )
+
+        if options['write_migrations']:
+            for path in write_migrations(proposals):
+                self.stdout.write(self.style.SUCCESS(f'Wrote {path}'))
@@ -0,0 +1,54 @@
+"""
+Bulk-import courses with their lessons, quizzes and questions.
+
+    python manage.py import_courses courses.ndjson --teacher teacher@example.com
+    python manage.py import_courses export.zip --teacher teacher@example.com --dry-run
+
+The file holds one course per line (see apps.courses.importer), or is a ZIP
+of such files. Invalid courses are skipped and reported by line.
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.courses.importer import CourseImporter, iter_records
+
+
+class Command(BaseCommand):
+    help = 'Validate and bulk-insert courses, lessons, quizzes and questions from an NDJSON or ZIP file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='NDJSON file, or ZIP of .ndjson/.jsonl files.')
+        parser.add_argument('--teacher', required=True, help='Email of the teacher who will own the courses.')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Rows per bulk_create batch (default COURSE_IMPORT_BATCH_SIZE).')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Validate and report without saving anything.')
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            teacher = User.objects.get(email=options['teacher'], role='teacher')
+        except User.DoesNotExist:
+            raise CommandError(f"No teacher with email {options['teacher']}.")
+
+        importer = CourseImporter(teacher, batch_size=options['batch_size'], dry_run=options['dry_run'])
+        try:
+            with open(options['path'], 'rb') as fh:
+                result = importer.run(iter_records(fh, options['path']))
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in result.errors:
+            title = f" ({error['title']})" if error['title'] else ''
+            self.stdout.write(self.style.WARNING(f"  {error['record']}{title}: {error['errors']}"))
+        if result.rejected > len(result.errors):
+            self.stdout.write(f'  ... and {result.rejected - len(result.errors)} more rejected record(s)')
+
+        summary = (
+            f'{result.courses} course(s), {result.lessons} lesson(s), '
+            f'{result.quizzes} quiz(zes), {result.questions} question(s)'
+        )
+        if options['dry_run']:
+            self.stdout.write(f'Dry run: {summary} valid, {result.rejected} rejected. Nothing saved.')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Imported {summary}; {result.rejected} rejected.'))
@@ -0,0 +1,36 @@
+"""
+Recompute the denormalized counters stored on Course and report drift.
+
+    python manage.py reconcile_course_counters            # report and repair
+    python manage.py reconcile_course_counters --dry-run  # report only
+"""
+from django.core.management.base import BaseCommand
+
+from apps.courses.models import Course
+
+
+class Command(BaseCommand):
+    help = 'Recompute Course counter columns from source rows in set-based SQL and report drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report drift without updating any rows.')
+
+    def handle(self, *args, **options):
+        courses = Course.objects.all_with_deleted()
+        drift = courses.counter_drift()
+        drifted = {field: n for field, n in drift.items() if n}
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('Course counters are in sync.'))
+            return
+
+        for field, n in drifted.items():
+            self.stdout.write(self.style.WARNING(f'{field}: {n} course(s) drifted'))
+
+        if options['dry_run']:
+            self.stdout.write('Dry run: no rows updated.')
+            return
+
+        updated = courses.reconcile_counters()
+        self.stdout.write(self.style.SUCCESS(f'Recomputed counters for {updated} course(s).'))
@@ -0,0 +1,82 @@
+"""
+Measure p50/p95 latency and query counts for every GET endpoint under /api/v1/.
+
+    python manage.py run_benchmarks --iterations 30 --output benchmarks/latest.json
+    python manage.py run_benchmarks --update-baseline
+
+Exits non-zero when any endpoint regresses against the stored baseline.
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.core.benchmarks import compare_to_baseline, read_results, run_suite, write_results
+
+DEFAULT_DIR = Path(settings.BASE_DIR) / 'benchmarks'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark /api/v1/ GET endpoints against the seeded tenant and compare with a baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--roles', default='student,teacher',
+                            help='Comma-separated roles to authenticate as.')
+        parser.add_argument('--only', default=None, help='Regex filter on the route.')
+        parser.add_argument('--output', default=str(DEFAULT_DIR / 'latest.json'))
+        parser.add_argument('--baseline', default=str(DEFAULT_DIR / 'baseline.json'))
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Allowed p95 growth as a fraction of the baseline (0.2 = +20%%).')
+        parser.add_argument('--query-tolerance', type=int, default=0,
+                            help='Allowed growth in query count per request.')
+        parser.add_argument('--update-baseline', action='store_true',
+                            help='Write the results as the new baseline instead of comparing.')
+
+    def handle(self, *args, **options):
+        roles = tuple(r.strip() for r in options['roles'].split(',') if r.strip())
+        self.stdout.write(f"Benchmarking with {options['iterations']} iterations per endpoint...")
+        try:
+            results = run_suite(
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                roles=roles,
+                only=options['only'],
+                stdout=self.stdout,
+            )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        meta = {
+            'timestamp': timezone.now().isoformat(),
+            'iterations': options['iterations'],
+            'database': settings.DATABASES['default']['ENGINE'],
+        }
+        output = Path(options['output'])
+        write_results(output, results, meta)
+        self.stdout.write(f'Results written to {output}')
+
+        baseline_path = Path(options['baseline'])
+        if options['update_baseline']:
+            write_results(baseline_path, results, meta)
+            self.stdout.write(self.style.SUCCESS(f'Baseline updated: {baseline_path}'))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(
+                f'No baseline at {baseline_path}; run with --update-baseline to create one.'
+            ))
+            return
+
+        regressions = compare_to_baseline(
+            results, read_results(baseline_path),
+            tolerance=options['tolerance'],
+            query_tolerance=options['query_tolerance'],
+        )
+        if regressions:
+            for line in regressions:
+                self.stderr.write(f'  REGRESSION {line}')
+            raise CommandError(f'{len(regressions)} benchmark regression(s) against {baseline_path}')
+        self.stdout.write(self.style.SUCCESS('No regressions against baseline.'))
@@ -0,0 +1,50 @@
+"""
+Seed a synthetic tenant for endpoint benchmarks.
+
+    python manage.py seed_benchmark_data --students 10000 --teachers 20
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.benchmarks import flush_tenant, seed_tenant
+
+
+class Command(BaseCommand):
+    help = 'Seed a synthetic tenant (teachers, courses, lessons, quizzes, students, progress) for benchmarks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teachers', type=int, default=10)
+        parser.add_argument('--courses-per-teacher', type=int, default=5)
+        parser.add_argument('--lessons-per-course', type=int, default=20)
+        parser.add_argument('--quizzes-per-course', type=int, default=3)
+        parser.add_argument('--questions-per-quiz', type=int, default=10)
+        parser.add_argument('--students', type=int, default=10000)
+        parser.add_argument('--enrollments-per-student', type=int, default=3)
+        parser.add_argument('--completion-rate', type=float, default=0.5,
+                            help='Average fraction of lessons completed per enrollment.')
+        parser.add_argument('--attempts-per-enrollment', type=int, default=1)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--flush', action='store_true',
+                            help='Delete the existing benchmark tenant before seeding.')
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            deleted = flush_tenant()
+            self.stdout.write(f'Flushed {deleted} benchmark rows.')
+
+        self.stdout.write('Seeding benchmark tenant...')
+        summary = seed_tenant(
+            teachers=options['teachers'],
+            courses_per_teacher=options['courses_per_teacher'],
+            lessons_per_course=options['lessons_per_course'],
+            quizzes_per_course=options['quizzes_per_course'],
+            questions_per_quiz=options['questions_per_quiz'],
+            students=options['students'],
+            enrollments_per_student=options['enrollments_per_student'],
+            completion_rate=options['completion_rate'],
+            attempts_per_enrollment=options['attempts_per_enrollment'],
+            seed=options['seed'],
+            stdout=self.stdout,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            'Benchmark tenant ready: ' + ', '.join(f'{k}={v}' for k, v in summary.items())
+        ))
@@ -2,34 +2,144 @@
 Custom middleware for request logging, performance monitoring.
 """
 import logging
+import re
 import time
+from collections import Counter
 
+from django.conf import settings
+from django.db import connection
 from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger(__name__)
 
+# Collapses literal values and placeholder lists so near-identical statements
+# (e.g. the same lookup for a different id) share one fingerprint.
+_IN_LIST_RE = re.compile(r'\bIN\s*\((?:\s*%s\s*,?)+\)', re.IGNORECASE)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def fingerprint_sql(sql):
+    """Normalize a SQL statement so repeated lookups compare equal."""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    return _WHITESPACE_RE.sub(' ', sql).strip()
+
+
+class QueryCollector:
+    """
+    Database execute wrapper that accounts for every statement run on the
+    connection while installed: count, total time, slowest statement and
+    a per-fingerprint tally used for N+1 detection.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_sql = ''
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms >= self.slowest_ms:
+                self.slowest_ms = elapsed_ms
+                self.slowest_sql = sql
+            self.fingerprints[fingerprint_sql(sql)] += 1
+
+    def repeated(self, threshold):
+        """Return [(fingerprint, count)] for statements run at least `threshold` times."""
+        return [(fp, n) for fp, n in self.fingerprints.most_common() if n >= threshold]
+
 
 class RequestLoggingMiddleware(MiddlewareMixin):
-    """Logs every API request with method, path, status, and duration."""
+    """
+    Logs every API request with method, path, status, duration, SQL query
+    accounting and response size. Flags repeated near-identical statements
+    (N+1 patterns) with a warning.
+    """
 
     def process_request(self, request):
         request._start_time = time.time()
+        collector = QueryCollector()
+        connection.execute_wrappers.append(collector)
+        request._query_collector = collector
 
     def process_response(self, request, response):
         duration = time.time() - getattr(request, '_start_time', time.time())
         duration_ms = round(duration * 1000, 2)
 
+        collector = getattr(request, '_query_collector', None)
+        if collector is not None and collector in connection.execute_wrappers:
+            connection.execute_wrappers.remove(collector)
+
         # Only log API requests
         if request.path.startswith('/api/'):
             user = getattr(request, 'user', None)
             user_id = user.id if user and user.is_authenticated else 'anonymous'
+            response_size = None if response.streaming else len(response.content)
+            db_fields = self._db_fields(collector)
+            # Lazy %-formatting: the message is rendered off the request
+            # thread, and not at all for sampled-out records.
             logger.info(
-                f"{request.method} {request.path} | "
-                f"Status: {response.status_code} | "
-                f"Duration: {duration_ms}ms | "
-                f"User: {user_id}"
+                "%s %s | Status: %s | Duration: %sms | Queries: %s (%sms) | Size: %s | User: %s",
+                request.method, request.path, response.status_code, duration_ms,
+                db_fields['db_query_count'], db_fields['db_time_ms'], response_size, user_id,
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'status_code': response.status_code,
+                    'duration_ms': duration_ms,
+                    'response_size': response_size,
+                    'user_id': str(user_id),
+                    **db_fields,
+                },
             )
+            if collector is not None:
+                self._flag_repeated_queries(request, collector)
 
         # Add performance headers
         response['X-Request-Duration-Ms'] = str(duration_ms)
+        if collector is not None:
+            response['X-DB-Query-Count'] = str(collector.count)
+            response['X-DB-Time-Ms'] = str(round(collector.total_ms, 2))
         return response
+
+    @staticmethod
+    def _db_fields(collector):
+        if collector is None:
+            return {'db_query_count': 0, 'db_time_ms': 0.0, 'db_slowest_ms': 0.0, 'db_slowest_sql': ''}
+        return {
+            'db_query_count': collector.count,
+            'db_time_ms': round(collector.total_ms, 2),
+            'db_slowest_ms': round(collector.slowest_ms, 2),
+            'db_slowest_sql': collector.slowest_sql[:500],
+        }
+
+    @staticmethod
+    def _flag_repeated_queries(request, collector):
+        threshold = getattr(settings, 'N_PLUS_ONE_THRESHOLD', 5)
+        if not threshold:
+            return
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else request.path
+        for fingerprint, count in collector.repeated(threshold):
+            logger.warning(
+                "Possible N+1 in %s: statement ran %s times | %s",
+                view_name, count, fingerprint[:300],
+                extra={
+                    'view': view_name,
+                    'path': request.path,
+                    'repeat_count': count,
+                    'sql_fingerprint': fingerprint[:500],
+                },
+            )
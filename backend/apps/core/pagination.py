@@ -1,26 +1,159 @@
 """
 Pagination classes for consistent API responses.
 """
-from rest_framework.pagination import PageNumberPagination
+import base64
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Count strategies
+# Each takes a queryset and returns (count, is_approximate).
+# ---------------------------------------------------------------------------
+
+def exact_count(queryset):
+    """Plain COUNT(*)."""
+    return queryset.count(), False
+
+
+def _queryset_fingerprint(queryset):
+    sql, params = queryset.order_by().query.sql_with_params()
+    raw = f'{queryset.db}:{sql}:{params!r}'
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def cached_count(queryset):
+    """Exact COUNT(*) cached per queryset fingerprint for PAGINATION_COUNT_CACHE_TTL seconds."""
+    try:
+        key = f'pagination:count:{_queryset_fingerprint(queryset)}'
+    except Exception:
+        return exact_count(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 60))
+    return count, False
+
+
+def _planner_estimate(queryset):
+    """Row estimate from the PostgreSQL planner, or None when unavailable."""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimated_count(queryset):
+    """
+    Planner-estimated count when the estimate is at least
+    PAGINATION_ESTIMATE_THRESHOLD rows; below that (or off PostgreSQL) fall
+    back to a cached exact count, which is cheap for small result sets.
+    """
+    try:
+        estimate = _planner_estimate(queryset)
+    except Exception as e:
+        logger.warning(f"Count estimate failed, using exact count: {e}")
+        estimate = None
+    if estimate is not None and estimate >= getattr(settings, 'PAGINATION_ESTIMATE_THRESHOLD', 1000):
+        return estimate, True
+    return cached_count(queryset)
+
+
+COUNT_STRATEGIES = {
+    'exact': exact_count,
+    'cached': cached_count,
+    'estimated': estimated_count,
+}
+
+
+class CountStrategyPaginator(Paginator):
+    """Django paginator whose `count` is computed by a pluggable strategy."""
+    count_strategy = 'exact'
+    count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        strategy = COUNT_STRATEGIES[self.count_strategy]
+        if not hasattr(self.object_list, 'query'):
+            return len(self.object_list)
+        count, self.count_is_approximate = strategy(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        # An estimate may undercount; let clients page past the estimated end.
+        if not (self.count and self.count_is_approximate):
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise InvalidPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
 
 
 class StandardPagination(PageNumberPagination):
-    """Standard pagination with configurable page size."""
+    """
+    Standard pagination with configurable page size.
+    `count_strategy` selects how the total is computed ('exact', 'cached' or
+    'estimated'); None uses the PAGINATION_COUNT_STRATEGY setting.
+    """
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    count_strategy = None
+
+    def django_paginator_class(self, object_list, per_page, *args, **kwargs):
+        paginator = CountStrategyPaginator(object_list, per_page, *args, **kwargs)
+        paginator.count_strategy = self.count_strategy or getattr(settings, 'PAGINATION_COUNT_STRATEGY', 'exact')
+        return paginator
 
     def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        count = paginator.count
+        page_size = self.get_page_size(self.request)
+        if paginator.count_is_approximate:
+            has_next = len(self.page.object_list) >= page_size
+        else:
+            has_next = self.page.has_next()
         return Response({
             'success': True,
             'data': data,
             'pagination': {
-                'count': self.page.paginator.count,
+                'count': count,
+                'count_is_approximate': paginator.count_is_approximate,
                 'page': self.page.number,
-                'page_size': self.get_page_size(self.request),
-                'total_pages': self.page.paginator.num_pages,
-                'has_next': self.page.has_next(),
+                'page_size': page_size,
+                'total_pages': paginator.num_pages,
+                'has_next': has_next,
                 'has_previous': self.page.has_previous(),
             }
         })
@@ -32,3 +165,108 @@ class SmallPagination(StandardPagination):
 
 class LargePagination(StandardPagination):
     page_size = 50
+
+
+class EstimatedCountPagination(StandardPagination):
+    """For large filtered catalogs: planner-estimated totals above the threshold."""
+    count_strategy = 'estimated'
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination ordered on (created_at, id), newest first.
+    Pages are fetched with a `WHERE (created_at, id) < cursor` seek instead of
+    COUNT(*) + OFFSET, so deep pages cost the same as the first one.
+    Cursors are opaque base64 tokens; clients follow `next_cursor`/`previous_cursor`.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+
+        if cursor is not None:
+            created_at, pk = cursor['created_at'], cursor['id']
+            if reverse:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+            else:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+        ordering = ('created_at', 'id') if reverse else ('-created_at', '-id')
+        rows = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            created_at = parse_datetime(payload['c'])
+            if created_at is None:
+                raise ValueError
+            return {'created_at': created_at, 'id': payload['i'], 'reverse': bool(payload.get('r'))}
+        except (ValueError, KeyError, TypeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse=False):
+        payload = {'c': obj.created_at.isoformat(), 'i': str(obj.pk), 'r': int(reverse)}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+    def get_next_cursor(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_cursor(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def _link(self, cursor):
+        url = self.request.build_absolute_uri()
+        if cursor is None:
+            return None
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        next_cursor = self.get_next_cursor()
+        previous_cursor = self.get_previous_cursor()
+        return Response({
+            'success': True,
+            'data': data,
+            'pagination': {
+                'page_size': self.page_size,
+                'has_next': next_cursor is not None,
+                'has_previous': previous_cursor is not None,
+                'next_cursor': next_cursor,
+                'previous_cursor': previous_cursor,
+                'next': self._link(next_cursor),
+                'previous': self._link(previous_cursor),
+            }
+        })
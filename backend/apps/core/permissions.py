@@ -3,6 +3,15 @@ Custom permissions for role-based access control.
 """
 from rest_framework.permissions import BasePermission
 
+from .access import get_course_access
+
+
+def _course_id(obj):
+    """Course primary key for a course or any object with a `course` FK."""
+    if hasattr(obj, 'course_id'):
+        return obj.course_id
+    return obj.pk
+
 
 class IsTeacher(BasePermission):
     """Only allows access to users with role='teacher'."""
@@ -57,10 +66,11 @@ class IsCourseTeacher(BasePermission):
     message = 'Only the course teacher can perform this action.'
 
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, 'course'):
-            return obj.course.teacher == request.user
-        if hasattr(obj, 'teacher'):
-            return obj.teacher == request.user
+        course_id = getattr(obj, 'course_id', None)
+        if course_id is not None:
+            return course_id in get_course_access(request.user).owned
+        if hasattr(obj, 'teacher_id'):
+            return obj.teacher_id == request.user.id
         return False
 
 
@@ -69,10 +79,14 @@ class IsEnrolledStudent(BasePermission):
     message = 'You must be enrolled in this course to access this content.'
 
     def has_object_permission(self, request, view, obj):
-        from apps.enrollments.models import Enrollment
-        course = getattr(obj, 'course', obj)
-        return Enrollment.objects.filter(
-            student=request.user,
-            course=course,
-            is_active=True
-        ).exists()
+        return _course_id(obj) in get_course_access(request.user).enrolled
+
+
+class IsCourseMember(BasePermission):
+    """Enrolled students and the owning teacher can access course content."""
+    message = 'You must be enrolled in this course to access this content.'
+
+    def has_object_permission(self, request, view, obj):
+        if request.user.is_staff:
+            return True
+        return get_course_access(request.user).can_view(_course_id(obj))
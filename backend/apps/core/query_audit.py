@@ -0,0 +1,315 @@
+"""
+Query-plan audit for every /api/v1/ GET endpoint.
+
+Each endpoint discovered by the benchmark harness is requested once per role
+against the seeded tenant, so its view's get_queryset() runs with real
+filters, pagination and serializer fields. Every SELECT it issues is then
+explained:
+
+- PostgreSQL: EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON). The plan is checked
+  for sequential scans over large tables and sorts that spill to disk, and
+  index proposals are derived from the scan filter and sort keys. Constant
+  boolean predicates (is_deleted = false from SoftDeleteManager, for
+  example) become partial-index conditions.
+- Other backends: EXPLAIN QUERY PLAN, reporting full scans and temporary
+  sort b-trees only, without proposals.
+
+Caches are swapped for DummyCache during the run so cached responses do not
+hide their queries.
+"""
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from .benchmarks import _auth_header, discover_endpoints, load_samples, resolve_route
+
+_DUMMY_CACHE = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+_SORT_KEY_RE = re.compile(r'^(?:\w+\.)?"?(\w+)"?(\s+DESC)?(?:\s+NULLS (?:FIRST|LAST))?$')
+_EQ_RE = re.compile(r'\(*(?:\w+\.)?"?(\w+)"?\)?(?:::[\w ]+)?\s+=\s+')
+
+
+@dataclass(frozen=True)
+class IndexProposal:
+    model: type
+    fields: tuple
+    condition: tuple = ()  # ((field name, bool), ...)
+
+    def as_index(self):
+        condition = models.Q(**dict(self.condition)) if self.condition else None
+        index = models.Index(fields=list(self.fields), condition=condition, name='placeholder')
+        # Index.set_name_with_model() only hashes the columns; add the condition.
+        digest = hashlib.md5(repr((self.fields, self.condition)).encode()).hexdigest()[:6]
+        prefix = '_'.join(f.lstrip('-') for f in self.fields)[:14]
+        index.name = f'{self.model._meta.db_table[:8]}_{prefix}_{digest}'.lower()[:30]
+        return index
+
+    def describe(self):
+        condition = ', '.join(f'{name}={value}' for name, value in self.condition)
+        text = f"{self.model.__name__}({', '.join(self.fields)})"
+        return f'{text} WHERE {condition}' if condition else text
+
+
+@dataclass
+class Finding:
+    kind: str            # 'seq_scan', 'sort_spill', 'sort', 'covered'
+    table: str
+    detail: str
+    proposal: IndexProposal = None
+    endpoints: set = field(default_factory=set)
+
+
+# ---------------------------------------------------------------------------
+# Query capture
+# ---------------------------------------------------------------------------
+
+def capture_queries(roles=('student', 'teacher'), only=None):
+    """Return {sql: set(endpoint keys)} for every SELECT issued by the GET endpoints."""
+    samples = load_samples()
+    if samples is None:
+        raise RuntimeError('No benchmark tenant found. Run `manage.py seed_benchmark_data` first.')
+
+    rest_framework = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_CLASSES': []}
+    queries = {}
+    with override_settings(
+        REST_FRAMEWORK=rest_framework,
+        ALLOWED_HOSTS=['*'],
+        CACHES={'default': _DUMMY_CACHE, 'shared': _DUMMY_CACHE},
+    ):
+        client = Client()
+        auth = {role: _auth_header(samples[role]) for role in roles}
+        for route, namespace, _view in discover_endpoints():
+            if only and not re.search(only, route):
+                continue
+            path = resolve_route(route, namespace, samples)
+            if path is None:
+                continue
+            for role in roles:
+                with CaptureQueriesContext(connection) as ctx:
+                    response = client.get(path, HTTP_AUTHORIZATION=auth[role], secure=True)
+                if response.status_code in (403, 405):
+                    continue
+                key = f'GET /{route} [{role}]'
+                for query in ctx.captured_queries:
+                    sql = query['sql']
+                    if sql.lstrip().upper().startswith('SELECT'):
+                        queries.setdefault(sql, set()).add(key)
+    return queries
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL plans
+# ---------------------------------------------------------------------------
+
+def explain_postgres(sql):
+    """EXPLAIN ANALYZE inside a rolled-back transaction; returns the root plan node."""
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}')
+            plan = cursor.fetchone()[0]
+        transaction.set_rollback(True)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']
+
+
+def _walk(node):
+    yield node
+    for child in node.get('Plans', ()):
+        yield from _walk(child)
+
+
+def _model_for_table(table):
+    for model in apps.get_models():
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def _columns(model):
+    return {f.column: f for f in model._meta.concrete_fields}
+
+
+def _filter_terms(model, filter_text):
+    """(equality field names, boolean condition) referenced by a plan Filter."""
+    columns = _columns(model)
+    equal = []
+    for column in _EQ_RE.findall(filter_text):
+        model_field = columns.get(column)
+        if model_field is not None and model_field.name not in equal:
+            equal.append(model_field.name)
+    condition = []
+    for column, model_field in columns.items():
+        if not isinstance(model_field, models.BooleanField) or model_field.name in equal:
+            continue
+        if re.search(rf'NOT \(?(?:\w+\.)?"?{column}\b', filter_text):
+            condition.append((model_field.name, False))
+        elif re.search(rf'(?<![\w."]){column}\b(?!"?\)?\s*(?:=|<>|IS\b))', filter_text):
+            condition.append((model_field.name, True))
+    return equal, tuple(sorted(condition))
+
+
+def _sort_fields(model, sort_keys):
+    """Leading plain-column sort keys as Index field names ('-created_at')."""
+    columns = _columns(model)
+    fields = []
+    for key in sort_keys:
+        match = _SORT_KEY_RE.match(key.strip())
+        model_field = columns.get(match.group(1)) if match else None
+        if model_field is None:
+            break
+        fields.append(f'-{model_field.name}' if match.group(2) else model_field.name)
+    return fields
+
+
+def _scan_proposal(scan, sort_keys=()):
+    model = _model_for_table(scan.get('Relation Name', ''))
+    if model is None:
+        return None
+    equal, condition = _filter_terms(model, scan.get('Filter', ''))
+    fields = equal + [f for f in _sort_fields(model, sort_keys) if f.lstrip('-') not in equal]
+    if not fields:
+        return None
+    return IndexProposal(model, tuple(fields), condition)
+
+
+def _scanned_rows(node):
+    loops = node.get('Actual Loops', 1) or 1
+    return (node.get('Actual Rows', 0) + node.get('Rows Removed by Filter', 0)) * loops
+
+
+def analyze_postgres_plan(root, min_rows):
+    findings = []
+    sorted_scans = set()
+    for node in _walk(root):
+        if node['Node Type'] != 'Sort':
+            continue
+        scan = next((n for n in _walk(node) if 'Relation Name' in n), None)
+        spilled = node.get('Sort Space Type') == 'Disk'
+        if scan is None or not (spilled or _scanned_rows(scan) >= min_rows):
+            continue
+        sorted_scans.add(id(scan))
+        detail = f"{node.get('Sort Method', 'sort')} on {', '.join(node.get('Sort Key', []))}"
+        if spilled:
+            detail += f" ({node.get('Sort Space Used', '?')}kB on disk)"
+        findings.append(Finding(
+            'sort_spill' if spilled else 'sort', scan['Relation Name'], detail,
+            _scan_proposal(scan, node.get('Sort Key', [])),
+        ))
+    for node in _walk(root):
+        if node['Node Type'] != 'Seq Scan' or id(node) in sorted_scans:
+            continue
+        rows = _scanned_rows(node)
+        if rows < min_rows:
+            continue
+        detail = f"{rows} rows read, {node.get('Rows Removed by Filter', 0)} removed by filter"
+        if node.get('Filter'):
+            detail += f": {node['Filter']}"
+        findings.append(Finding('seq_scan', node['Relation Name'], detail, _scan_proposal(node)))
+    return findings
+
+
+# ---------------------------------------------------------------------------
+# Other backends
+# ---------------------------------------------------------------------------
+
+def analyze_query_plan(sql):
+    """EXPLAIN QUERY PLAN (SQLite) findings: full table scans and temporary sorts."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        details = [row[-1] for row in cursor.fetchall()]
+    findings = []
+    for detail in details:
+        match = re.match(r'SCAN (\w+)', detail)
+        if match and 'INDEX' not in detail:
+            findings.append(Finding('seq_scan', match.group(1), detail))
+        elif 'TEMP B-TREE' in detail:
+            findings.append(Finding('sort', '', detail))
+    return findings
+
+
+# ---------------------------------------------------------------------------
+# Proposals
+# ---------------------------------------------------------------------------
+
+def _existing_index_fields(model):
+    existing = [(tuple(index.fields), index.condition) for index in model._meta.indexes]
+    existing += [(tuple(fields), None) for fields in model._meta.unique_together]
+    existing += [((f.name,), None) for f in model._meta.concrete_fields if f.db_index or f.unique]
+    return existing
+
+
+def is_covered(proposal):
+    """True when an existing index leads with the proposal's columns."""
+    wanted = tuple(f.lstrip('-') for f in proposal.fields)
+    wanted_condition = models.Q(**dict(proposal.condition))
+    for fields, condition in _existing_index_fields(proposal.model):
+        have = tuple(f.lstrip('-') for f in fields)
+        # A full index serves partial predicates too; a partial one only its own.
+        if have[:len(wanted)] == wanted and (condition is None or condition == wanted_condition):
+            return True
+    return False
+
+
+def audit(roles=('student', 'teacher'), only=None, min_rows=1000):
+    """Returns (findings, number of distinct queries explained)."""
+    queries = capture_queries(roles=roles, only=only)
+    merged = {}
+    for sql, endpoints in queries.items():
+        if connection.vendor == 'postgresql':
+            found = analyze_postgres_plan(explain_postgres(sql), min_rows)
+        else:
+            found = analyze_query_plan(sql)
+        for finding in found:
+            if finding.proposal is not None and is_covered(finding.proposal):
+                finding.kind = 'covered'
+            key = (finding.kind, finding.table, finding.proposal or finding.detail)
+            merged.setdefault(key, finding).endpoints.update(endpoints)
+    return list(merged.values()), len(queries)
+
+
+def write_migrations(proposals):
+    """Write one AddIndex migration per app; returns the written paths."""
+    from django.db import migrations
+    from django.db.migrations.loader import MigrationLoader
+    from django.db.migrations.writer import MigrationWriter
+
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    by_app = {}
+    for proposal in proposals:
+        by_app.setdefault(proposal.model._meta.app_label, []).append(proposal)
+
+    concurrent = connection.vendor == 'postgresql'
+    if concurrent:
+        from django.contrib.postgres.operations import AddIndexConcurrently as AddIndex
+    else:
+        AddIndex = migrations.AddIndex
+
+    paths = []
+    for app_label, app_proposals in by_app.items():
+        leaves = loader.graph.leaf_nodes(app_label)
+        number = max((int(name[:4]) for _, name in leaves if name[:4].isdigit()), default=0) + 1
+        migration = migrations.Migration(f'{number:04d}_query_audit_indexes', app_label)
+        migration.dependencies = leaves
+        migration.operations = [
+            AddIndex(model_name=p.model._meta.model_name, index=p.as_index()) for p in app_proposals
+        ]
+        writer = MigrationWriter(migration)
+        source = writer.as_string()
+        if concurrent:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+            source = source.replace(
+                'class Migration(migrations.Migration):\n',
+                'class Migration(migrations.Migration):\n    atomic = False\n',
+            )
+        with open(writer.path, 'w') as fh:
+            fh.write(source)
+        paths.append(writer.path)
+    return paths
@@ -0,0 +1,44 @@
+"""
+HTTP byte ranges (RFC 9110 section 14).
+
+Only single ranges are served; a multi-range request gets the full body,
+which the RFC allows.
+"""
+import re
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_byte_range(header, length):
+    """
+    (start, end) inclusive for a `Range` header over `length` bytes, or None
+    when the header is absent, malformed or multi-range (serve everything).
+    Raises RangeNotSatisfiable when the range starts past the end.
+    """
+    match = _RANGE_RE.match((header or '').replace(' ', ''))
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes.
+        suffix = int(last)
+        if suffix == 0:
+            raise RangeNotSatisfiable
+        return max(length - suffix, 0), length - 1
+    start = int(first)
+    end = min(int(last), length - 1) if last else length - 1
+    if start >= length:
+        raise RangeNotSatisfiable
+    if end < start:
+        return None
+    return start, end
+
+
+def content_range(start, end, length):
+    return f'bytes {start}-{end}/{length}'
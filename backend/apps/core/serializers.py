@@ -0,0 +1,146 @@
+"""
+Sparse fieldsets for API serializers.
+
+    ?fields=id,title        only these fields
+    ?exclude=description    every default field except these
+    ?expand=teacher         add fields listed in Meta.expandable_fields
+
+Names are comma-separated; unknown names are ignored. Only the top-level
+serializer (or the child of a top-level many=True list) is filtered.
+
+Views pass the serializer's optimize_queryset() their queryset so unselected
+columns are deferred with .only() and unused select_related joins dropped.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class FieldSelection:
+    """Parsed ?fields= / ?exclude= / ?expand= parameters."""
+
+    def __init__(self, fields=None, exclude=(), expand=()):
+        self.fields = set(fields) if fields is not None else None
+        self.exclude = set(exclude)
+        self.expand = set(expand)
+
+    @classmethod
+    def from_query_params(cls, params):
+        def names(key):
+            return {name.strip() for name in params.get(key, '').split(',') if name.strip()}
+
+        return cls(fields=names('fields') or None, exclude=names('exclude'), expand=names('expand'))
+
+    def allows(self, name):
+        requested = self.fields is None or name in self.fields or name in self.expand
+        return requested and name not in self.exclude
+
+
+ALL_FIELDS = FieldSelection()
+
+
+def _source_paths(model, field):
+    """
+    (only() paths, select_related joins) read by `field`, or None when its
+    source is not a chain of model fields (properties, SerializerMethodField).
+    """
+    if field.source == '*':
+        return None
+    nested = isinstance(field, serializers.BaseSerializer)
+    parts = []
+    for attr in field.source_attrs:
+        if model is None:
+            return None
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            # Reverse and many-to-many relations are prefetched separately.
+            return (), ()
+        parts.append(attr)
+        model = model_field.related_model if model_field.is_relation else None
+    path = '__'.join(parts)
+    return (path,), ((path,) if nested and model is not None else ())
+
+
+class SparseFieldsetMixin:
+    """
+    ModelSerializer mixin applying the request's FieldSelection.
+
+    Meta.expandable_fields maps a name to (field class, kwargs); the field is
+    only built on ?expand=name and replaces a default field of the same name.
+    Meta.field_dependencies maps fields whose source is not a model field path
+    to the lookup paths they read, e.g. {'student_count': ('active_student_count',)},
+    or to annotations the view adds to the queryset.
+    Meta.course_member_fields names fields (usually expandable course content)
+    that are only output for rows whose course_id the requesting user may view,
+    on endpoints open to every signed-in user.
+
+    The selection comes from context['field_selection'] if set, otherwise from
+    context['request'].
+    """
+
+    @property
+    def field_selection(self):
+        parent = self.parent
+        if parent is not None and not (isinstance(parent, serializers.ListSerializer) and parent.parent is None):
+            return ALL_FIELDS
+        if 'field_selection' in self.context:
+            return self.context['field_selection']
+        request = self.context.get('request')
+        if request is None:
+            return ALL_FIELDS
+        return FieldSelection.from_query_params(getattr(request, 'query_params', request.GET))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.field_selection
+        for name, (field_class, kwargs) in getattr(self.Meta, 'expandable_fields', {}).items():
+            if name in selection.expand:
+                fields[name] = field_class(**kwargs)
+        return {name: field for name, field in fields.items() if selection.allows(name)}
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        gated = [name for name in getattr(self.Meta, 'course_member_fields', ()) if name in data]
+        if gated and not self._can_view_course(instance.course_id):
+            for name in gated:
+                del data[name]
+        return data
+
+    def _can_view_course(self, course_id):
+        from apps.core.access import get_course_access
+
+        request = self.context.get('request')
+        if request is None:
+            return True
+        user = request.user
+        return user.is_staff or get_course_access(user).can_view(course_id)
+
+    def optimize_queryset(self, queryset, keep=()):
+        """
+        Restrict `queryset` to the columns and select_related joins the
+        selected fields read, plus the lookup paths in `keep`. Returns it
+        unchanged if any selected field's dependencies are unknown.
+        """
+        hints = getattr(self.Meta, 'field_dependencies', {})
+        paths, joins = {'pk', *keep}, set()
+        if any(name in self.fields for name in getattr(self.Meta, 'course_member_fields', ())):
+            paths.add('course')
+        for name, field in self.fields.items():
+            if name in hints:
+                paths.update(hints[name])
+                continue
+            resolved = _source_paths(queryset.model, field)
+            if resolved is None:
+                return queryset
+            paths.update(resolved[0])
+            joins.update(resolved[1])
+        # Annotations are selected by the queryset already; only() takes fields.
+        paths -= set(queryset.query.annotations)
+        joins.update(path.rsplit('__', 1)[0] for path in paths if '__' in path)
+
+        queryset = queryset.select_related(None)
+        if joins:
+            queryset = queryset.select_related(*joins)
+        return queryset.only(*paths)
@@ -0,0 +1,17 @@
+"""
+DRF throttles backed by the shared cache tier so request counts are global
+across worker processes rather than per-process.
+"""
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+shared_cache = ConnectionProxy(caches, 'shared')
+
+
+class SharedAnonRateThrottle(AnonRateThrottle):
+    cache = shared_cache
+
+
+class SharedUserRateThrottle(UserRateThrottle):
+    cache = shared_cache
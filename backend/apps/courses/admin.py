@@ -8,4 +8,6 @@ class CourseAdmin(admin.ModelAdmin):
     list_filter = ('category', 'level', 'is_published', 'is_free')
     search_fields = ('title', 'description', 'teacher__name')
     raw_id_fields = ('teacher',)
+    # Maintained by Course.adjust_counters() and reconcile_course_counters.
+    readonly_fields = Course.COUNTER_FIELDS
     ordering = ('-created_at',)
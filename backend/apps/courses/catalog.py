@@ -0,0 +1,105 @@
+"""
+Catalog version and the shared response cache for published-course listings.
+
+The catalog version is a counter in the cache bumped whenever something that
+appears in a catalog listing changes: any Course save (including soft delete
+and publish toggles) and lesson/quiz count changes. Cached payloads and the
+title suggest index are keyed by it, so a bump makes them all stale at once.
+Student counts are deliberately not versioned (enrollments are too frequent);
+they are at most CATALOG_CACHE_TTL seconds old.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+VERSION_CACHE_KEY = 'catalog:version'
+
+
+def catalog_version():
+    return cache.get(VERSION_CACHE_KEY, 0)
+
+
+def bump_catalog_version():
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(VERSION_CACHE_KEY, 1, None)
+
+
+def catalog_cache_key(name, query_params):
+    """Key for one listing: view name, catalog version and the sorted query string."""
+    normalized = '&'.join(
+        f'{key}={value}'
+        for key in sorted(query_params)
+        for value in sorted(query_params.getlist(key))
+    )
+    digest = hashlib.md5(normalized.encode()).hexdigest()
+    return f'catalog:{name}:v{catalog_version()}:{digest}'
+
+
+class CatalogCacheMixin:
+    """
+    For list views whose payload is the same for every viewer except a few
+    per-viewer fields. The shared payload (built with building_shared_payload
+    set, so the view skips viewer annotations) is cached per normalized query
+    string and catalog version; viewer fields are then merged in with one
+    query per request.
+
+    Views set `catalog_cache_name`; the serializer's VIEWER_FIELDS maps
+    output keys to Course.objects.with_stats(viewer=...) annotations.
+    """
+    catalog_cache_name = None
+    building_shared_payload = False
+
+    def use_catalog_cache(self, request):
+        return True
+
+    def get_viewer_fields(self, user):
+        """Viewer fields to merge for `user`, limited to the requested fieldset."""
+        selection = self.get_serializer().field_selection
+        fields = getattr(self.get_serializer_class(), 'VIEWER_FIELDS', {})
+        return {name: annotation for name, annotation in fields.items() if selection.allows(name)}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['shared_payload'] = self.building_shared_payload
+        return context
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_catalog_cache(request):
+            return super().list(request, *args, **kwargs)
+
+        key = catalog_cache_key(self.catalog_cache_name, request.query_params)
+        data = cache.get(key)
+        if data is None:
+            self.building_shared_payload = True
+            try:
+                data = super().list(request, *args, **kwargs).data
+            finally:
+                self.building_shared_payload = False
+            cache.set(key, data, settings.CATALOG_CACHE_TTL)
+        return Response(self.merge_viewer_fields(data, request.user))
+
+    def merge_viewer_fields(self, data, user):
+        fields = self.get_viewer_fields(user)
+        items = data.get('data')
+        if not fields or not items:
+            return data
+
+        from .models import Course
+
+        rows = (
+            Course.objects.filter(pk__in=[item['id'] for item in items])
+            .with_stats(viewer=user)
+            .values('pk', *fields.values())
+        )
+        state = {str(row['pk']): row for row in rows}
+        merged = []
+        for item in items:
+            row = state.get(str(item['id']))
+            if row is not None:
+                item = {**item, **{out: row[annotation] for out, annotation in fields.items()}}
+            merged.append(item)
+        return {**data, 'data': merged}
@@ -0,0 +1,241 @@
+"""
+Bulk import of whole courses from NDJSON or ZIP.
+
+Each NDJSON line is one course with its lessons, quizzes and questions:
+
+    {"title": "Algebra I", "category": "mathematics", "level": "beginner",
+     "lessons": [{"title": "Equations", "content": "<p>...</p>"}],
+     "quizzes": [{"title": "Check-in", "questions": [
+         {"question_text": "2x = 4, x = ?", "option_a": "1", "option_b": "2", "correct_answer": "b"}]}]}
+
+A ZIP may contain any number of .ndjson/.jsonl files. Records are read one
+at a time and validated whole: a course with one bad question is rejected
+and reported with its line. Valid courses are buffered and written with
+bulk_create whenever COURSE_IMPORT_BATCH_SIZE rows accumulate, all inside
+one transaction. Missing sequence numbers are assigned in list order.
+"""
+import json
+import zipfile
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from rest_framework import serializers
+
+from apps.core.access import invalidate_course_access
+from apps.lessons.models import Lesson
+from apps.quizzes.models import Quiz, QuizQuestion
+
+from .catalog import bump_catalog_version
+from .models import Course
+
+MAX_REPORTED_ERRORS = 100
+_RECORD_SUFFIXES = ('.ndjson', '.jsonl')
+
+
+def _number(items, label):
+    """Fill in missing sequence_number values; raise on duplicates."""
+    taken = [item['sequence_number'] for item in items if 'sequence_number' in item]
+    if len(taken) != len(set(taken)):
+        raise serializers.ValidationError({label: 'Duplicate sequence_number values.'})
+    used, next_number = set(taken), 1
+    for item in items:
+        if 'sequence_number' not in item:
+            while next_number in used:
+                next_number += 1
+            item['sequence_number'] = next_number
+            used.add(next_number)
+
+
+class QuestionImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = QuizQuestion
+        fields = [
+            'question_text', 'option_a', 'option_b', 'option_c', 'option_d',
+            'correct_answer', 'sequence_number', 'explanation',
+        ]
+
+
+class QuizImportSerializer(serializers.ModelSerializer):
+    questions = QuestionImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Quiz
+        fields = ['title', 'description', 'duration', 'passing_score', 'is_published', 'max_attempts', 'questions']
+
+
+class LessonImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Lesson
+        fields = ['title', 'description', 'content', 'sequence_number', 'video_url', 'file_type', 'duration']
+
+
+class CourseImportSerializer(serializers.ModelSerializer):
+    lessons = LessonImportSerializer(many=True, required=False)
+    quizzes = QuizImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Course
+        fields = [
+            'title', 'description', 'category', 'level', 'duration',
+            'is_published', 'is_free', 'price', 'lessons', 'quizzes',
+        ]
+
+    def validate_title(self, value):
+        if len(value.strip()) < 3:
+            raise serializers.ValidationError('Title must be at least 3 characters.')
+        return value.strip()
+
+    def validate(self, attrs):
+        _number(attrs.get('lessons', []), 'lessons')
+        for quiz in attrs.get('quizzes', []):
+            _number(quiz.get('questions', []), 'questions')
+        return attrs
+
+
+def iter_records(fileobj, name=''):
+    """Records of a seekable NDJSON or ZIP file (see iter_ndjson)."""
+    if zipfile.is_zipfile(fileobj):
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as archive:
+            for member in archive.namelist():
+                if member.lower().endswith(_RECORD_SUFFIXES):
+                    with archive.open(member) as fh:
+                        yield from iter_ndjson(fh, member)
+        return
+    fileobj.seek(0)
+    yield from iter_ndjson(fileobj, name)
+
+
+def iter_ndjson(fh, name=''):
+    """Yield (reference, record dict or error message) for every non-blank line of `fh`."""
+    for lineno, line in enumerate(fh, start=1):
+        if not line.strip():
+            continue
+        ref = f'{name}:{lineno}' if name else str(lineno)
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield ref, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(record, dict):
+            yield ref, 'Each line must be a JSON object.'
+            continue
+        yield ref, record
+
+
+def flatten_errors(errors, prefix=''):
+    """Nested serializer errors as {'quizzes[0].questions[3].correct_answer': [...]}."""
+    flat = {}
+    if isinstance(errors, dict):
+        for key, value in errors.items():
+            flat.update(flatten_errors(value, f'{prefix}.{key}' if prefix else key))
+    elif errors and all(isinstance(e, (dict, list)) for e in errors):
+        for i, value in enumerate(errors):
+            flat.update(flatten_errors(value, f'{prefix}[{i}]'))
+    elif errors:
+        flat[prefix or 'non_field_errors'] = [str(e) for e in errors]
+    return flat
+
+
+@dataclass
+class ImportResult:
+    courses: int = 0
+    lessons: int = 0
+    quizzes: int = 0
+    questions: int = 0
+    rejected: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, ref, errors, title=None):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'record': ref, 'title': title, 'errors': flatten_errors(errors)})
+
+    def as_dict(self):
+        return {
+            'created': {
+                'courses': self.courses,
+                'lessons': self.lessons,
+                'quizzes': self.quizzes,
+                'questions': self.questions,
+            },
+            'rejected': self.rejected,
+            'errors': self.errors,
+        }
+
+
+class CourseImporter:
+    """Validates records and bulk-inserts valid courses for `teacher` in bounded batches."""
+
+    def __init__(self, teacher, batch_size=None, dry_run=False):
+        self.teacher = teacher
+        self.batch_size = batch_size or settings.COURSE_IMPORT_BATCH_SIZE
+        self.dry_run = dry_run
+        self.result = ImportResult()
+        self._pending = []
+        self._pending_rows = 0
+
+    def run(self, records):
+        """Import an iterable of (reference, record) pairs; returns the ImportResult."""
+        try:
+            with transaction.atomic():
+                for ref, record in records:
+                    self.add(ref, record)
+                self.flush()
+                if self.dry_run:
+                    transaction.set_rollback(True)
+                elif self.result.courses:
+                    transaction.on_commit(bump_catalog_version)
+                    transaction.on_commit(lambda: invalidate_course_access(self.teacher))
+        except DatabaseError as e:
+            # Nothing was written; report the failure instead of partial counts.
+            self.result = ImportResult(rejected=self.result.rejected, errors=self.result.errors)
+            self.result.add_error(None, {'database': [str(e)]})
+        return self.result
+
+    def add(self, ref, record):
+        if not isinstance(record, dict):
+            self.result.add_error(ref, {'non_field_errors': [record]})
+            return
+        serializer = CourseImportSerializer(data=record)
+        if not serializer.is_valid():
+            self.result.add_error(ref, serializer.errors, title=record.get('title'))
+            return
+        data = serializer.validated_data
+        self._pending.append(data)
+        self._pending_rows += 1 + len(data.get('lessons', [])) + sum(
+            1 + len(quiz.get('questions', [])) for quiz in data.get('quizzes', [])
+        )
+        if self._pending_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        courses, lessons, quizzes, questions = [], [], [], []
+        for data in self._pending:
+            data = dict(data)
+            lesson_rows = data.pop('lessons', [])
+            quiz_rows = data.pop('quizzes', [])
+            # Counters are set up front; bulk_create skips adjust_counters().
+            course = Course(
+                teacher=self.teacher, lesson_count=len(lesson_rows), quiz_count=len(quiz_rows), **data
+            )
+            courses.append(course)
+            lessons.extend(Lesson(course=course, **row) for row in lesson_rows)
+            for row in quiz_rows:
+                row = dict(row)
+                question_rows = row.pop('questions', [])
+                quiz = Quiz(course=course, **row)
+                quizzes.append(quiz)
+                questions.extend(QuizQuestion(quiz=quiz, **q) for q in question_rows)
+        self._pending, self._pending_rows = [], 0
+
+        if not self.dry_run:
+            Course.objects.bulk_create(courses, batch_size=self.batch_size)
+            Lesson.objects.bulk_create(lessons, batch_size=self.batch_size)
+            Quiz.objects.bulk_create(quizzes, batch_size=self.batch_size)
+            QuizQuestion.objects.bulk_create(questions, batch_size=self.batch_size)
+        self.result.courses += len(courses)
+        self.result.lessons += len(lessons)
+        self.result.quizzes += len(quizzes)
+        self.result.questions += len(questions)
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.15 on 2026-10-17 00:44
+
+from django.db import migrations, models
+from django.db.models import F, Func, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _aggregate(queryset, function, field):
+    value = queryset.order_by().annotate(v=Func(F(field), function=function)).values("v")
+    return Coalesce(Subquery(value, output_field=models.BigIntegerField()), 0)
+
+
+def populate_counters(apps, schema_editor):
+    Course = apps.get_model("courses", "Course")
+    Enrollment = apps.get_model("enrollments", "Enrollment")
+    Lesson = apps.get_model("lessons", "Lesson")
+    Quiz = apps.get_model("quizzes", "Quiz")
+    QuizAttempt = apps.get_model("quizzes", "QuizAttempt")
+    attempts = QuizAttempt.objects.filter(quiz__course=OuterRef("pk"))
+    Course.objects.update(
+        active_student_count=_aggregate(
+            Enrollment.objects.filter(course=OuterRef("pk"), is_active=True), "COUNT", "pk"
+        ),
+        lesson_count=_aggregate(
+            Lesson.objects.filter(course=OuterRef("pk"), is_deleted=False), "COUNT", "pk"
+        ),
+        quiz_count=_aggregate(Quiz.objects.filter(course=OuterRef("pk")), "COUNT", "pk"),
+        attempt_count=_aggregate(attempts, "COUNT", "pk"),
+        avg_quiz_score_sum=_aggregate(attempts, "SUM", "score"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0001_initial"),
+        ("enrollments", "0001_initial"),
+        ("lessons", "0001_initial"),
+        ("quizzes", "0002_quizattempt_quiz_attemp_quiz_id_910dd4_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="active_student_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="attempt_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="avg_quiz_score_sum",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                help_text="Sum of quiz attempt scores; divide by attempt_count for the average",
+            ),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="lesson_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="quiz_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.1.15 on 2026-10-17 00:46
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('english', replace(coalesce({row}category, ''), '_', ' ')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}description, '')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION courses_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER courses_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, category, description ON courses
+    FOR EACH ROW EXECUTE FUNCTION courses_search_vector_update();
+
+UPDATE courses SET search_vector = {SEARCH_VECTOR_SQL.format(row="")};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS courses_search_vector_trigger ON courses;
+DROP FUNCTION IF EXISTS courses_search_vector_update();
+"""
+
+GIN_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["search_vector"], name="courses_search_vector_gin"
+)
+
+
+def _postgres_only(operation):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            operation(apps, schema_editor)
+
+    return run
+
+
+def create_trigger(apps, schema_editor):
+    schema_editor.execute(CREATE_TRIGGER_SQL)
+
+
+def drop_trigger(apps, schema_editor):
+    schema_editor.execute(DROP_TRIGGER_SQL)
+
+
+def add_index(apps, schema_editor):
+    schema_editor.add_index(apps.get_model("courses", "Course"), GIN_INDEX)
+
+
+def remove_index(apps, schema_editor):
+    schema_editor.remove_index(apps.get_model("courses", "Course"), GIN_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0002_course_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        # tsvector, GIN and the trigger only exist on PostgreSQL; other
+        # backends keep the column NULL and search in Python.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="course", index=GIN_INDEX)
+            ],
+            database_operations=[
+                migrations.RunPython(
+                    _postgres_only(add_index), _postgres_only(remove_index)
+                ),
+            ],
+        ),
+        migrations.RunPython(
+            _postgres_only(create_trigger), _postgres_only(drop_trigger)
+        ),
+    ]
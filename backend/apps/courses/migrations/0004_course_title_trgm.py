@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-17 00:47
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+TITLE_TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=["title"], name="courses_title_trgm", opclasses=["gin_trgm_ops"]
+)
+
+
+def add_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.add_index(apps.get_model("courses", "Course"), TITLE_TRGM_INDEX)
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(
+            apps.get_model("courses", "Course"), TITLE_TRGM_INDEX
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_course_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # pg_trgm and the GIN index are PostgreSQL-only; elsewhere title
+        # suggestions come from the in-process index.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="course", index=TITLE_TRGM_INDEX)
+            ],
+            database_operations=[migrations.RunPython(add_index, remove_index)],
+        ),
+    ]
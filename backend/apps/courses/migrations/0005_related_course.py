@@ -0,0 +1,60 @@
+# Generated by Django 5.1.15 on 2026-10-17 00:58
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0004_course_title_trgm"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedCourse",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField()),
+                ("co_enrollments", models.PositiveIntegerField()),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="neighbours",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="neighbour_of",
+                        to="courses.course",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "related_courses",
+                "ordering": ["course", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("course", "rank"),
+                        name="related_courses_course_rank_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_related_course"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="cover_image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Resized copies of cover_image by format and width (apps.media.images)",
+            ),
+        ),
+    ]
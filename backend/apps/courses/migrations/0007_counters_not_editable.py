@@ -0,0 +1,42 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0006_course_cover_image_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="course",
+            name="active_student_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="attempt_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="avg_quiz_score_sum",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Sum of quiz attempt scores; divide by attempt_count for the average",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="lesson_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="course",
+            name="quiz_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,9 +1,101 @@
 """
 Course model - The core content unit of the platform.
 """
+from django.apps import apps
 from django.conf import settings
-from django.db import models
-from apps.core.models import SoftDeleteModel
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Count, Exists, F, Func, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from apps.core.models import SoftDeleteManager, SoftDeleteModel, TimeStampedModel
+from apps.media.images import enqueue_image_variants, image_changed
+
+from .catalog import bump_catalog_version
+
+
+def _count(queryset):
+    """Correlated COUNT(*) subquery over `queryset`, 0 when no rows match."""
+    counted = queryset.order_by().annotate(n=Func(F('pk'), function='COUNT')).values('n')
+    return Coalesce(Subquery(counted, output_field=models.IntegerField()), 0)
+
+
+def _sum(queryset, field):
+    """Correlated SUM(field) subquery over `queryset`, 0 when no rows match."""
+    summed = queryset.order_by().annotate(s=Func(F(field), function='SUM')).values('s')
+    return Coalesce(Subquery(summed, output_field=models.BigIntegerField()), 0)
+
+
+def counter_expressions():
+    """Subquery expressions recomputing each stored Course counter from source rows."""
+    Enrollment = apps.get_model('enrollments', 'Enrollment')
+    Lesson = apps.get_model('lessons', 'Lesson')
+    Quiz = apps.get_model('quizzes', 'Quiz')
+    QuizAttempt = apps.get_model('quizzes', 'QuizAttempt')
+    attempts = QuizAttempt.objects.filter(quiz__course=OuterRef('pk'))
+    return {
+        'active_student_count': _count(
+            Enrollment.objects.filter(course=OuterRef('pk'), is_active=True)
+        ),
+        'lesson_count': _count(Lesson.objects.filter(course=OuterRef('pk'), is_deleted=False)),
+        'quiz_count': _count(Quiz.objects.filter(course=OuterRef('pk'))),
+        'attempt_count': _count(attempts),
+        'avg_quiz_score_sum': _sum(attempts, 'score'),
+    }
+
+
+class CourseQuerySet(models.QuerySet):
+
+    def with_stats(self, viewer=None):
+        """
+        Counts are stored columns on Course (see Course.adjust_counters);
+        this adds, for `viewer`, the enrollment flag, completed lesson count
+        and progress percentage as subquery annotations.
+        """
+        if viewer is None:
+            return self
+
+        Enrollment = apps.get_model('enrollments', 'Enrollment')
+        LessonProgress = apps.get_model('progress', 'LessonProgress')
+        CourseProgress = apps.get_model('progress', 'CourseProgress')
+        return self.annotate(
+            viewer_is_enrolled=Exists(
+                Enrollment.objects.filter(course=OuterRef('pk'), student=viewer, is_active=True)
+            ),
+            viewer_completed_lessons=_count(
+                LessonProgress.objects.filter(
+                    lesson__course=OuterRef('pk'), student=viewer, completed=True
+                )
+            ),
+            viewer_progress=Coalesce(
+                Subquery(
+                    CourseProgress.objects.filter(course=OuterRef('pk'), student=viewer)
+                    .values('progress_percentage')[:1]
+                ),
+                Value(0.0),
+            ),
+        )
+
+    def counter_drift(self):
+        """
+        Return {field: number of courses whose stored value is wrong}, computed
+        in a single query.
+        """
+        expected = {f'expected_{name}': expr for name, expr in counter_expressions().items()}
+        return self.annotate(**expected).aggregate(**{
+            name: Count('pk', filter=~Q(**{name: F(f'expected_{name}')}))
+            for name in self.model.COUNTER_FIELDS
+        })
+
+    def reconcile_counters(self):
+        """Recompute every stored counter in one UPDATE. Returns the row count."""
+        updated = self.update(**counter_expressions())
+        transaction.on_commit(bump_catalog_version)
+        return updated
+
+
+class CourseManager(SoftDeleteManager.from_queryset(CourseQuerySet)):
+    pass
 
 
 class Course(SoftDeleteModel):
@@ -54,6 +146,11 @@ class Course(SoftDeleteModel):
         blank=True,
         null=True,
     )
+    # Written by apps.media.images with UPDATEs; save() never writes it on an
+    # existing row.
+    cover_image_variants = models.JSONField(
+        default=dict, blank=True, editable=False,
+        help_text='Resized copies of cover_image by format and width (apps.media.images)')
     duration = models.CharField(max_length=50, blank=True, default='',
                                  help_text='Estimated duration e.g. "4 weeks"')
     is_published = models.BooleanField(default=False, db_index=True)
@@ -63,6 +160,30 @@ class Course(SoftDeleteModel):
     is_free = models.BooleanField(default=True)
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
 
+    # Denormalized counters, kept current by adjust_counters() in the same
+    # transaction as the write they reflect; `reconcile_course_counters`
+    # repairs drift. save() never writes them on an existing row.
+    active_student_count = models.PositiveIntegerField(default=0, editable=False)
+    lesson_count = models.PositiveIntegerField(default=0, editable=False)
+    quiz_count = models.PositiveIntegerField(default=0, editable=False)
+    attempt_count = models.PositiveIntegerField(default=0, editable=False)
+    avg_quiz_score_sum = models.PositiveBigIntegerField(
+        default=0, editable=False, help_text='Sum of quiz attempt scores; divide by attempt_count for the average')
+
+    # Weighted title (A) > category (B) > description (C) tsvector, maintained
+    # by a database trigger on PostgreSQL (see migration 0003); unused and
+    # left NULL on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    COUNTER_FIELDS = (
+        'active_student_count', 'lesson_count', 'quiz_count',
+        'attempt_count', 'avg_quiz_score_sum',
+    )
+    # Counters shown in catalog listings; changing them bumps the catalog version.
+    CATALOG_COUNTER_FIELDS = ('lesson_count', 'quiz_count')
+
+    objects = CourseManager()
+
     class Meta:
         db_table = 'courses'
         verbose_name = 'Course'
@@ -72,19 +193,72 @@ class Course(SoftDeleteModel):
             models.Index(fields=['teacher', 'is_published']),
             models.Index(fields=['category', 'level']),
             models.Index(fields=['is_published', '-created_at']),
+            GinIndex(fields=['search_vector'], name='courses_search_vector_gin'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='courses_title_trgm'),
         ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is None and not self._state.adding and not kwargs.get('force_insert'):
+            # A full save of a loaded instance would put back the counter
+            # values and cover variants it was loaded with, losing concurrent
+            # adjust_counters() and variant generation.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in (*self.COUNTER_FIELDS, 'cover_image_variants')
+            ]
+        cover_changed = image_changed(self, 'cover_image', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+        if cover_changed:
+            enqueue_image_variants(self, 'course-cover')
+        # Catalog caches and title indexes refresh once the change is visible.
+        transaction.on_commit(bump_catalog_version)
+
+    @classmethod
+    def adjust_counters(cls, course_id, **deltas):
+        """
+        Apply counter deltas, e.g. adjust_counters(course_id, lesson_count=1),
+        as a single F() UPDATE so concurrent writers never lose increments.
+        Call inside the transaction that makes the underlying change. Values
+        are floored at 0; any resulting drift is fixed by reconciliation.
+        """
+        cls.all_objects.filter(pk=course_id).update(
+            **{field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+        )
+        if any(field in cls.CATALOG_COUNTER_FIELDS for field in deltas):
+            transaction.on_commit(bump_catalog_version)
+
     @property
     def student_count(self):
-        return self.enrollments.filter(is_active=True).count()
+        return self.active_student_count
 
     @property
-    def lesson_count(self):
-        return self.lessons.count()
+    def avg_quiz_score(self):
+        if self.attempt_count:
+            return round(self.avg_quiz_score_sum / self.attempt_count, 1)
+        return None
 
-    @property
-    def quiz_count(self):
-        return self.quizzes.count()
+
+class RelatedCourse(TimeStampedModel):
+    """
+    Precomputed "students also enrolled in" neighbour of a course: the top-K
+    courses by cosine similarity of their enrollment vectors, rank 1 first.
+    Rebuilt wholesale by apps.courses.tasks.rebuild_related_courses.
+    """
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='neighbours')
+    related = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='neighbour_of')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    co_enrollments = models.PositiveIntegerField()
+
+    class Meta:
+        db_table = 'related_courses'
+        ordering = ['course', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['course', 'rank'], name='related_courses_course_rank_uniq'),
+        ]
+
+    def __str__(self):
+        return f'{self.course_id} -> {self.related_id} (#{self.rank})'
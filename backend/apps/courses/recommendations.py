@@ -0,0 +1,115 @@
+"""
+"Students also enrolled in" recommendations.
+
+build_related_courses() turns active enrollments into a sparse
+student x course matrix X, computes the course x course co-enrollment
+counts X^T X and cosine-normalizes them:
+
+    similarity(i, j) = co(i, j) / sqrt(n_i * n_j)
+
+where n_i is course i's active enrollment count. The top-K neighbours of
+each course are stored in RelatedCourse, so request-time lookups read at
+most K rows per course and never touch enrollments. NumPy/SciPy are only
+imported by the build (Celery worker), not by web processes.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+
+from .models import Course, RelatedCourse
+
+
+def _top_k(matrix, k):
+    """Yield (row, [(col, value), ...]) with each CSR row's k largest values, largest first."""
+    import numpy as np
+
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        if start == end:
+            continue
+        values = matrix.data[start:end]
+        order = np.argsort(-values, kind='stable')[:k]
+        yield row, [(matrix.indices[start + i], values[i]) for i in order]
+
+
+def build_related_courses(top_k=None, min_support=None):
+    """Recompute every course's neighbours; returns the number of rows written."""
+    import numpy as np
+    from scipy import sparse
+
+    from apps.enrollments.models import Enrollment
+
+    top_k = top_k or settings.RELATED_COURSES_TOP_K
+    min_support = min_support or settings.RELATED_COURSES_MIN_SUPPORT
+
+    students, courses = {}, {}
+    student_idx, course_idx = [], []
+    rows = Enrollment.objects.filter(is_active=True, course__is_deleted=False).values_list('student_id', 'course_id')
+    for student_id, course_id in rows.iterator(chunk_size=10000):
+        student_idx.append(students.setdefault(student_id, len(students)))
+        course_idx.append(courses.setdefault(course_id, len(courses)))
+
+    entries = []
+    if courses:
+        enrolled = sparse.csr_matrix(
+            (np.ones(len(student_idx)), (student_idx, course_idx)),
+            shape=(len(students), len(courses)),
+        )
+        co = (enrolled.T @ enrolled).tocsr()
+        counts = co.diagonal()
+        co.setdiag(0)
+        co.data[co.data < min_support] = 0
+        co.eliminate_zeros()
+
+        course_ids = list(courses)
+        published = set(
+            Course.objects.filter(pk__in=course_ids, is_published=True).values_list('pk', flat=True)
+        )
+        # Only published courses can be recommended.
+        target = sparse.diags([1.0 if cid in published else 0.0 for cid in course_ids])
+        norm = sparse.diags(1.0 / np.sqrt(counts))
+        similarity = (norm @ co @ norm @ target).tocsr()
+        similarity.eliminate_zeros()
+
+        for row, neighbours in _top_k(similarity, top_k):
+            for rank, (col, score) in enumerate(neighbours, start=1):
+                entries.append(RelatedCourse(
+                    course_id=course_ids[row],
+                    related_id=course_ids[col],
+                    rank=rank,
+                    score=round(float(score), 6),
+                    co_enrollments=int(co[row, col]),
+                ))
+
+    with transaction.atomic():
+        RelatedCourse.objects.all().delete()
+        RelatedCourse.objects.bulk_create(entries, batch_size=2000)
+    return len(entries)
+
+
+def related_courses(course_id, limit):
+    """Published neighbours of one course, best first (reads at most `limit` rows)."""
+    return (
+        Course.objects.filter(neighbour_of__course_id=course_id, is_published=True, is_deleted=False)
+        .select_related('teacher')
+        .order_by('neighbour_of__rank')[:limit]
+    )
+
+
+def recommended_courses(enrolled_ids, limit):
+    """
+    Courses to suggest to someone enrolled in `enrolled_ids`: neighbours of
+    those courses, excluding them, scored by summed similarity.
+    """
+    if not enrolled_ids:
+        return []
+    scores = list(
+        RelatedCourse.objects.filter(course_id__in=enrolled_ids, related__is_published=True,
+                                     related__is_deleted=False)
+        .exclude(related_id__in=enrolled_ids)
+        .values('related_id')
+        .annotate(total=Sum('score'))
+        .order_by('-total')[:limit]
+    )
+    courses = Course.objects.select_related('teacher').in_bulk([row['related_id'] for row in scores])
+    return [courses[row['related_id']] for row in scores if row['related_id'] in courses]
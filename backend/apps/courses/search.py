@@ -0,0 +1,83 @@
+"""
+Course catalog search.
+
+On PostgreSQL this matches against Course.search_vector (trigger-maintained,
+GIN-indexed) with prefix matching on every term and ranks by ts_rank with
+title > category > description weights. Other backends (SQLite in tests and
+local runs) get the same semantics from an in-memory scan.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Case, F, FloatField, Value, When
+
+# Same relative weights as ts_rank's defaults for A, B and C.
+_WEIGHTS = {'title': 1.0, 'category': 0.4, 'description': 0.2}
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_terms(text):
+    return [term.lower() for term in _TERM_RE.findall(text or '')]
+
+
+def search_courses(queryset, text):
+    """
+    Filter `queryset` to courses matching every term of `text` (as a word
+    prefix), annotated with `search_rank` and ordered by it, newest first on
+    ties. Returns the queryset unchanged if `text` has no terms.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return queryset
+    if connection.vendor == 'postgresql':
+        return _search_postgres(queryset, terms)
+    return _search_in_memory(queryset, terms)
+
+
+def _search_postgres(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    # Terms are \w-only, so they are safe to splice into a raw tsquery.
+    query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config='english')
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(search_rank=SearchRank(F('search_vector'), query))
+        .order_by('-search_rank', '-created_at')
+    )
+
+
+def _rank(row, terms):
+    words = {
+        field: search_terms(value.replace('_', ' ') if field == 'category' else value)
+        for field, value in row.items()
+    }
+    score = 0.0
+    for term in terms:
+        best = max(
+            (weight for field, weight in _WEIGHTS.items()
+             if any(word.startswith(term) for word in words[field])),
+            default=0.0,
+        )
+        if not best:
+            return 0.0
+        score += best
+    return score
+
+
+def _search_in_memory(queryset, terms):
+    ranks = {}
+    for row in queryset.values('pk', *_WEIGHTS):
+        pk = row.pop('pk')
+        score = _rank(row, terms)
+        if score:
+            ranks[pk] = score
+    if not ranks:
+        return queryset.none()
+    return (
+        queryset.filter(pk__in=ranks)
+        .annotate(search_rank=Case(
+            *[When(pk=pk, then=Value(score)) for pk, score in ranks.items()],
+            output_field=FloatField(),
+        ))
+        .order_by('-search_rank', '-created_at')
+    )
@@ -3,27 +3,61 @@ Course serializers for CRUD operations.
 """
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+
+from apps.core.serializers import SparseFieldsetMixin
+from apps.media.images import image_srcset
 from .models import Course
 
 User = get_user_model()
 
 
-class CourseListSerializer(serializers.ModelSerializer):
+class TeacherSummarySerializer(serializers.ModelSerializer):
+    """Public teacher info for ?expand=teacher."""
+    profile_image_url = serializers.ReadOnlyField()
+
+    class Meta:
+        model = User
+        fields = ['id', 'name', 'profile_image_url']
+
+
+class CourseListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight serializer for course listings."""
     teacher_name = serializers.CharField(source='teacher.name', read_only=True)
     student_count = serializers.ReadOnlyField()
     lesson_count = serializers.ReadOnlyField()
     quiz_count = serializers.ReadOnlyField()
+    cover_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = Course
         fields = [
             'id', 'title', 'description', 'category', 'level',
-            'cover_image', 'duration', 'teacher_name',
+            'cover_image', 'cover_image_srcset', 'duration', 'teacher_name',
             'is_published', 'is_free', 'price',
             'student_count', 'lesson_count', 'quiz_count',
             'created_at', 'updated_at',
         ]
+        expandable_fields = {
+            'teacher': (TeacherSummarySerializer, {'read_only': True}),
+        }
+        field_dependencies = {
+            'student_count': ('active_student_count',),
+            'cover_image_srcset': ('cover_image', 'cover_image_variants'),
+        }
+
+    # Viewer fields, present only when the queryset came from with_stats(viewer=...).
+    VIEWER_FIELDS = {'is_enrolled': 'viewer_is_enrolled', 'progress_percentage': 'viewer_progress'}
+
+    def get_cover_image_srcset(self, obj):
+        return image_srcset(obj.cover_image, obj.cover_image_variants)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        selection = self.field_selection
+        for name, annotation in self.VIEWER_FIELDS.items():
+            if hasattr(instance, annotation) and selection.allows(name):
+                data[name] = getattr(instance, annotation)
+        return data
 
 
 class CourseDetailSerializer(serializers.ModelSerializer):
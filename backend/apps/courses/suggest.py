@@ -0,0 +1,139 @@
+"""
+Course title autocomplete.
+
+The default backend is an in-process index over published course titles:
+word-prefix matches (bisect over a sorted word list) rank first, then
+typo-tolerant trigram matches (inverted trigram -> course postings). Each
+process builds it lazily and rebuilds when the catalog version in the cache
+changes (see apps.courses.catalog).
+
+COURSE_SUGGEST_BACKEND = 'database' queries the pg_trgm GIN index on
+courses.title instead (PostgreSQL only; other backends keep using memory).
+"""
+import bisect
+import re
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Value
+
+from .catalog import catalog_version
+
+MIN_SIMILARITY = 0.3
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _words(text):
+    return _WORD_RE.findall(text.lower())
+
+
+def _trigrams(words, partial_last=False):
+    """pg_trgm-style trigrams; the last word of partial input gets no end padding."""
+    grams = set()
+    for i, word in enumerate(words):
+        padded = f'  {word}' if partial_last and i == len(words) - 1 else f'  {word} '
+        grams.update(padded[j:j + 3] for j in range(len(padded) - 2))
+    return grams
+
+
+class TitleIndex:
+    """Immutable prefix + trigram index over (id, title) pairs."""
+
+    def __init__(self, rows):
+        self.titles = {}
+        self._words = []          # sorted (word, course_id)
+        self._postings = {}       # trigram -> set(course_id)
+        for course_id, title in rows:
+            self.titles[course_id] = title
+            words = _words(title)
+            self._words.extend((word, course_id) for word in set(words))
+            for gram in _trigrams(words):
+                self._postings.setdefault(gram, set()).add(course_id)
+        self._words.sort()
+
+    def _prefix_ids(self, prefix):
+        start = bisect.bisect_left(self._words, (prefix,))
+        ids = set()
+        for word, course_id in self._words[start:]:
+            if not word.startswith(prefix):
+                break
+            ids.add(course_id)
+        return ids
+
+    def search(self, text, limit):
+        words = _words(text)
+        if not words:
+            return []
+
+        prefix_ids = None
+        for word in words:
+            ids = self._prefix_ids(word)
+            prefix_ids = ids if prefix_ids is None else prefix_ids & ids
+
+        query_grams = _trigrams(words, partial_last=True)
+        shared = Counter()
+        for gram in query_grams:
+            for course_id in self._postings.get(gram, ()):
+                shared[course_id] += 1
+
+        scores = {}
+        for course_id, n in shared.items():
+            similarity = n / len(query_grams)
+            if similarity >= MIN_SIMILARITY:
+                scores[course_id] = similarity
+        for course_id in prefix_ids:
+            scores[course_id] = 1.0 + scores.get(course_id, 0.0)
+
+        best = sorted(scores, key=lambda cid: (-scores[cid], self.titles[cid].lower()))[:limit]
+        return [{'id': str(course_id), 'title': self.titles[course_id]} for course_id in best]
+
+
+class SuggestIndexHolder:
+    """Per-process TitleIndex, rebuilt when the cached catalog version moves."""
+
+    def __init__(self):
+        self._index = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        version = catalog_version()
+        if self._index is None or version != self._version:
+            with self._lock:
+                if self._index is None or version != self._version:
+                    from .models import Course
+                    rows = Course.objects.filter(is_published=True).values_list('id', 'title')
+                    self._index = TitleIndex(rows)
+                    self._version = version
+        return self._index
+
+
+index_holder = SuggestIndexHolder()
+
+
+def _suggest_postgres(text, limit):
+    from django.contrib.postgres.lookups import TrigramWordSimilar
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    from .models import Course
+
+    # title %> text (word similarity above pg_trgm.word_similarity_threshold)
+    # is answered from the trigram GIN index.
+    rows = (
+        Course.objects.filter(is_published=True)
+        .filter(TrigramWordSimilar(F('title'), Value(text)))
+        .annotate(similarity=TrigramWordSimilarity(Value(text), 'title'))
+        .order_by('-similarity', 'title')
+        .values_list('id', 'title')[:limit]
+    )
+    return [{'id': str(course_id), 'title': title} for course_id, title in rows]
+
+
+def suggest_titles(text, limit):
+    """Top `limit` published course titles for partial or misspelled `text`."""
+    if settings.COURSE_SUGGEST_BACKEND == 'database' and connection.vendor == 'postgresql':
+        return _suggest_postgres(text, limit)
+    return index_holder.get().search(text, limit)
@@ -0,0 +1,17 @@
+"""
+Course-related Celery tasks.
+"""
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def rebuild_related_courses():
+    """Recompute the co-enrollment neighbours behind course recommendations."""
+    from .recommendations import build_related_courses
+
+    written = build_related_courses()
+    logger.info(f"Rebuilt related courses: {written} neighbour rows.")
+    return written
@@ -5,5 +5,8 @@ app_name = 'courses'
 
 urlpatterns = [
     path('', views.CourseListCreateView.as_view(), name='list-create'),
+    path('import/', views.CourseImportView.as_view(), name='import'),
+    path('suggest/', views.CourseSuggestView.as_view(), name='suggest'),
     path('<uuid:id>/', views.CourseDetailView.as_view(), name='detail'),
+    path('<uuid:id>/related/', views.RelatedCoursesView.as_view(), name='related'),
 ]
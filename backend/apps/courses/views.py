@@ -2,15 +2,24 @@
 Course views - CRUD operations for courses.
 Teachers can create/update/delete. Students can read published courses.
 """
+from django.conf import settings
 from django.db.models import Q
-from rest_framework import generics, status
+from rest_framework import generics, parsers, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from apps.core.pagination import StandardPagination
+from apps.core.access import invalidate_course_access
+from apps.core.conditional import ConditionalRetrieveMixin
+from apps.core.pagination import EstimatedCountPagination
 from apps.core.permissions import IsCourseTeacher, IsTeacher, IsTeacherOrReadOnly
 
+from .catalog import CatalogCacheMixin
+from .importer import CourseImporter, iter_ndjson, iter_records
 from .models import Course
+from .recommendations import related_courses
+from .search import search_courses
+from .suggest import suggest_titles
 from .serializers import (
     CourseCreateSerializer,
     CourseDetailSerializer,
@@ -19,13 +28,23 @@ from .serializers import (
 )
 
 
-class CourseListCreateView(generics.ListCreateAPIView):
+class CourseListCreateView(CatalogCacheMixin, generics.ListCreateAPIView):
     """
     GET  /api/v1/courses/         - List published courses (all authenticated users)
     POST /api/v1/courses/         - Create a course (teachers only)
     """
     permission_classes = [IsAuthenticated, IsTeacherOrReadOnly]
-    pagination_class = StandardPagination
+    pagination_class = EstimatedCountPagination
+    catalog_cache_name = 'course_list'
+
+    def use_catalog_cache(self, request):
+        # Teachers also see their own unpublished courses.
+        return request.user.role != 'teacher'
+
+    def get_viewer_fields(self, user):
+        if user.role != 'student':
+            return {}
+        return super().get_viewer_fields(user)
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -34,7 +53,8 @@ class CourseListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = Course.objects.select_related('teacher')
+        wants_viewer = not self.building_shared_payload and self.get_viewer_fields(user)
+        queryset = Course.objects.select_related('teacher').with_stats(viewer=user if wants_viewer else None)
 
         # Teachers see their own courses, students see published ones only
         if user.role == 'teacher':
@@ -45,13 +65,6 @@ class CourseListCreateView(generics.ListCreateAPIView):
         else:
             queryset = queryset.filter(is_published=True, is_deleted=False)
 
-        # Search
-        search = self.request.query_params.get('search', '')
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
-
         # Filter
         category = self.request.query_params.get('category')
         if category:
@@ -61,12 +74,19 @@ class CourseListCreateView(generics.ListCreateAPIView):
         if level:
             queryset = queryset.filter(level=level)
 
-        return queryset.order_by('-created_at')
+        # Search (ranked; replaces the default ordering)
+        search = self.request.query_params.get('search', '')
+        if search:
+            queryset = search_courses(queryset, search)
+        else:
+            queryset = queryset.order_by('-created_at')
+        return self.get_serializer().optimize_queryset(queryset)
 
     def create(self, request, *args, **kwargs):
         serializer = CourseCreateSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         course = serializer.save()
+        invalidate_course_access(request.user)
         return Response({
             'success': True,
             'message': 'Course created successfully.',
@@ -74,7 +94,26 @@ class CourseListCreateView(generics.ListCreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
+class CourseSuggestView(APIView):
+    """
+    GET /api/v1/courses/suggest/?q=<text>&limit=<n>
+    Typo-tolerant title autocomplete over published courses. Returns only
+    id and title so it can be called on every keystroke.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        text = request.query_params.get('q', '').strip()
+        try:
+            limit = int(request.query_params.get('limit', 8))
+        except ValueError:
+            limit = 8
+        limit = max(1, min(limit, settings.COURSE_SUGGEST_MAX_RESULTS))
+        data = suggest_titles(text, limit) if text else []
+        return Response({'success': True, 'data': data})
+
+
+class CourseDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET    /api/v1/courses/<id>/  - Get course detail
     PUT    /api/v1/courses/<id>/  - Update course (owner teacher only)
@@ -91,10 +130,16 @@ class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         return Course.objects.select_related('teacher').filter(is_deleted=False)
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = CourseDetailSerializer(instance)
-        return Response({'success': True, 'data': serializer.data})
+    def get_validators(self, instance):
+        # Stored counters change without touching updated_at: ETag only.
+        parts = (
+            instance.pk, instance.updated_at, instance.teacher.updated_at,
+            instance.active_student_count, instance.lesson_count, instance.quiz_count,
+        )
+        return parts, None
+
+    def get_retrieve_data(self, instance):
+        return CourseDetailSerializer(instance).data
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -121,7 +166,66 @@ class CourseDetailView(generics.RetrieveUpdateDestroyAPIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
         instance.soft_delete()
+        invalidate_course_access(request.user)
         return Response({
             'success': True,
             'message': 'Course deleted successfully.',
         }, status=status.HTTP_200_OK)
+
+
+class RelatedCoursesView(APIView):
+    """
+    GET /api/v1/courses/<id>/related/?limit=<n>
+    "Students also enrolled in": published courses most often co-enrolled
+    with this one, precomputed by the rebuild_related_courses task.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, id):
+        try:
+            limit = int(request.query_params.get('limit', settings.RELATED_COURSES_TOP_K))
+        except ValueError:
+            limit = settings.RELATED_COURSES_TOP_K
+        limit = max(1, min(limit, settings.RELATED_COURSES_TOP_K))
+        serializer = CourseListSerializer(
+            related_courses(id, limit), many=True, context={'request': request}
+        )
+        return Response({'success': True, 'data': serializer.data})
+
+
+class CourseImportView(APIView):
+    """
+    POST /api/v1/courses/import/[?dry_run=1]
+    Bulk-create the teacher's courses with lessons, quizzes and questions.
+    Send a multipart `file` (.ndjson or .zip of .ndjson files), or the NDJSON
+    itself as an application/x-ndjson body, which is read line by line.
+    Invalid courses are skipped and reported per record.
+    """
+    permission_classes = [IsAuthenticated, IsTeacher]
+    parser_classes = [parsers.MultiPartParser]
+
+    def post(self, request):
+        if request.content_type.split(';')[0].strip() in ('application/x-ndjson', 'application/jsonl'):
+            records = iter_ndjson(request.stream)
+        elif 'file' in request.FILES:
+            upload = request.FILES['file']
+            records = iter_records(upload, upload.name)
+        else:
+            return Response({
+                'success': False,
+                'error': {'message': 'Upload an NDJSON or ZIP file as "file".'}
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = request.query_params.get('dry_run', '').lower() in ('1', 'true', 'yes')
+        result = CourseImporter(request.user, dry_run=dry_run).run(records)
+
+        if not result.courses:
+            return Response({
+                'success': False,
+                'error': {'message': 'No courses were imported.', 'details': result.as_dict()}
+            }, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'success': True,
+            'message': 'Dry run: nothing was saved.' if dry_run else f'Imported {result.courses} course(s).',
+            'data': result.as_dict(),
+        }, status=status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED)
@@ -2,8 +2,10 @@
 Enrollment model - Tracks student-course relationships.
 """
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from apps.core.models import TimeStampedModel
+from apps.courses.models import Course
 
 
 class Enrollment(TimeStampedModel):
@@ -33,3 +35,36 @@ class Enrollment(TimeStampedModel):
 
     def __str__(self):
         return f"{self.student.name} → {self.course.title}"
+
+    @classmethod
+    def enroll(cls, **lookup):
+        """
+        Get or create the enrollment for `lookup` (student/course or their
+        _id forms) and make it active. Returns (enrollment, changed), where
+        changed is False if it was already active. The course's student
+        counter moves in the same transaction.
+        """
+        with transaction.atomic():
+            enrollment, created = cls.objects.get_or_create(**lookup, defaults={'is_active': True})
+            changed = created or cls.objects.filter(pk=enrollment.pk, is_active=False).update(
+                is_active=True, unenrolled_at=None, updated_at=timezone.now(),
+            ) > 0
+            if changed:
+                Course.adjust_counters(enrollment.course_id, active_student_count=1)
+        if changed:
+            enrollment.is_active = True
+            enrollment.unenrolled_at = None
+        return enrollment, changed
+
+    def deactivate(self):
+        """Unenroll, decrementing the course's student counter if it was active."""
+        now = timezone.now()
+        with transaction.atomic():
+            changed = Enrollment.objects.filter(pk=self.pk, is_active=True).update(
+                is_active=False, unenrolled_at=now, updated_at=now,
+            ) > 0
+            if changed:
+                Course.adjust_counters(self.course_id, active_student_count=-1)
+        self.is_active = False
+        self.unenrolled_at = now
+        return changed
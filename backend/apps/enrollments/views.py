@@ -1,12 +1,12 @@
 """
 Enrollment views - Enroll, unenroll, check status.
 """
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.access import invalidate_course_access
 from apps.core.permissions import IsStudent
 from apps.courses.models import Course
 from apps.progress.models import CourseProgress
@@ -35,23 +35,14 @@ class EnrollView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Check if already enrolled
-        enrollment, created = Enrollment.objects.get_or_create(
-            student=request.user,
-            course=course,
-            defaults={'is_active': True},
-        )
-
-        if not created:
-            if enrollment.is_active:
-                return Response(
-                    {'success': False, 'error': {'message': 'Already enrolled in this course.'}},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            # Re-enroll
-            enrollment.is_active = True
-            enrollment.unenrolled_at = None
-            enrollment.save()
+        # Enroll or re-enroll; unchanged means already enrolled
+        enrollment, changed = Enrollment.enroll(student=request.user, course=course)
+        if not changed:
+            return Response(
+                {'success': False, 'error': {'message': 'Already enrolled in this course.'}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        invalidate_course_access(request.user)
 
         # Create course progress record
         CourseProgress.objects.get_or_create(
@@ -89,9 +80,8 @@ class UnenrollView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        enrollment.is_active = False
-        enrollment.unenrolled_at = timezone.now()
-        enrollment.save()
+        enrollment.deactivate()
+        invalidate_course_access(request.user)
 
         return Response({'success': True, 'message': 'Unenrolled successfully.'})
 
@@ -2,6 +2,9 @@
 Lesson model - Individual learning units within a course.
 """
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
 from apps.core.models import SoftDeleteModel
 
 
@@ -49,3 +52,26 @@ class Lesson(SoftDeleteModel):
 
     def __str__(self):
         return f"{self.course.title} - {self.title}"
+
+    @classmethod
+    def renumber(cls, course_id, numbering, offset):
+        """
+        Apply {lesson_id: sequence_number} to a course's lessons in two
+        set-based UPDATEs, whatever the number of lessons. unique_together
+        (course, sequence_number) is checked row by row, so a single CASE
+        update could collide midway (swapping 1 and 2): the first statement
+        moves every row `offset` above its target, which must clear every
+        current number, and the second shifts them all down into place.
+        `numbering` must cover all the course's rows, soft-deleted ones too.
+        Call inside a transaction.
+        """
+        rows = cls.all_objects.filter(course_id=course_id)
+        now = timezone.now()
+        rows.update(
+            sequence_number=Case(
+                *(When(pk=pk, then=Value(number + offset)) for pk, number in numbering.items()),
+                output_field=models.PositiveIntegerField(),
+            ),
+            updated_at=now,
+        )
+        rows.update(sequence_number=F('sequence_number') - offset)
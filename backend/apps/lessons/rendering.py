@@ -0,0 +1,209 @@
+"""
+Lesson content rendering.
+
+Lesson.content is rich text written by teachers: HTML from the editor, or
+plain text. render_content() turns it into sanitized HTML (allow-listed
+tags and attributes, no scripts, handlers or javascript: URLs; plain text
+becomes paragraphs) and splits it into sections at top-level <h1>-<h3>
+headings, which get id anchors.
+
+get_rendered_content() renders a lesson once per updated_at and caches the
+result gzip-compressed with its section index, so lesson opens never
+re-sanitize, and full-document requests that accept gzip are served the
+stored bytes as-is.
+"""
+import gzip
+import re
+from dataclasses import dataclass
+from html import escape
+from html.parser import HTMLParser
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.text import slugify
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'del', 'div', 'em',
+    'figcaption', 'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img',
+    'ins', 'kbd', 'li', 'mark', 'ol', 'p', 'pre', 's', 'small', 'span', 'strong',
+    'sub', 'sup', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'u', 'ul',
+}
+ALLOWED_ATTRS = {
+    'a': {'href', 'title'},
+    'abbr': {'title'},
+    'img': {'src', 'alt', 'title', 'width', 'height'},
+    'ol': {'start'},
+    'td': {'colspan', 'rowspan'},
+    'th': {'colspan', 'rowspan', 'scope'},
+}
+URL_ATTRS = {'href', 'src'}
+SAFE_SCHEMES = {'http', 'https', 'mailto'}
+VOID_TAGS = {'br', 'hr', 'img'}
+# Dropped together with everything inside them.
+DROP_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'embed', 'noscript', 'template', 'svg', 'math'}
+SECTION_TAGS = {'h1', 'h2', 'h3'}
+
+_HTML_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)\b[^>]*>')
+_SCHEME_RE = re.compile(r'^\s*([a-zA-Z][a-zA-Z0-9+.-]*):')
+
+
+def _safe_url(value):
+    # Control characters and whitespace are ignored by browsers inside schemes.
+    match = _SCHEME_RE.match(re.sub(r'[\x00-\x20]', '', value))
+    return match is None or match.group(1).lower() in SAFE_SCHEMES
+
+
+class _Sanitizer(HTMLParser):
+    """Re-emits allow-listed markup and records top-level section headings."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.open_tags = []
+        self.dropping = 0
+        self.headings = []  # [part index, title parts]
+        self._heading = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.dropping or tag in DROP_CONTENT_TAGS:
+            if tag in DROP_CONTENT_TAGS:
+                self.dropping += 1
+            return
+        if tag not in ALLOWED_TAGS:
+            return
+        allowed = ALLOWED_ATTRS.get(tag, ())
+        rendered = ''.join(
+            f' {name}="{escape(value, quote=True)}"'
+            for name, value in attrs
+            if name in allowed and value is not None and (name not in URL_ATTRS or _safe_url(value))
+        )
+        if tag in SECTION_TAGS and not self.open_tags:
+            self._heading = [len(self.parts), []]
+            self.headings.append(self._heading)
+        self.parts.append(f'<{tag}{rendered}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            return
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.open_tags and self.open_tags[-1] == tag:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            self.dropping = max(self.dropping - 1, 0)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        while self.open_tags:
+            current = self.open_tags.pop()
+            self.parts.append(f'</{current}>')
+            if current == tag:
+                break
+        if not self.open_tags:
+            self._heading = None
+
+    def handle_data(self, data):
+        if self.dropping:
+            return
+        self.parts.append(escape(data, quote=False))
+        if self._heading is not None:
+            self._heading[1].append(data)
+
+    def close(self):
+        super().close()
+        while self.open_tags:
+            self.parts.append(f'</{self.open_tags.pop()}>')
+
+
+def _plain_text_to_html(text):
+    paragraphs = re.split(r'\n\s*\n', text.replace('\r\n', '\n').strip())
+    return ''.join(
+        '<p>' + escape(p.strip(), quote=False).replace('\n', '<br>') + '</p>' for p in paragraphs if p.strip()
+    )
+
+
+@dataclass
+class RenderedContent:
+    """Sanitized lesson HTML, gzip-compressed, and its section index (UTF-8 byte offsets)."""
+    compressed: bytes
+    length: int
+    sections: list
+
+    def html_bytes(self):
+        return gzip.decompress(self.compressed)
+
+    def find_section(self, key):
+        """Section by index or anchor, or None."""
+        for section in self.sections:
+            if str(section['index']) == key or section['anchor'] == key:
+                return section
+        return None
+
+    def section_bytes(self, section):
+        return self.html_bytes()[section['start']:section['end']]
+
+    def section_index(self):
+        """Sections without offsets, for API payloads."""
+        return [
+            {'index': s['index'], 'title': s['title'], 'anchor': s['anchor'], 'size': s['end'] - s['start']}
+            for s in self.sections
+        ]
+
+
+def render_content(raw):
+    """Sanitize `raw` lesson content into a RenderedContent."""
+    parser = _Sanitizer()
+    if _HTML_RE.search(raw or ''):
+        parser.feed(raw)
+    else:
+        parser.feed(_plain_text_to_html(raw or ''))
+    parser.close()
+
+    has_intro = not parser.headings or parser.headings[0][0] > 0
+    anchors = {'introduction'} if has_intro else set()
+    boundaries = []  # (part index, title, anchor)
+    for part_index, title_parts in parser.headings:
+        title = ' '.join(''.join(title_parts).split())
+        base = slugify(title) or 'section'
+        anchor, n = base, 2
+        while anchor in anchors:
+            anchor, n = f'{base}-{n}', n + 1
+        anchors.add(anchor)
+        tag = parser.parts[part_index]
+        parser.parts[part_index] = f'{tag[:3]} id="{anchor}"{tag[3:]}'
+        boundaries.append((part_index, title, anchor))
+
+    offsets, total = [], 0
+    for part in parser.parts:
+        offsets.append(total)
+        total += len(part.encode())
+    html = ''.join(parser.parts).encode()
+
+    sections = []
+    starts = [(offsets[i], title, anchor) for i, title, anchor in boundaries]
+    if has_intro:
+        # Content before the first heading, or a document without headings.
+        starts.insert(0, (0, '', 'introduction'))
+    for index, (start, title, anchor) in enumerate(starts):
+        end = starts[index + 1][0] if index + 1 < len(starts) else total
+        if end > start:
+            sections.append({'index': len(sections), 'title': title, 'anchor': anchor, 'start': start, 'end': end})
+
+    return RenderedContent(compressed=gzip.compress(html, compresslevel=6, mtime=0), length=total, sections=sections)
+
+
+def _cache_key(lesson):
+    return f'lesson:content:{lesson.pk}:{lesson.updated_at.timestamp()}'
+
+
+def get_rendered_content(lesson):
+    """Rendered content for `lesson`, computed at most once per updated_at."""
+    key = _cache_key(lesson)
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered = render_content(lesson.content)
+        cache.set(key, rendered, settings.LESSON_CONTENT_CACHE_TTL)
+    return rendered
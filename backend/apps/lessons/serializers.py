@@ -2,10 +2,15 @@
 Lesson serializers.
 """
 from rest_framework import serializers
+
+from apps.core.serializers import SparseFieldsetMixin
+from apps.media.serializers import SignedFileField, SignedMediaURLField
+from apps.media.signing import signed_url
 from .models import Lesson
+from .rendering import get_rendered_content
 
 
-class LessonListSerializer(serializers.ModelSerializer):
+class LessonListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight lesson listing."""
     class Meta:
         model = Lesson
@@ -13,21 +18,62 @@ class LessonListSerializer(serializers.ModelSerializer):
             'id', 'title', 'description', 'sequence_number',
             'file_type', 'duration', 'created_at',
         ]
+        expandable_fields = {
+            'content': (serializers.CharField, {'read_only': True}),
+        }
+        course_member_fields = ('content',)
 
 
-class LessonDetailSerializer(serializers.ModelSerializer):
-    """Full lesson detail with all content and media."""
+class LessonDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Lesson metadata and media. The rendered content is fetched from
+    /lessons/<id>/content/ (whole or by section); ?expand=content still
+    embeds the raw field. Media URLs are signed (apps.media.signing) so players
+    can fetch them without the Authorization header; they and the content are
+    only output to course members.
+    """
     course_title = serializers.CharField(source='course.title', read_only=True)
+    video_url = SignedMediaURLField()
+    video_file = SignedFileField()
+    attachment = SignedFileField()
+    content_sections = serializers.SerializerMethodField()
+    video_stream = serializers.SerializerMethodField()
 
     class Meta:
         model = Lesson
         fields = [
             'id', 'course', 'course_title', 'title', 'description',
-            'content', 'sequence_number', 'video_url', 'video_file',
-            'attachment', 'file_type', 'duration',
+            'content_sections', 'sequence_number', 'video_url', 'video_file',
+            'video_stream', 'attachment', 'file_type', 'duration',
             'created_at', 'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        expandable_fields = {
+            'content': (serializers.CharField, {'read_only': True}),
+        }
+        course_member_fields = ('content', 'video_url', 'video_file', 'video_stream', 'attachment')
+        field_dependencies = {
+            # Read from the render cached per updated_at; content itself is
+            # only loaded on a cache miss.
+            'content_sections': ('updated_at',),
+            'video_stream': ('encoding__status', 'encoding__master_playlist'),
+        }
+
+    def get_content_sections(self, obj):
+        return get_rendered_content(obj).section_index()
+
+    def get_video_stream(self, obj):
+        """HLS encoding status; clients switch to hls_url once status is 'ready'."""
+        encoding = getattr(obj, 'encoding', None)
+        if encoding is None:
+            return None
+        hls_url = None
+        if encoding.is_ready:
+            hls_url = signed_url(encoding.master_playlist)
+            request = self.context.get('request')
+            if request is not None:
+                hls_url = request.build_absolute_uri(hls_url)
+        return {'status': encoding.status, 'hls_url': hls_url}
 
 
 class LessonCreateSerializer(serializers.ModelSerializer):
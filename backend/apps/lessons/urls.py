@@ -6,5 +6,6 @@ app_name = 'lessons'
 urlpatterns = [
     path('', views.CourseLessonsView.as_view(), name='list-create'),
     path('<uuid:id>/', views.LessonDetailView.as_view(), name='detail'),
+    path('<uuid:id>/content/', views.LessonContentView.as_view(), name='content'),
     path('reorder/', views.ReorderLessonsView.as_view(), name='reorder'),
 ]
@@ -1,15 +1,30 @@
 """
 Lesson views - CRUD, reorder, and course-scoped listing.
 """
+import gzip
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.access import get_course_access
+from apps.core.conditional import ConditionalRetrieveMixin, make_etag
 from apps.core.pagination import StandardPagination
-from apps.core.permissions import IsTeacher, IsTeacherOrReadOnly
+from apps.core.serializers import FieldSelection
+from apps.core.permissions import IsCourseMember, IsTeacher, IsTeacherOrReadOnly
+from apps.core.ranges import RangeNotSatisfiable, content_range, parse_byte_range
+from apps.courses.models import Course
+from apps.media.signing import current_expiry
+from apps.media.video import enqueue_lesson_video
 
 from .models import Lesson
+from .rendering import get_rendered_content
 from .serializers import (
     LessonCreateSerializer,
     LessonDetailSerializer,
@@ -36,12 +51,16 @@ class CourseLessonsView(generics.ListCreateAPIView):
         course_id = self.request.query_params.get('course')
         if course_id:
             queryset = queryset.filter(course_id=course_id)
-        return queryset.order_by('sequence_number')
+        return self.get_serializer().optimize_queryset(queryset.order_by('sequence_number'))
 
     def create(self, request, *args, **kwargs):
         serializer = LessonCreateSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
-        lesson = serializer.save()
+        with transaction.atomic():
+            lesson = serializer.save()
+            Course.adjust_counters(lesson.course_id, lesson_count=1)
+            if lesson.video_file:
+                enqueue_lesson_video(lesson)
 
         # Trigger notifications for enrolled students
         try:
@@ -81,9 +100,9 @@ class CourseLessonsView(generics.ListCreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class LessonDetailView(generics.RetrieveUpdateDestroyAPIView):
+class LessonDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
-    GET    /api/v1/lessons/<id>/  - Get lesson detail
+    GET    /api/v1/lessons/<id>/  - Get lesson detail (content and media for course members)
     PUT    /api/v1/lessons/<id>/  - Update lesson (owner teacher)
     DELETE /api/v1/lessons/<id>/  - Soft-delete lesson (owner teacher)
     """
@@ -96,12 +115,30 @@ class LessonDetailView(generics.RetrieveUpdateDestroyAPIView):
         return LessonDetailSerializer
 
     def get_queryset(self):
-        return Lesson.objects.select_related('course', 'course__teacher').filter(is_deleted=False)
+        queryset = Lesson.objects.select_related('course', 'course__teacher').filter(is_deleted=False)
+        if self.request.method == 'GET':
+            # Validators read updated_at, course.updated_at and encoding.updated_at.
+            queryset = self.get_serializer().optimize_queryset(
+                queryset, keep=('updated_at', 'course__updated_at', 'encoding__updated_at')
+            )
+        return queryset
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = LessonDetailSerializer(instance)
-        return Response({'success': True, 'data': serializer.data})
+    def get_validators(self, instance):
+        # course_title and the video stream status are embedded. Media URLs
+        # are signed until current_expiry(), which no timestamp reflects, and
+        # only course members get them.
+        encoding = getattr(instance, 'encoding', None)
+        stamps = [instance.updated_at, instance.course.updated_at]
+        if encoding is not None:
+            stamps.append(encoding.updated_at)
+        user = self.request.user
+        is_member = user.is_staff or get_course_access(user).can_view(instance.course_id)
+        return (instance.pk, *stamps, is_member, current_expiry()), None
+
+    def get_retrieve_data(self, instance):
+        selection = FieldSelection.from_query_params(self.request.query_params)
+        context = {'field_selection': selection, 'request': self.request}
+        return LessonDetailSerializer(instance, context=context).data
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -113,7 +150,10 @@ class LessonDetailView(generics.RetrieveUpdateDestroyAPIView):
         partial = kwargs.pop('partial', False)
         serializer = LessonUpdateSerializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        with transaction.atomic():
+            serializer.save()
+            if 'video_file' in serializer.validated_data:
+                enqueue_lesson_video(instance)
         return Response({
             'success': True,
             'message': 'Lesson updated successfully.',
@@ -127,14 +167,109 @@ class LessonDetailView(generics.RetrieveUpdateDestroyAPIView):
                 {'success': False, 'error': {'message': 'Only the course teacher can delete lessons.'}},
                 status=status.HTTP_403_FORBIDDEN,
             )
-        instance.soft_delete()
+        with transaction.atomic():
+            instance.soft_delete()
+            Course.adjust_counters(instance.course_id, lesson_count=-1)
         return Response({'success': True, 'message': 'Lesson deleted successfully.'})
 
 
+def _accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip, honouring q-values (`gzip;q=0` refuses it)."""
+    gzip_q = any_q = None
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            gzip_q = q if gzip_q is None else max(gzip_q, q)
+        elif coding == '*':
+            any_q = q
+    q = gzip_q if gzip_q is not None else any_q
+    return bool(q and q > 0)
+
+
+class LessonContentView(APIView):
+    """
+    GET /api/v1/lessons/<id>/content/[?section=<index or anchor>]
+    Sanitized lesson HTML, whole or one section (see content_sections on the
+    lesson detail). Honours If-None-Match, single `Range: bytes=` requests
+    (206, with If-Range) and Accept-Encoding: gzip for unranged responses.
+    """
+    permission_classes = [IsAuthenticated, IsCourseMember]
+
+    def get(self, request, id):
+        # content is only read when the rendered cache entry is missing.
+        lesson = get_object_or_404(Lesson.objects.defer('content'), id=id)
+        self.check_object_permissions(request, lesson)
+
+        section_key = request.query_params.get('section')
+        # Ranges always apply to the identity body; the coding is part of the
+        # ETag so gzip and identity bodies never validate against each other.
+        byte_range_header = request.headers.get('Range')
+        gzipped = not byte_range_header and _accepts_gzip(request.headers.get('Accept-Encoding', ''))
+        etag = make_etag(lesson.pk, lesson.updated_at, section_key, 'gzip' if gzipped else 'identity')
+        if request.headers.get('If-Range', etag) != etag:
+            # The client's partial copy is outdated: send the whole body.
+            byte_range_header = None
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self._content_response(lesson, section_key, byte_range_header, gzipped)
+        if response.status_code in (200, 206, 304):
+            response.headers['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization', 'Accept-Encoding'])
+        return response
+
+    def _content_response(self, lesson, section_key, byte_range_header, gzipped):
+        rendered = get_rendered_content(lesson)
+        section = None
+        if section_key is not None:
+            section = rendered.find_section(section_key)
+            if section is None:
+                return Response(
+                    {'success': False, 'error': {'message': 'Section not found.'}},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+        length = rendered.length if section is None else section['end'] - section['start']
+
+        try:
+            byte_range = parse_byte_range(byte_range_header, length)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response.headers['Content-Range'] = f'bytes */{length}'
+            return response
+
+        if gzipped and section is None:
+            response = HttpResponse(rendered.compressed, content_type='text/html; charset=utf-8')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            body = rendered.html_bytes() if section is None else rendered.section_bytes(section)
+            if byte_range is not None:
+                start, end = byte_range
+                response = HttpResponse(body[start:end + 1], content_type='text/html; charset=utf-8', status=206)
+                response.headers['Content-Range'] = content_range(start, end, length)
+            elif gzipped:
+                response = HttpResponse(gzip.compress(body, compresslevel=6), content_type='text/html; charset=utf-8')
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = HttpResponse(body, content_type='text/html; charset=utf-8')
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
+
+
 class ReorderLessonsView(APIView):
     """
     POST /api/v1/lessons/reorder/
     Accepts { "course_id": "...", "order": ["lesson-id-1", "lesson-id-2", ...] }
+    `order` must list every lesson of the course exactly once. Returns the
+    new syllabus.
     """
     permission_classes = [IsAuthenticated, IsTeacher]
 
@@ -142,22 +277,53 @@ class ReorderLessonsView(APIView):
         course_id = request.data.get('course_id')
         order = request.data.get('order', [])
 
-        if not course_id or not order:
+        if not course_id or not order or not isinstance(order, list):
             return Response(
                 {'success': False, 'error': {'message': 'course_id and order are required.'}},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        from apps.courses.models import Course
         try:
             course = Course.objects.get(id=course_id, teacher=request.user)
-        except Course.DoesNotExist:
+        except (Course.DoesNotExist, ValidationError):
             return Response(
                 {'success': False, 'error': {'message': 'Course not found.'}},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        for idx, lesson_id in enumerate(order, start=1):
-            Lesson.objects.filter(id=lesson_id, course=course).update(sequence_number=idx)
+        with transaction.atomic():
+            rows = list(
+                Lesson.all_objects.select_for_update()
+                .filter(course=course)
+                .order_by('sequence_number')
+                .values_list('id', 'sequence_number', 'is_deleted')
+            )
+            active = {str(pk) for pk, _, is_deleted in rows if not is_deleted}
+            order = [str(lesson_id) for lesson_id in order]
+            if len(order) != len(set(order)) or set(order) != active:
+                return Response({
+                    'success': False,
+                    'error': {
+                        'message': 'order must list every lesson of the course exactly once.',
+                        'details': {
+                            'missing': sorted(active - set(order)),
+                            'unknown': sorted(set(order) - active),
+                        },
+                    },
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            numbering = {lesson_id: number for number, lesson_id in enumerate(order, start=1)}
+            # Soft-deleted lessons still hold numbers; keep them after the live ones.
+            deleted = [pk for pk, _, is_deleted in rows if is_deleted]
+            numbering.update({pk: number for number, pk in enumerate(deleted, start=len(order) + 1)})
+            Lesson.renumber(course.id, numbering, offset=max(seq for _, seq, _ in rows) + 1)
 
-        return Response({'success': True, 'message': 'Lessons reordered successfully.'})
+        context = {'request': request}
+        syllabus = LessonListSerializer(context=context).optimize_queryset(
+            Lesson.objects.filter(course=course).order_by('sequence_number')
+        )
+        return Response({
+            'success': True,
+            'message': 'Lessons reordered successfully.',
+            'data': LessonListSerializer(syllabus, many=True, context=context).data,
+        })
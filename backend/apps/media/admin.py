@@ -0,0 +1,16 @@
+from django.contrib import admin
+from .models import MediaFile, VideoEncoding
+
+@admin.register(MediaFile)
+class MediaFileAdmin(admin.ModelAdmin):
+    list_display = ('original_name', 'owner', 'category', 'media_type', 'size', 'created_at')
+    list_filter = ('category', 'media_type')
+    search_fields = ('original_name', 'owner__email')
+    raw_id_fields = ('owner', 'course')
+
+@admin.register(VideoEncoding)
+class VideoEncodingAdmin(admin.ModelAdmin):
+    list_display = ('lesson', 'status', 'duration_seconds', 'height', 'started_at', 'finished_at')
+    list_filter = ('status',)
+    search_fields = ('lesson__title',)
+    readonly_fields = ('renditions', 'error')
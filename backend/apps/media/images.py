@@ -0,0 +1,180 @@
+"""
+Responsive variants for course covers and profile images.
+
+Course.save() and User.save() call enqueue_image_variants() whenever the
+cover or profile image name changes (image_changed()), whatever saved it:
+API, admin or shell. It clears the stored variants and queues
+generate_image_variants on commit. The task decodes the upload once with Pillow and writes a WebP and a
+JPEG at each configured width next to the original, e.g.
+course_covers/2026/05/cover_w640.webp. Widths at or above the source width
+are skipped; a source narrower than every width gets one variant at its own
+width. The variant names are stored on the model as
+{'webp': {'320': name, ...}, 'jpeg': {...}}, and image_srcset() turns them
+into `srcset` strings for the API.
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {
+    # key: (Pillow format, extension, save options)
+    'webp': ('WEBP', 'webp', {'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'optimize': True, 'progressive': True}),
+}
+
+
+def _targets():
+    from apps.courses.models import Course
+    from apps.users.models import User
+
+    return {
+        # target: (model, image field, variants field, widths setting)
+        'course-cover': (Course, 'cover_image', 'cover_image_variants', settings.COURSE_COVER_VARIANT_WIDTHS),
+        'profile-image': (User, 'profile_image', 'profile_image_variants', settings.PROFILE_IMAGE_VARIANT_WIDTHS),
+    }
+
+
+def parse_widths(spec):
+    """'320,640,1280' -> [320, 640, 1280]."""
+    return sorted({int(item) for item in spec.split(',') if item.strip()})
+
+
+def select_widths(widths, source_width):
+    chosen = [width for width in widths if width < source_width]
+    return chosen or [source_width]
+
+
+def variant_name(source_name, width, extension):
+    stem = os.path.splitext(source_name)[0]
+    return f'{stem}_w{width}.{extension}'
+
+
+def image_srcset(image, variants):
+    """
+    {'src': original url, 'webp': 'url 320w, url 640w', 'jpeg': ...} for an
+    image field, or None without an image. Formats without variants yet are
+    omitted, so clients fall back to `src`.
+    """
+    if not image:
+        return None
+    storage = image.storage
+    data = {'src': image.url}
+    for key in FORMATS:
+        names = (variants or {}).get(key) or {}
+        if names:
+            data[key] = ', '.join(
+                f'{storage.url(name)} {width}w'
+                for width, name in sorted(names.items(), key=lambda item: int(item[0]))
+            )
+    return data
+
+
+def _delete_variants(storage, variants):
+    for names in (variants or {}).values():
+        for name in names.values():
+            storage.delete(name)
+
+
+def image_changed(instance, field_name, update_fields):
+    """
+    Whether saving `instance` with `update_fields` writes an image name that
+    differs from the stored one. Call before the save; costs one query when
+    the field is written on an existing row.
+    """
+    if update_fields is not None and field_name not in update_fields:
+        return False
+    if field_name in instance.get_deferred_fields():
+        return False
+    name = getattr(instance, field_name).name or ''
+    if instance._state.adding:
+        return bool(name)
+    stored = type(instance)._base_manager.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+    return (stored or '') != name
+
+
+def enqueue_image_variants(instance, target):
+    """Clear `instance`'s stored variants and queue generation after commit."""
+    from .tasks import generate_image_variants
+
+    model, image_field, variants_field, _ = _targets()[target]
+    image = getattr(instance, image_field)
+    old = model._base_manager.filter(pk=instance.pk).values_list(variants_field, flat=True).first()
+    model._base_manager.filter(pk=instance.pk).update(**{variants_field: {}})
+    setattr(instance, variants_field, {})
+    if old:
+        storage = image.storage
+        transaction.on_commit(lambda: _delete_variants(storage, old))
+    if image:
+        name = image.name
+        transaction.on_commit(lambda: generate_image_variants.delay(target, str(instance.pk), name))
+
+
+def render_variants(fh, widths):
+    """{format key: {width: bytes}} for an image file object."""
+    from PIL import Image, ImageOps
+
+    with Image.open(fh) as source:
+        image = ImageOps.exif_transpose(source)
+        image.load()
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    rendered = {key: {} for key in FORMATS}
+    for width in select_widths(widths, image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for key, (pil_format, _, options) in FORMATS.items():
+            frame = resized
+            if pil_format == 'JPEG' and has_alpha:
+                # JPEG has no alpha: flatten onto white.
+                frame = Image.new('RGB', resized.size, (255, 255, 255))
+                frame.paste(resized, mask=resized.getchannel('A'))
+            buffer = BytesIO()
+            frame.save(buffer, pil_format, quality=settings.IMAGE_VARIANT_QUALITY, **options)
+            rendered[key][width] = buffer.getvalue()
+    return rendered
+
+
+def generate_image_variants(target, pk, source_name):
+    """Write variants for `source_name` and store their names; returns them, or None when superseded."""
+    from PIL import Image
+
+    model, image_field, variants_field, widths_spec = _targets()[target]
+    instance = model._base_manager.filter(pk=pk).first()
+    if instance is None or getattr(instance, image_field).name != source_name:
+        return None
+    image = getattr(instance, image_field)
+    storage = image.storage
+
+    try:
+        with storage.open(source_name, 'rb') as fh:
+            rendered = render_variants(fh, parse_widths(widths_spec))
+    except (OSError, Image.DecompressionBombError) as e:
+        logger.warning(f"Image variants failed for {target} {pk}: {e}")
+        return None
+
+    variants = {key: {} for key in FORMATS}
+    for key, by_width in rendered.items():
+        extension = FORMATS[key][1]
+        for width, content in by_width.items():
+            variants[key][str(width)] = storage.save(variant_name(source_name, width, extension), ContentFile(content))
+
+    # Only store them if the image was not replaced while we worked.
+    updated = model._base_manager.filter(pk=pk, **{image_field: source_name}).update(
+        **{variants_field: variants}, updated_at=timezone.now()
+    )
+    if not updated:
+        _delete_variants(storage, variants)
+        return None
+    if target == 'course-cover':
+        from apps.courses.catalog import bump_catalog_version
+
+        bump_catalog_version()
+    return variants
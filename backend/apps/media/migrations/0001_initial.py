@@ -0,0 +1,156 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:06
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("lessons", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VideoEncoding",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("source_name", models.CharField(max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("probing", "Probing"),
+                            ("encoding", "Encoding"),
+                            ("ready", "Ready"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("duration_seconds", models.FloatField(blank=True, null=True)),
+                ("width", models.PositiveIntegerField(blank=True, null=True)),
+                ("height", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "video_codec",
+                    models.CharField(blank=True, default="", max_length=50),
+                ),
+                ("has_audio", models.BooleanField(default=False)),
+                (
+                    "renditions",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="[{name, width, height, bandwidth}]",
+                    ),
+                ),
+                (
+                    "master_playlist",
+                    models.CharField(
+                        blank=True, default="", help_text="Storage path", max_length=255
+                    ),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "lesson",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="encoding",
+                        to="lessons.lesson",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "video_encodings",
+            },
+        ),
+        migrations.CreateModel(
+            name="MediaFile",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("file", models.FileField(upload_to="uploads/%Y/%m/")),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("profile", "Profile"),
+                            ("course-cover", "Course Cover"),
+                            ("lesson-video", "Lesson Video"),
+                            ("course-file", "Course File"),
+                            ("announcement", "Announcement"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "media_type",
+                    models.CharField(
+                        choices=[
+                            ("image", "Image"),
+                            ("video", "Video"),
+                            ("file", "File"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "original_name",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(
+                        default=0, help_text="Size in bytes"
+                    ),
+                ),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="media_files",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "media_files",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["owner", "-created_at"],
+                        name="media_files_owner_i_fdff9a_idx",
+                    )
+                ],
+            },
+        ),
+    ]
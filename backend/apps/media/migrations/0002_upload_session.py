@@ -0,0 +1,91 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:07
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "target",
+                    models.CharField(
+                        choices=[
+                            ("lesson-video", "Lesson Video"),
+                            ("lesson-attachment", "Lesson Attachment"),
+                            ("announcement-attachment", "Announcement Attachment"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("target_id", models.UUIDField()),
+                ("filename", models.CharField(max_length=255)),
+                (
+                    "length",
+                    models.PositiveBigIntegerField(help_text="Declared size in bytes"),
+                ),
+                (
+                    "offset",
+                    models.PositiveBigIntegerField(
+                        default=0, help_text="Bytes received"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("uploading", "Uploading"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="uploading",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "stored_name",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Final storage path",
+                        max_length=255,
+                    ),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                ("expires_at", models.DateTimeField(db_index=True)),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "upload_sessions",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-17 01:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0007_counters_not_editable"),
+        ("media", "0002_upload_session"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mediafile",
+            name="course",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Course whose members may read the file (course content categories)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="media_files",
+                to="courses.course",
+            ),
+        ),
+    ]
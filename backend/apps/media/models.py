@@ -0,0 +1,148 @@
+"""
+Media models - User uploads and lesson video encoding jobs.
+"""
+from django.conf import settings
+from django.db import models
+from apps.core.models import TimeStampedModel
+
+
+class MediaFile(TimeStampedModel):
+    """A file uploaded through /api/v1/media/upload/."""
+
+    class CategoryChoices(models.TextChoices):
+        PROFILE = 'profile', 'Profile'
+        COURSE_COVER = 'course-cover', 'Course Cover'
+        LESSON_VIDEO = 'lesson-video', 'Lesson Video'
+        COURSE_FILE = 'course-file', 'Course File'
+        ANNOUNCEMENT = 'announcement', 'Announcement'
+
+    # Public like the profile/cover image fields they are used for.
+    PUBLIC_CATEGORIES = (CategoryChoices.PROFILE, CategoryChoices.COURSE_COVER)
+    # Read by the members of `course`; lesson videos and files must name one.
+    COURSE_CATEGORIES = (CategoryChoices.LESSON_VIDEO, CategoryChoices.COURSE_FILE, CategoryChoices.ANNOUNCEMENT)
+
+    class TypeChoices(models.TextChoices):
+        IMAGE = 'image', 'Image'
+        VIDEO = 'video', 'Video'
+        FILE = 'file', 'File'
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='media_files',
+    )
+    file = models.FileField(upload_to='uploads/%Y/%m/')
+    category = models.CharField(max_length=20, choices=CategoryChoices.choices)
+    course = models.ForeignKey(
+        'courses.Course',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='media_files',
+        help_text='Course whose members may read the file (course content categories)',
+    )
+    media_type = models.CharField(max_length=10, choices=TypeChoices.choices)
+    original_name = models.CharField(max_length=255, blank=True, default='')
+    size = models.PositiveBigIntegerField(default=0, help_text='Size in bytes')
+
+    class Meta:
+        db_table = 'media_files'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['owner', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.owner_id} - {self.original_name or self.file.name}"
+
+
+class VideoEncoding(TimeStampedModel):
+    """
+    Probe and HLS transcode state for a lesson's video_file. One row per
+    lesson, reset whenever a new video is uploaded; `source_name` is the
+    video_file name the job was queued for, so stale jobs can bail out.
+    """
+
+    class StatusChoices(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROBING = 'probing', 'Probing'
+        ENCODING = 'encoding', 'Encoding'
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'
+
+    lesson = models.OneToOneField(
+        'lessons.Lesson',
+        on_delete=models.CASCADE,
+        related_name='encoding',
+    )
+    source_name = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+        db_index=True,
+    )
+    duration_seconds = models.FloatField(null=True, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    video_codec = models.CharField(max_length=50, blank=True, default='')
+    has_audio = models.BooleanField(default=False)
+    renditions = models.JSONField(default=list, blank=True, help_text='[{name, width, height, bandwidth}]')
+    master_playlist = models.CharField(max_length=255, blank=True, default='', help_text='Storage path')
+    error = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'video_encodings'
+
+    def __str__(self):
+        return f"{self.lesson_id} - {self.status}"
+
+    @property
+    def is_ready(self):
+        return self.status == self.StatusChoices.READY and bool(self.master_playlist)
+
+
+class UploadSession(TimeStampedModel):
+    """
+    A resumable (tus-style) upload. Bytes are appended to a partial file in
+    RESUMABLE_UPLOAD_DIR; when `offset` reaches `length` the file is attached
+    to the target's FileField.
+    """
+
+    class TargetChoices(models.TextChoices):
+        LESSON_VIDEO = 'lesson-video', 'Lesson Video'
+        LESSON_ATTACHMENT = 'lesson-attachment', 'Lesson Attachment'
+        ANNOUNCEMENT_ATTACHMENT = 'announcement-attachment', 'Announcement Attachment'
+
+    class StatusChoices(models.TextChoices):
+        UPLOADING = 'uploading', 'Uploading'
+        COMPLETED = 'completed', 'Completed'
+        FAILED = 'failed', 'Failed'
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions',
+    )
+    target = models.CharField(max_length=30, choices=TargetChoices.choices)
+    target_id = models.UUIDField()
+    filename = models.CharField(max_length=255)
+    length = models.PositiveBigIntegerField(help_text='Declared size in bytes')
+    offset = models.PositiveBigIntegerField(default=0, help_text='Bytes received')
+    status = models.CharField(
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.UPLOADING,
+    )
+    stored_name = models.CharField(max_length=255, blank=True, default='', help_text='Final storage path')
+    error = models.TextField(blank=True, default='')
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'upload_sessions'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.length})"
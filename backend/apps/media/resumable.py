@@ -0,0 +1,288 @@
+"""
+Resumable uploads (tus 1.0 core with the creation, checksum, termination and
+expiration extensions).
+
+    POST   /api/v1/media/uploads/       Upload-Length, Upload-Metadata -> 201 + Location
+    HEAD   /api/v1/media/uploads/<id>/  -> Upload-Offset / Upload-Length
+    PATCH  /api/v1/media/uploads/<id>/  Upload-Offset, optional Upload-Checksum,
+                                        application/offset+octet-stream body
+    DELETE /api/v1/media/uploads/<id>/  abandon the upload
+
+Upload-Metadata carries base64 `filename`, `target` (UploadSession.TargetChoices)
+and `target_id`. PATCH bodies are streamed to the partial file in
+CHUNK_READ_SIZE reads, so memory use does not depend on chunk size. With an
+Upload-Checksum the chunk is hashed as it is written and rolled back (460)
+on mismatch. The final chunk links the file into the target's FileField and
+saves the target in one transaction; a lesson video is then queued for
+encoding. The partial file and the file it replaces are only removed once
+that transaction commits, so a failed save loses nothing.
+"""
+import base64
+import binascii
+import fcntl
+import hashlib
+import os
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.utils import timezone
+
+from .models import UploadSession
+from .video import enqueue_lesson_video
+
+TUS_VERSION = '1.0.0'
+TUS_EXTENSIONS = 'creation,checksum,termination,expiration'
+CHECKSUM_ALGORITHMS = {'sha1': hashlib.sha1, 'md5': hashlib.md5, 'sha256': hashlib.sha256}
+CHUNK_READ_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    """A protocol error, surfaced as `status` with `message`."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _targets():
+    from apps.announcements.models import Announcement
+    from apps.lessons.models import Lesson
+
+    Targets = UploadSession.TargetChoices
+    documents = settings.ALLOWED_DOCUMENT_TYPES + settings.ALLOWED_IMAGE_TYPES
+    return {
+        # target: (model, field name, allowed extensions, owner check)
+        Targets.LESSON_VIDEO: (
+            Lesson, 'video_file', settings.ALLOWED_VIDEO_TYPES,
+            lambda obj, user: obj.course.teacher_id == user.id,
+        ),
+        Targets.LESSON_ATTACHMENT: (
+            Lesson, 'attachment', documents,
+            lambda obj, user: obj.course.teacher_id == user.id,
+        ),
+        Targets.ANNOUNCEMENT_ATTACHMENT: (
+            Announcement, 'attachment', documents,
+            lambda obj, user: obj.teacher_id == user.id,
+        ),
+    }
+
+
+def parse_metadata(header):
+    """Upload-Metadata ('key b64value,key b64value') as a dict of str."""
+    metadata = {}
+    for pair in (header or '').split(','):
+        pair = pair.strip()
+        if not pair:
+            continue
+        key, _, value = pair.partition(' ')
+        try:
+            metadata[key] = base64.b64decode(value.strip(), validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            raise UploadError(f'Upload-Metadata value for "{key}" is not valid base64.')
+    return metadata
+
+
+def parse_checksum(header):
+    """Upload-Checksum ('sha1 <base64 digest>') as (hash object, expected digest), or None."""
+    if not header:
+        return None
+    algorithm, _, encoded = header.strip().partition(' ')
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise UploadError(f'Unsupported checksum algorithm "{algorithm}".')
+    try:
+        expected = base64.b64decode(encoded.strip(), validate=True)
+    except binascii.Error:
+        raise UploadError('Upload-Checksum digest is not valid base64.')
+    return CHECKSUM_ALGORITHMS[algorithm](), expected
+
+
+def partial_path(session):
+    return os.path.join(settings.RESUMABLE_UPLOAD_DIR, f'{session.pk}.part')
+
+
+def _load_target(target, target_id, user, lock=False):
+    model, field_name, extensions, is_owner = _targets()[target]
+    queryset = model.objects.select_related(*(['course'] if hasattr(model, 'course') else []))
+    if lock:
+        queryset = queryset.select_for_update(of=('self',))
+    obj = queryset.filter(pk=target_id).first()
+    if obj is None:
+        raise UploadError('Upload target not found.', status=404)
+    if not is_owner(obj, user):
+        raise UploadError('You can only upload files to your own content.', status=403)
+    return obj, field_name, extensions
+
+
+def create_session(user, length_header, metadata_header):
+    try:
+        length = int(length_header)
+    except (TypeError, ValueError):
+        raise UploadError('Upload-Length is required.')
+    if length < 0:
+        raise UploadError('Upload-Length must not be negative.')
+    if length > settings.RESUMABLE_UPLOAD_MAX_SIZE:
+        raise UploadError('Upload exceeds the maximum size.', status=413)
+
+    metadata = parse_metadata(metadata_header)
+    filename = os.path.basename(metadata.get('filename', '')).strip()
+    target = metadata.get('target', '')
+    if not filename:
+        raise UploadError('Upload-Metadata must include filename.')
+    if target not in UploadSession.TargetChoices.values:
+        raise UploadError(f"target must be one of: {', '.join(UploadSession.TargetChoices.values)}.")
+    try:
+        target_id = uuid.UUID(metadata.get('target_id', ''))
+    except ValueError:
+        raise UploadError('Upload-Metadata must include a valid target_id.')
+    _, _, extensions = _load_target(target, target_id, user)
+    extension = os.path.splitext(filename)[1].lstrip('.').lower()
+    if extension not in extensions:
+        raise UploadError(f'.{extension} files are not allowed for {target} uploads.')
+
+    session = UploadSession.objects.create(
+        owner=user,
+        target=target,
+        target_id=target_id,
+        filename=filename[:255],
+        length=length,
+        expires_at=timezone.now() + timedelta(hours=settings.RESUMABLE_UPLOAD_EXPIRY_HOURS),
+    )
+    os.makedirs(settings.RESUMABLE_UPLOAD_DIR, exist_ok=True)
+    open(partial_path(session), 'wb').close()
+    if length == 0:
+        complete(session)
+    return session
+
+
+def append_chunk(session, stream, offset_header, content_length, checksum_header):
+    """
+    Write one PATCH body of `content_length` bytes from `stream` at the
+    session's offset; returns the new offset. Without a checksum, a body cut
+    short keeps the bytes that arrived, so the client resumes from there.
+    """
+    if session.status != UploadSession.StatusChoices.UPLOADING:
+        raise UploadError('This upload is already finished.', status=403)
+    if session.expires_at <= timezone.now():
+        raise UploadError('This upload has expired.', status=410)
+    try:
+        offset = int(offset_header)
+    except (TypeError, ValueError):
+        raise UploadError('Upload-Offset is required.')
+    checksum = parse_checksum(checksum_header)
+    if content_length > session.length - offset:
+        raise UploadError('The chunk runs past Upload-Length.', status=413)
+
+    with open(partial_path(session), 'r+b') as fh:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadError('Another request is writing to this upload.', status=423)
+        # Re-read under the lock: a concurrent PATCH may have just finished.
+        current, status = UploadSession.objects.values_list('offset', 'status').get(pk=session.pk)
+        if status != UploadSession.StatusChoices.UPLOADING:
+            raise UploadError('This upload is already finished.', status=403)
+        session.offset = current
+        if offset != current:
+            raise UploadError(f'Upload-Offset {offset} does not match the current offset {current}.', 409)
+        fh.seek(offset)
+        written = 0
+        while written < content_length:
+            chunk = stream.read(min(CHUNK_READ_SIZE, content_length - written))
+            if not chunk:
+                break
+            fh.write(chunk)
+            if checksum:
+                checksum[0].update(chunk)
+            written += len(chunk)
+        if checksum and (written != content_length or checksum[0].digest() != checksum[1]):
+            # Unverified bytes are discarded; the client resends the chunk.
+            fh.truncate(offset)
+            raise UploadError('Checksum mismatch.', status=460)
+        fh.truncate(offset + written)
+        fh.flush()
+        os.fsync(fh.fileno())
+        UploadSession.objects.filter(pk=session.pk).update(offset=offset + written, updated_at=timezone.now())
+        session.offset = offset + written
+        if session.offset == session.length:
+            # Still under the lock, so a racing PATCH cannot attach twice.
+            complete(session)
+    return session.offset
+
+
+def _copy_into_storage(path, field, instance, filename):
+    """Add the finished file to the field's storage, leaving `path` in place; returns the stored name."""
+    storage = field.storage
+    name = field.generate_filename(instance, filename)
+    if isinstance(storage, FileSystemStorage):
+        while True:
+            name = storage.get_available_name(name, max_length=field.max_length)
+            destination = storage.path(name)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            try:
+                # A hard link: no copy, and never overwrites a concurrent upload.
+                os.link(path, destination)
+                break
+            except FileExistsError:
+                continue
+        return name
+    with open(path, 'rb') as fh:
+        return storage.save(name, File(fh), max_length=field.max_length)
+
+
+def _discard(path, storage, replaced):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    if replaced:
+        storage.delete(replaced)
+
+
+def complete(session):
+    """
+    Attach the finished file to its target, atomically with the target's
+    save. Until that commits, the partial file stays the only copy.
+    """
+    path = partial_path(session)
+    stored = None
+    try:
+        with transaction.atomic():
+            obj, field_name, _ = _load_target(session.target, session.target_id, session.owner, lock=True)
+            field = obj._meta.get_field(field_name)
+            replaced = getattr(obj, field_name).name
+            stored = _copy_into_storage(path, field, obj, session.filename)
+            setattr(obj, field_name, stored)
+            obj.save(update_fields=[field_name, 'updated_at'])
+            transaction.on_commit(lambda: _discard(path, field.storage, replaced))
+            UploadSession.objects.filter(pk=session.pk).update(
+                status=UploadSession.StatusChoices.COMPLETED, stored_name=stored, updated_at=timezone.now()
+            )
+            if session.target == UploadSession.TargetChoices.LESSON_VIDEO:
+                enqueue_lesson_video(obj)
+    except Exception as e:
+        # Only the stored copy goes; the partial is kept until the session expires.
+        if stored is not None:
+            field.storage.delete(stored)
+        UploadSession.objects.filter(pk=session.pk).update(
+            status=UploadSession.StatusChoices.FAILED,
+            error=getattr(e, 'message', str(e)),
+            updated_at=timezone.now(),
+        )
+        if isinstance(e, UploadError):
+            raise
+        raise UploadError('The upload could not be attached.', status=500)
+    session.status = UploadSession.StatusChoices.COMPLETED
+    session.stored_name = stored
+
+
+def terminate(session):
+    try:
+        os.unlink(partial_path(session))
+    except FileNotFoundError:
+        pass
+    session.delete()
@@ -0,0 +1,123 @@
+"""
+Media serializers.
+"""
+import os
+
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import MediaFile, VideoEncoding
+from .signing import sign_media_url, signed_url
+
+
+def _allowed_extensions(media_type):
+    return {
+        MediaFile.TypeChoices.IMAGE: settings.ALLOWED_IMAGE_TYPES,
+        MediaFile.TypeChoices.VIDEO: settings.ALLOWED_VIDEO_TYPES,
+        MediaFile.TypeChoices.FILE: settings.ALLOWED_DOCUMENT_TYPES,
+    }[media_type]
+
+
+class SignedFileField(serializers.FileField):
+    """Read-only file URL signed with apps.media.signing, usable without the Authorization header."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        url = signed_url(value.name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+
+class SignedMediaURLField(serializers.URLField):
+    """Read-only URL; links into our MEDIA_URL are signed, external ones are left as they are."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return sign_media_url(value) if value else value
+
+
+class MediaFileSerializer(serializers.ModelSerializer):
+    """An uploaded file; `url` is absolute when a request is in context."""
+    url = serializers.FileField(source='file', read_only=True)
+    type = serializers.CharField(source='media_type', read_only=True)
+
+    class Meta:
+        model = MediaFile
+        fields = ['id', 'url', 'category', 'course', 'type', 'original_name', 'size', 'created_at']
+
+
+class MediaUploadSerializer(serializers.ModelSerializer):
+    """
+    Upload a file. `type` defaults from the file extension. Lesson videos and
+    course files name the `course` whose members may read them; announcement
+    files may (without one they are readable by any signed-in user).
+    """
+    type = serializers.ChoiceField(source='media_type', choices=MediaFile.TypeChoices.choices, required=False)
+
+    class Meta:
+        model = MediaFile
+        fields = ['file', 'category', 'course', 'type']
+
+    def validate_course(self, course):
+        if course is not None and course.teacher_id != self.context['request'].user.id:
+            raise serializers.ValidationError('You can only upload files to your own courses.')
+        return course
+
+    def validate(self, attrs):
+        upload = attrs['file']
+        extension = os.path.splitext(upload.name)[1].lstrip('.').lower()
+        media_type = attrs.get('media_type')
+        if media_type is None:
+            media_type = next(
+                (t for t in MediaFile.TypeChoices.values if extension in _allowed_extensions(t)),
+                MediaFile.TypeChoices.FILE,
+            )
+        if extension not in _allowed_extensions(media_type):
+            raise serializers.ValidationError({'file': f'.{extension} files are not allowed for {media_type} uploads.'})
+        if upload.size > settings.MAX_UPLOAD_SIZE:
+            raise serializers.ValidationError(
+                {'file': f'File exceeds the {settings.MAX_UPLOAD_SIZE // (1024 * 1024)} MB upload limit.'}
+            )
+        category = attrs['category']
+        if category not in MediaFile.COURSE_CATEGORIES:
+            attrs['course'] = None
+        elif attrs.get('course') is None and category != MediaFile.CategoryChoices.ANNOUNCEMENT:
+            raise serializers.ValidationError({'course': f'{category} uploads must name their course.'})
+        attrs['media_type'] = media_type
+        return attrs
+
+    def create(self, validated_data):
+        upload = validated_data['file']
+        return MediaFile.objects.create(
+            owner=self.context['request'].user,
+            original_name=upload.name[:255],
+            size=upload.size,
+            **validated_data,
+        )
+
+
+class VideoEncodingSerializer(serializers.ModelSerializer):
+    """Encoding job status; hls_url is set once the renditions are ready."""
+    hls_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = VideoEncoding
+        fields = [
+            'status', 'hls_url', 'duration_seconds', 'width', 'height', 'video_codec',
+            'renditions', 'error', 'started_at', 'finished_at', 'updated_at',
+        ]
+
+    def get_hls_url(self, obj):
+        if not obj.is_ready:
+            return None
+        url = signed_url(obj.master_playlist)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
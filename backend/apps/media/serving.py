@@ -0,0 +1,212 @@
+"""
+Access-checked media serving with byte ranges.
+
+Every file under MEDIA_ROOT is served through ProtectedMediaView at
+MEDIA_URL. The first path segment decides who may read it:
+
+- course covers and profile images are public;
+- lesson videos, lesson files and HLS renditions need access to the course
+  (enrolled student or owning teacher);
+- announcement attachments need access to their course (global ones are
+  open to any signed-in user);
+- library uploads: profile and course cover uploads are public like the
+  fields they stand in for; lesson videos, course files and announcement
+  files need access to their course (course-less announcement files are open
+  to any signed-in user); the owner and staff can always read their uploads;
+- anything else, including partial resumable uploads, is not served.
+
+A valid signed URL (apps.media.signing) stands in for the checks above, for
+clients that cannot send the Authorization header.
+
+Once allowed, MEDIA_SERVE_MODE picks the transport:
+
+- 'accel': X-Accel-Redirect to MEDIA_ACCEL_REDIRECT_PREFIX, which nginx maps
+  to MEDIA_ROOT in an `internal` location and serves with its own Range,
+  sendfile and caching support;
+- 'sendfile': X-Sendfile with the absolute path (Apache mod_xsendfile,
+  lighttpd);
+- 'django': a FileResponse, answering single `Range: bytes=` requests with
+  206. The file object keeps its fileno, so gunicorn streams it with
+  sendfile() limited to the range length instead of reading through Python.
+"""
+import mimetypes
+import os
+import uuid
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from apps.core.access import get_course_access
+from apps.core.conditional import make_etag
+from apps.core.ranges import RangeNotSatisfiable, content_range, parse_byte_range
+
+from . import signing
+
+# PUBLIC: anyone, publicly cacheable. ALLOWED: this user, privately cacheable.
+PUBLIC, ALLOWED, SIGNED_IN, DENIED = 'public', 'allowed', 'signed_in', 'denied'
+
+SERVED_PREFIXES = ('course_covers', 'profile_images', 'uploads', 'lesson_videos', 'lesson_files', 'hls', 'announcements')
+
+CONTENT_TYPES = {
+    '.m3u8': 'application/vnd.apple.mpegurl',
+    '.ts': 'video/mp2t',
+}
+
+
+def _course_rule(course_id, user):
+    if course_id is None:
+        return DENIED
+    if not user.is_authenticated:
+        return SIGNED_IN
+    if user.is_staff or get_course_access(user).can_view(course_id):
+        return ALLOWED
+    return DENIED
+
+
+def access_rule(path, user, expires=None, signature=None):
+    """
+    PUBLIC, ALLOWED, SIGNED_IN (needs authentication) or DENIED for a
+    MEDIA_ROOT-relative path, or for a signed URL's path, expiry and signature.
+    """
+    from apps.announcements.models import Announcement
+    from apps.lessons.models import Lesson
+
+    from .models import MediaFile
+
+    prefix = path.split('/', 1)[0]
+    if signature is not None:
+        if prefix in SERVED_PREFIXES and signing.verify(path, expires, signature):
+            return ALLOWED
+        return DENIED
+    if prefix in ('course_covers', 'profile_images'):
+        return PUBLIC
+    if prefix == 'uploads':
+        row = MediaFile.objects.filter(file=path).values_list('owner_id', 'category', 'course_id').first()
+        if row is None:
+            return DENIED
+        owner_id, category, course_id = row
+        if category in MediaFile.PUBLIC_CATEGORIES:
+            return PUBLIC
+        if not user.is_authenticated:
+            return SIGNED_IN
+        if owner_id == user.pk:
+            return ALLOWED
+        if category in MediaFile.COURSE_CATEGORIES:
+            if course_id is not None:
+                return _course_rule(course_id, user)
+            if category == MediaFile.CategoryChoices.ANNOUNCEMENT:
+                return ALLOWED
+        return ALLOWED if user.is_staff else DENIED
+    if prefix in ('lesson_videos', 'lesson_files'):
+        field = 'video_file' if prefix == 'lesson_videos' else 'attachment'
+        course_id = Lesson.objects.filter(**{field: path}).values_list('course_id', flat=True).first()
+        return _course_rule(course_id, user)
+    if prefix == 'hls':
+        try:
+            lesson_id = uuid.UUID(path.split('/')[1])
+        except (IndexError, ValueError):
+            return DENIED
+        course_id = Lesson.objects.filter(pk=lesson_id).values_list('course_id', flat=True).first()
+        return _course_rule(course_id, user)
+    if prefix == 'announcements':
+        row = Announcement.objects.filter(attachment=path).values_list('pk', 'course_id').first()
+        if row is None:
+            return DENIED
+        if row[1] is None:
+            return ALLOWED if user.is_authenticated else SIGNED_IN
+        return _course_rule(row[1], user)
+    return DENIED
+
+
+def resolve(path):
+    """Absolute path of an existing file under MEDIA_ROOT, or None."""
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except (SuspiciousFileOperation, ValueError):
+        return None
+    return full_path if os.path.isfile(full_path) else None
+
+
+def content_type_for(path):
+    extension = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(extension) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+class _RangeFile:
+    """Read at most `length` bytes from `fh`'s current position; keeps fileno() for sendfile."""
+
+    def __init__(self, fh, length):
+        self._fh = fh
+        self._remaining = length
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        size = self._remaining if size is None or size < 0 else min(size, self._remaining)
+        data = self._fh.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._fh.fileno()
+
+    def close(self):
+        self._fh.close()
+
+
+def serve(request, path, full_path, public):
+    stat = os.stat(full_path)
+    etag = make_etag(path, stat.st_size, stat.st_mtime_ns)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _file_response(request, path, full_path, stat.st_size, etag, last_modified)
+    response.headers['ETag'] = etag
+    response.headers['Last-Modified'] = http_date(last_modified)
+    if public:
+        patch_cache_control(response, public=True, max_age=settings.MEDIA_PUBLIC_MAX_AGE)
+    else:
+        patch_cache_control(response, private=True, max_age=settings.MEDIA_PRIVATE_MAX_AGE)
+    return response
+
+
+def _file_response(request, path, full_path, size, etag, last_modified):
+    content_type = content_type_for(path)
+    mode = settings.MEDIA_SERVE_MODE
+    if mode == 'accel':
+        response = HttpResponse(content_type=content_type)
+        response.headers['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(path)
+        return response
+    if mode == 'sendfile':
+        response = HttpResponse(content_type=content_type)
+        response.headers['X-Sendfile'] = full_path
+        return response
+
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    # A stale If-Range means the client's partial copy is outdated: send everything.
+    if not if_range or if_range in (etag, http_date(last_modified)):
+        try:
+            byte_range = parse_byte_range(request.headers.get('Range'), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response.headers['Content-Range'] = f'bytes */{size}'
+            return response
+
+    fh = open(full_path, 'rb')
+    if byte_range is None:
+        response = FileResponse(fh, content_type=content_type)
+    else:
+        start, end = byte_range
+        fh.seek(start)
+        response = FileResponse(_RangeFile(fh, end - start + 1), content_type=content_type, status=206)
+        response.headers['Content-Length'] = str(end - start + 1)
+        response.headers['Content-Range'] = content_range(start, end, size)
+    response.headers['Accept-Ranges'] = 'bytes'
+    return response
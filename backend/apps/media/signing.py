@@ -0,0 +1,72 @@
+"""
+Signed media URLs, for clients that cannot send the Authorization header:
+native HLS players (AVPlayer, ExoPlayer) fetching playlists and segments,
+image and video components, downloads.
+
+    {MEDIA_URL}signed/<expires>/<signature>/<path>
+
+The signature is an HMAC (keyed by SECRET_KEY) over the path's scope and the
+expiry timestamp. For HLS output the scope is the job directory
+(hls/<lesson id>/<job>/), so the relative variant playlist and segment URLs in
+master.m3u8 resolve under the same signed prefix; for anything else it is the
+exact path.
+
+Expiries are rounded up to steps of half MEDIA_SIGNED_URL_TTL, so a URL stays
+the same for a while and a URL is valid for between half and all of the TTL.
+Responses embedding signed URLs add current_expiry() to their ETag.
+"""
+import posixpath
+import time
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.http.request import validate_host
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from .video import HLS_DIR
+
+SIGNED_PREFIX = 'signed'
+
+
+def _scope(path):
+    parts = path.split('/')
+    if parts[0] == HLS_DIR and len(parts) > 3:
+        return '/'.join(parts[:3]) + '/'
+    return path
+
+
+def current_expiry(now=None):
+    step = max(1, settings.MEDIA_SIGNED_URL_TTL // 2)
+    now = int(time.time() if now is None else now)
+    return (now // step + 2) * step
+
+
+def signature(path, expires):
+    return salted_hmac('apps.media.signing', f'{_scope(path)}|{expires}', algorithm='sha256').hexdigest()[:32]
+
+
+def signed_url(path, expires=None):
+    """Signed MEDIA_URL-relative URL for a MEDIA_ROOT-relative path."""
+    expires = expires or current_expiry()
+    return f'{settings.MEDIA_URL}{SIGNED_PREFIX}/{expires}/{signature(path, expires)}/{quote(path)}'
+
+
+def sign_media_url(url):
+    """Sign `url` if it points into our MEDIA_URL (absolute or not); other URLs are returned unchanged."""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    if parts.netloc and not validate_host(parts.hostname or '', settings.ALLOWED_HOSTS):
+        return url
+    media_url = settings.MEDIA_URL
+    if not parts.path.startswith(media_url) or parts.path.startswith(f'{media_url}{SIGNED_PREFIX}/'):
+        return url
+    signed = signed_url(unquote(parts.path[len(media_url):]))
+    return urlunsplit((parts.scheme, parts.netloc, signed, '', ''))
+
+
+def verify(path, expires, sig):
+    # Normalised paths only: '..' must not step out of a signed HLS directory.
+    if posixpath.normpath(path) != path or path.startswith('/'):
+        return False
+    return expires >= time.time() and constant_time_compare(sig, signature(path, expires))
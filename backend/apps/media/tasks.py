@@ -0,0 +1,51 @@
+"""
+Media-related Celery tasks.
+"""
+from celery import shared_task
+from django.conf import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(time_limit=settings.MEDIA_TRANSCODE_TIMEOUT + 300)
+def process_lesson_video(lesson_id):
+    """Probe a lesson's uploaded video, fill its duration and encode HLS renditions."""
+    from .video import process_lesson_video as process
+
+    status = process(lesson_id)
+    logger.info(f"Processed video for lesson {lesson_id}: {status or 'superseded'}")
+    return status
+
+
+@shared_task
+def generate_image_variants(target, pk, source_name):
+    """Write the resized WebP/JPEG copies of a course cover or profile image."""
+    from .images import generate_image_variants as generate
+
+    variants = generate(target, pk, source_name)
+    logger.info(f"Image variants for {target} {pk}: {'stored' if variants else 'skipped'}")
+    return bool(variants)
+
+
+@shared_task
+def expire_upload_sessions():
+    """Delete resumable uploads past their expiry, with their partial files."""
+    import os
+
+    from django.utils import timezone
+
+    from .models import UploadSession
+    from .resumable import partial_path
+
+    expired = UploadSession.objects.filter(expires_at__lt=timezone.now())
+    count = 0
+    for session in expired.iterator():
+        try:
+            os.unlink(partial_path(session))
+        except FileNotFoundError:
+            pass
+        count += 1
+    expired.delete()
+    logger.info(f"Expired {count} resumable upload(s).")
+    return count
@@ -0,0 +1,13 @@
+from django.urls import path
+from . import views
+
+app_name = 'media'
+
+urlpatterns = [
+    path('', views.MediaListView.as_view(), name='list'),
+    path('upload/', views.MediaUploadView.as_view(), name='upload'),
+    path('uploads/', views.ResumableUploadCreateView.as_view(), name='upload-create'),
+    path('uploads/<uuid:id>/', views.ResumableUploadDetailView.as_view(), name='upload-detail'),
+    path('<uuid:id>/', views.MediaDetailView.as_view(), name='detail'),
+    path('lessons/<uuid:lesson_id>/encoding/', views.LessonVideoEncodingView.as_view(), name='lesson-encoding'),
+]
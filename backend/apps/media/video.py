@@ -0,0 +1,225 @@
+"""
+Lesson video processing: ffprobe metadata and multi-bitrate HLS.
+
+enqueue_lesson_video() is called whenever a lesson's video_file is saved. It
+resets the lesson's VideoEncoding and queues process_lesson_video on commit;
+when the video was cleared it drops the job and, on commit, its HLS output.
+The task probes the file, fills Lesson.duration when it was left at 0, and
+transcodes it in a single ffmpeg pass (the source is decoded once and scaled
+per rendition) to MEDIA_ROOT/hls/<lesson id>/<job>/, with a master playlist
+for adaptive streaming. Renditions taller than the source are skipped.
+
+Needs ffmpeg/ffprobe on the worker and filesystem storage for MEDIA_ROOT.
+"""
+import json
+import logging
+import math
+import os
+import shutil
+import subprocess
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from .models import VideoEncoding
+
+logger = logging.getLogger(__name__)
+
+HLS_DIR = 'hls'
+
+
+class VideoProcessingError(Exception):
+    pass
+
+
+def parse_renditions(spec):
+    """'1080:5000,720:2800' -> [(1080, 5000), (720, 2800)], tallest first."""
+    renditions = []
+    for item in spec.split(','):
+        if item.strip():
+            height, kbps = item.split(':')
+            renditions.append((int(height), int(kbps)))
+    return sorted(renditions, reverse=True)
+
+
+def select_renditions(source_width, source_height):
+    """[{name, width, height, bitrate}] for the configured ladder, capped at the source height."""
+    ladder = parse_renditions(settings.MEDIA_HLS_RENDITIONS)
+    chosen = [(h, kbps) for h, kbps in ladder if h <= source_height]
+    if not chosen:
+        # Smaller than the lowest rung: one rendition at source size.
+        chosen = [(source_height - source_height % 2, ladder[-1][1])]
+    renditions = []
+    for height, kbps in chosen:
+        width = 2 * round(source_width * height / source_height / 2)
+        renditions.append({'name': f'{height}p', 'width': width, 'height': height, 'bitrate': kbps})
+    return renditions
+
+
+def probe(path):
+    """Duration and stream facts from ffprobe."""
+    command = [
+        settings.MEDIA_FFPROBE_BINARY, '-v', 'error', '-print_format', 'json',
+        '-show_format', '-show_streams', path,
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, check=True, timeout=120)
+        info = json.loads(result.stdout)
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        stderr = getattr(e, 'stderr', None)
+        raise VideoProcessingError(f"ffprobe failed: {stderr.decode(errors='replace')[-2000:] if stderr else e}")
+
+    streams = info.get('streams', [])
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    if video is None:
+        raise VideoProcessingError('No video stream found.')
+    duration = info.get('format', {}).get('duration') or video.get('duration')
+    return {
+        'duration_seconds': float(duration) if duration else None,
+        'width': int(video.get('width') or 0),
+        'height': int(video.get('height') or 0),
+        'video_codec': video.get('codec_name', ''),
+        'has_audio': any(s.get('codec_type') == 'audio' for s in streams),
+    }
+
+
+def build_hls_command(source, output_dir, renditions, has_audio):
+    """One ffmpeg invocation writing every rendition plus master.m3u8."""
+    segment = settings.MEDIA_HLS_SEGMENT_SECONDS
+    n = len(renditions)
+    graph = f"[0:v]split={n}{''.join(f'[s{i}]' for i in range(n))};" + ';'.join(
+        f"[s{i}]scale=-2:{r['height']}[v{i}]" for i, r in enumerate(renditions)
+    )
+    command = [
+        settings.MEDIA_FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error', '-y',
+        '-i', source, '-filter_complex', graph,
+    ]
+    stream_map = []
+    for i, r in enumerate(renditions):
+        kbps = r['bitrate']
+        command += [
+            '-map', f'[v{i}]', f'-c:v:{i}', 'libx264', f'-b:v:{i}', f'{kbps}k',
+            f'-maxrate:v:{i}', f'{kbps * 107 // 100}k', f'-bufsize:v:{i}', f'{kbps * 2}k',
+        ]
+        if has_audio:
+            command += ['-map', '0:a:0', f'-c:a:{i}', 'aac', f'-b:a:{i}', '128k', f'-ac:a:{i}', '2']
+            stream_map.append(f"v:{i},a:{i},name:{r['name']}")
+        else:
+            stream_map.append(f"v:{i},name:{r['name']}")
+    command += [
+        '-preset', settings.MEDIA_X264_PRESET,
+        # Keyframes on segment boundaries so renditions switch cleanly.
+        '-force_key_frames', f'expr:gte(t,n_forced*{segment})', '-sc_threshold', '0',
+        '-f', 'hls', '-hls_time', str(segment), '-hls_playlist_type', 'vod',
+        '-hls_flags', 'independent_segments',
+        '-hls_segment_filename', os.path.join(output_dir, '%v', 'seg_%05d.ts'),
+        '-master_pl_name', 'master.m3u8',
+        '-var_stream_map', ' '.join(stream_map),
+        os.path.join(output_dir, '%v', 'index.m3u8'),
+    ]
+    return command
+
+
+def transcode(source, output_dir, renditions, has_audio):
+    os.makedirs(output_dir, exist_ok=True)
+    command = build_hls_command(source, output_dir, renditions, has_audio)
+    try:
+        subprocess.run(command, capture_output=True, check=True, timeout=settings.MEDIA_TRANSCODE_TIMEOUT)
+    except (OSError, subprocess.SubprocessError) as e:
+        shutil.rmtree(output_dir, ignore_errors=True)
+        stderr = getattr(e, 'stderr', None)
+        raise VideoProcessingError(f"ffmpeg failed: {stderr.decode(errors='replace')[-2000:] if stderr else e}")
+
+
+def remove_outputs(lesson_id, keep=None):
+    """Delete a lesson's HLS job directories except `keep` (all of them, and the lesson's directory, by default)."""
+    root = default_storage.path(os.path.join(HLS_DIR, str(lesson_id)))
+    if not os.path.isdir(root):
+        return
+    if keep is None:
+        shutil.rmtree(root, ignore_errors=True)
+        return
+    for name in os.listdir(root):
+        if name != keep:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def enqueue_lesson_video(lesson):
+    """Reset the lesson's encoding job and queue processing after commit."""
+    from .tasks import process_lesson_video
+
+    if not lesson.video_file:
+        lesson_id = lesson.pk
+        VideoEncoding.objects.filter(lesson=lesson).delete()
+        transaction.on_commit(lambda: remove_outputs(lesson_id))
+        return None
+    encoding, _ = VideoEncoding.objects.update_or_create(
+        lesson=lesson,
+        defaults={
+            'source_name': lesson.video_file.name,
+            'status': VideoEncoding.StatusChoices.PENDING,
+            'duration_seconds': None, 'width': None, 'height': None,
+            'video_codec': '', 'has_audio': False, 'renditions': [],
+            'master_playlist': '', 'error': '', 'started_at': None, 'finished_at': None,
+        },
+    )
+    transaction.on_commit(lambda: process_lesson_video.delay(str(lesson.pk)))
+    return encoding
+
+
+def _update(encoding, **fields):
+    """Save fields unless a newer upload replaced the job; returns False when stale."""
+    updated = VideoEncoding.objects.filter(pk=encoding.pk, source_name=encoding.source_name).update(
+        updated_at=timezone.now(), **fields
+    )
+    return bool(updated)
+
+
+def process_lesson_video(lesson_id):
+    """Probe and transcode a lesson's current video_file; returns the final status."""
+    from apps.lessons.models import Lesson
+
+    encoding = VideoEncoding.objects.select_related('lesson').filter(lesson_id=lesson_id).first()
+    if encoding is None or encoding.lesson.video_file.name != encoding.source_name:
+        return None
+    lesson = encoding.lesson
+
+    try:
+        source = lesson.video_file.path
+    except NotImplementedError:
+        _update(encoding, status=VideoEncoding.StatusChoices.FAILED,
+                error='HLS encoding needs filesystem media storage.', finished_at=timezone.now())
+        return VideoEncoding.StatusChoices.FAILED
+
+    job = uuid.uuid4().hex[:12]
+    output_dir = default_storage.path(os.path.join(HLS_DIR, str(lesson.pk), job))
+    try:
+        if not _update(encoding, status=VideoEncoding.StatusChoices.PROBING, started_at=timezone.now()):
+            return None
+        facts = probe(source)
+        if not facts['width'] or not facts['height']:
+            raise VideoProcessingError('Could not read the video dimensions.')
+        renditions = select_renditions(facts['width'], facts['height'])
+        if not _update(encoding, status=VideoEncoding.StatusChoices.ENCODING, renditions=renditions, **facts):
+            return None
+        if facts['duration_seconds'] and not lesson.duration:
+            # Lesson.duration is in minutes.
+            Lesson.all_objects.filter(pk=lesson.pk, duration=0).update(
+                duration=max(1, math.ceil(facts['duration_seconds'] / 60)), updated_at=timezone.now()
+            )
+
+        transcode(source, output_dir, renditions, facts['has_audio'])
+        master = os.path.join(HLS_DIR, str(lesson.pk), job, 'master.m3u8')
+        if not _update(encoding, status=VideoEncoding.StatusChoices.READY, master_playlist=master,
+                       finished_at=timezone.now()):
+            shutil.rmtree(output_dir, ignore_errors=True)
+            return None
+        remove_outputs(lesson.pk, keep=job)
+        return VideoEncoding.StatusChoices.READY
+    except VideoProcessingError as e:
+        logger.warning(f"Video processing failed for lesson {lesson.pk}: {e}")
+        _update(encoding, status=VideoEncoding.StatusChoices.FAILED, error=str(e), finished_at=timezone.now())
+        return VideoEncoding.StatusChoices.FAILED
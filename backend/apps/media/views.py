@@ -0,0 +1,268 @@
+"""
+Media views - uploads library, resumable uploads and lesson video encoding status.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import generics, parsers, status
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.core.pagination import StandardPagination
+from apps.core.permissions import IsCourseMember
+from apps.lessons.models import Lesson
+
+from . import resumable, serving
+from .models import MediaFile, UploadSession, VideoEncoding
+from .serializers import MediaFileSerializer, MediaUploadSerializer, VideoEncodingSerializer
+from .video import enqueue_lesson_video
+
+
+class MediaListView(generics.ListAPIView):
+    """
+    GET /api/v1/media/?category=<category>  - The current user's uploads
+    """
+    permission_classes = [IsAuthenticated]
+    pagination_class = StandardPagination
+    serializer_class = MediaFileSerializer
+
+    def get_queryset(self):
+        queryset = MediaFile.objects.filter(owner=self.request.user)
+        category = self.request.query_params.get('category')
+        if category:
+            queryset = queryset.filter(category=category)
+        return queryset
+
+
+class MediaUploadView(APIView):
+    """
+    POST /api/v1/media/upload/  - multipart `file`, `category`, optional `type`
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [parsers.MultiPartParser, parsers.FormParser]
+
+    def post(self, request):
+        serializer = MediaUploadSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        media = serializer.save()
+        data = MediaFileSerializer(media, context={'request': request}).data
+        return Response({
+            'success': True,
+            'message': 'File uploaded successfully.',
+            # Existing clients (courseStore, mediaUpload) read the URL at the top level.
+            'url': data['url'],
+            'data': data,
+        }, status=status.HTTP_201_CREATED)
+
+
+class MediaDetailView(generics.RetrieveDestroyAPIView):
+    """
+    GET    /api/v1/media/<id>/  - Upload detail (owner)
+    DELETE /api/v1/media/<id>/  - Delete the upload and its file (owner)
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = MediaFileSerializer
+    lookup_field = 'id'
+
+    def get_queryset(self):
+        return MediaFile.objects.filter(owner=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response({'success': True, 'data': self.get_serializer(self.get_object()).data})
+
+    def destroy(self, request, *args, **kwargs):
+        media = self.get_object()
+        file = media.file
+        with transaction.atomic():
+            media.delete()
+            transaction.on_commit(lambda: file.delete(save=False))
+        return Response({'success': True, 'message': 'File deleted successfully.'})
+
+
+class LessonVideoEncodingView(APIView):
+    """
+    GET  /api/v1/media/lessons/<lesson_id>/encoding/  - Encoding status (course members)
+    POST /api/v1/media/lessons/<lesson_id>/encoding/  - Re-run probing and encoding (course teacher)
+    """
+    permission_classes = [IsAuthenticated, IsCourseMember]
+
+    def get_lesson(self, request, lesson_id):
+        lesson = get_object_or_404(Lesson.objects.select_related('course'), id=lesson_id)
+        self.check_object_permissions(request, lesson)
+        return lesson
+
+    def get(self, request, lesson_id):
+        lesson = self.get_lesson(request, lesson_id)
+        encoding = VideoEncoding.objects.filter(lesson=lesson).first()
+        if encoding is None:
+            return Response(
+                {'success': False, 'error': {'message': 'This lesson has no uploaded video.'}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response({'success': True, 'data': VideoEncodingSerializer(encoding, context={'request': request}).data})
+
+    def post(self, request, lesson_id):
+        lesson = self.get_lesson(request, lesson_id)
+        if lesson.course.teacher_id != request.user.id:
+            return Response(
+                {'success': False, 'error': {'message': 'Only the course teacher can re-encode lesson videos.'}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        if not lesson.video_file:
+            return Response(
+                {'success': False, 'error': {'message': 'This lesson has no uploaded video.'}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        with transaction.atomic():
+            encoding = enqueue_lesson_video(lesson)
+        return Response({
+            'success': True,
+            'message': 'Video queued for encoding.',
+            'data': VideoEncodingSerializer(encoding, context={'request': request}).data,
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class ProtectedMediaView(APIView):
+    """
+    GET /media/<path>                               - A file from MEDIA_ROOT, after the access
+                                                      checks in apps.media.serving
+    GET /media/signed/<expires>/<signature>/<path>  - The same through a signed URL
+                                                      (apps.media.signing)
+    Supports byte ranges and web-server offload.
+    """
+    permission_classes = [AllowAny]
+    # Players fetch many segments and ranges; the per-user API throttle would cut playback.
+    throttle_classes = []
+
+    def get(self, request, path, expires=None, signature=None):
+        full_path = serving.resolve(path)
+        rule = serving.access_rule(path, request.user, expires, signature) if full_path else serving.DENIED
+        if rule == serving.SIGNED_IN:
+            return Response(
+                {'success': False, 'error': {'message': 'Authentication credentials were not provided.'}},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        if rule == serving.DENIED:
+            # 404 rather than 403, so private file names cannot be probed.
+            return Response(
+                {'success': False, 'error': {'message': 'File not found.'}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return serving.serve(request, path, full_path, public=rule == serving.PUBLIC)
+
+
+def _tus_response(response, session=None):
+    response.headers['Tus-Resumable'] = resumable.TUS_VERSION
+    response.headers['Cache-Control'] = 'no-store'
+    if session is not None:
+        response.headers['Upload-Offset'] = str(session.offset)
+        response.headers['Upload-Length'] = str(session.length)
+        response.headers['Upload-Expires'] = http_date(session.expires_at.timestamp())
+    return response
+
+
+def _upload_error(error, session=None):
+    return _tus_response(Response(
+        {'success': False, 'error': {'message': error.message}}, status=error.status,
+    ), session)
+
+
+def _session_data(session):
+    return {
+        'id': str(session.pk),
+        'target': session.target,
+        'target_id': str(session.target_id),
+        'filename': session.filename,
+        'offset': session.offset,
+        'length': session.length,
+        'status': session.status,
+        'expires_at': session.expires_at,
+    }
+
+
+class ResumableUploadCreateView(APIView):
+    """
+    POST    /api/v1/media/uploads/  - Start a resumable upload (see apps.media.resumable)
+    OPTIONS /api/v1/media/uploads/  - tus capabilities
+    """
+    permission_classes = [IsAuthenticated]
+
+    def options(self, request, *args, **kwargs):
+        response = Response(status=status.HTTP_204_NO_CONTENT)
+        response.headers['Tus-Version'] = resumable.TUS_VERSION
+        response.headers['Tus-Extension'] = resumable.TUS_EXTENSIONS
+        response.headers['Tus-Max-Size'] = str(settings.RESUMABLE_UPLOAD_MAX_SIZE)
+        response.headers['Tus-Checksum-Algorithm'] = ','.join(resumable.CHECKSUM_ALGORITHMS)
+        return _tus_response(response)
+
+    def post(self, request):
+        try:
+            session = resumable.create_session(
+                request.user, request.headers.get('Upload-Length'), request.headers.get('Upload-Metadata'),
+            )
+        except resumable.UploadError as e:
+            return _upload_error(e)
+        response = Response({'success': True, 'data': _session_data(session)}, status=status.HTTP_201_CREATED)
+        response.headers['Location'] = request.build_absolute_uri(
+            reverse('media:upload-detail', kwargs={'id': session.pk})
+        )
+        return _tus_response(response, session)
+
+
+class ResumableUploadDetailView(APIView):
+    """
+    HEAD   /api/v1/media/uploads/<id>/  - Current offset
+    GET    /api/v1/media/uploads/<id>/  - Upload status as JSON
+    PATCH  /api/v1/media/uploads/<id>/  - Append a chunk at Upload-Offset
+    DELETE /api/v1/media/uploads/<id>/  - Abandon the upload
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get_session(self, request, id):
+        return get_object_or_404(UploadSession, pk=id, owner=request.user)
+
+    def head(self, request, id):
+        return _tus_response(Response(status=status.HTTP_200_OK), self.get_session(request, id))
+
+    def get(self, request, id):
+        session = self.get_session(request, id)
+        return _tus_response(Response({'success': True, 'data': _session_data(session)}), session)
+
+    def patch(self, request, id):
+        session = self.get_session(request, id)
+        if request.content_type.split(';')[0].strip() != 'application/offset+octet-stream':
+            return _upload_error(resumable.UploadError(
+                'Content-Type must be application/offset+octet-stream.', status=415,
+            ), session)
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return _upload_error(resumable.UploadError('Content-Length must be an integer.'), session)
+        try:
+            resumable.append_chunk(
+                session,
+                # The raw body, read incrementally; never parsed or buffered whole.
+                request.stream,
+                request.headers.get('Upload-Offset'),
+                content_length,
+                request.headers.get('Upload-Checksum'),
+            )
+        except resumable.UploadError as e:
+            # Upload-Offset tells the client where to resume after 409 and 460.
+            return _upload_error(e, session)
+        if session.status == UploadSession.StatusChoices.COMPLETED:
+            response = Response({
+                'success': True,
+                'message': 'Upload complete.',
+                'data': {**_session_data(session), 'stored_name': session.stored_name},
+            })
+        else:
+            response = Response(status=status.HTTP_204_NO_CONTENT)
+        return _tus_response(response, session)
+
+    def delete(self, request, id):
+        resumable.terminate(self.get_session(request, id))
+        return _tus_response(Response(status=status.HTTP_204_NO_CONTENT))
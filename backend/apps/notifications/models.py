@@ -40,6 +40,7 @@ class Notification(TimeStampedModel):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read', '-created_at']),
+            models.Index(fields=['user', '-created_at', '-id']),
         ]
 
     def __str__(self):
@@ -6,7 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.pagination import StandardPagination
+from apps.core.pagination import KeysetPagination
 
 from .models import Notification, NotificationSetting
 from .serializers import NotificationSerializer, NotificationSettingSerializer
@@ -16,7 +16,7 @@ class NotificationListView(generics.ListAPIView):
     """GET /api/v1/notifications/ - List user's notifications."""
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = StandardPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         queryset = Notification.objects.filter(user=self.request.user)
@@ -60,6 +60,7 @@ class Payment(TimeStampedModel):
             models.Index(fields=['student', 'status']),
             models.Index(fields=['course', 'status']),
             models.Index(fields=['stripe_payment_intent_id']),
+            models.Index(fields=['student', '-created_at', '-id']),
         ]
 
     def __str__(self):
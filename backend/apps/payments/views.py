@@ -9,7 +9,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.pagination import StandardPagination
+from apps.core.access import invalidate_course_access
+from apps.core.pagination import KeysetPagination
 from apps.core.permissions import IsStudent
 from apps.courses.models import Course
 from apps.enrollments.models import Enrollment
@@ -43,14 +44,8 @@ class CreateCheckoutView(APIView):
 
         # Free course — enroll directly
         if course.is_free:
-            enrollment, created = Enrollment.objects.get_or_create(
-                student=request.user, course=course,
-                defaults={'is_active': True},
-            )
-            if not created and not enrollment.is_active:
-                enrollment.is_active = True
-                enrollment.unenrolled_at = None
-                enrollment.save()
+            Enrollment.enroll(student=request.user, course=course)
+            invalidate_course_access(request.user)
 
             CourseProgress.objects.get_or_create(
                 student=request.user, course=course,
@@ -166,13 +161,8 @@ class StripeWebhookView(APIView):
                     payment.save()
 
                 # Create enrollment
-                enrollment, _ = Enrollment.objects.get_or_create(
-                    student_id=student_id, course_id=course_id,
-                    defaults={'is_active': True},
-                )
-                if not enrollment.is_active:
-                    enrollment.is_active = True
-                    enrollment.save()
+                Enrollment.enroll(student_id=student_id, course_id=course_id)
+                invalidate_course_access(student_id)
 
                 CourseProgress.objects.get_or_create(
                     student_id=student_id, course_id=course_id,
@@ -197,7 +187,7 @@ class PaymentHistoryView(generics.ListAPIView):
     """
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = StandardPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-17 00:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quizzes", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["quiz", "-created_at", "-id"],
+                name="quiz_attemp_quiz_id_910dd4_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quizattempt",
+            index=models.Index(
+                fields=["student", "-created_at", "-id"],
+                name="quiz_attemp_student_f0e16e_idx",
+            ),
+        ),
+    ]
@@ -31,6 +31,9 @@ class Quiz(TimeStampedModel):
 
     @property
     def question_count(self):
+        # Quiz list and detail querysets annotate the count instead of a query per quiz.
+        if hasattr(self, 'questions_total'):
+            return self.questions_total
         return self.questions.count()
 
 
@@ -97,6 +100,8 @@ class QuizAttempt(TimeStampedModel):
         indexes = [
             models.Index(fields=['student', 'quiz']),
             models.Index(fields=['quiz', '-completed_at']),
+            models.Index(fields=['quiz', '-created_at', '-id']),
+            models.Index(fields=['student', '-created_at', '-id']),
         ]
 
     def __str__(self):
@@ -2,6 +2,8 @@
 Quiz serializers.
 """
 from rest_framework import serializers
+
+from apps.core.serializers import SparseFieldsetMixin
 from .models import Quiz, QuizAttempt, QuizQuestion
 
 
@@ -41,7 +43,7 @@ class QuizQuestionCreateSerializer(serializers.ModelSerializer):
         ]
 
 
-class QuizListSerializer(serializers.ModelSerializer):
+class QuizListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Quiz listing with basic info."""
     course_title = serializers.CharField(source='course.title', read_only=True)
     question_count = serializers.ReadOnlyField()
@@ -53,9 +55,16 @@ class QuizListSerializer(serializers.ModelSerializer):
             'duration', 'passing_score', 'is_published',
             'question_count', 'max_attempts', 'created_at',
         ]
+        expandable_fields = {
+            'questions': (QuizQuestionSerializer, {'many': True, 'read_only': True}),
+        }
+        course_member_fields = ('questions',)
+        field_dependencies = {
+            'question_count': ('questions_total',),
+        }
 
 
-class QuizDetailSerializer(serializers.ModelSerializer):
+class QuizDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Full quiz with questions (for taking the quiz)."""
     course_title = serializers.CharField(source='course.title', read_only=True)
     questions = QuizQuestionSerializer(many=True, read_only=True)
@@ -69,6 +78,9 @@ class QuizDetailSerializer(serializers.ModelSerializer):
             'question_count', 'max_attempts', 'questions',
             'created_at', 'updated_at',
         ]
+        field_dependencies = {
+            'question_count': ('questions_total',),
+        }
 
 
 class QuizCreateSerializer(serializers.ModelSerializer):
@@ -92,9 +104,9 @@ class QuizCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         questions_data = validated_data.pop('questions', [])
         quiz = Quiz.objects.create(**validated_data)
-        for q_data in questions_data:
-            q_data['quiz'] = quiz
-            QuizQuestion.objects.create(**q_data)
+        QuizQuestion.objects.bulk_create(
+            [QuizQuestion(**{**q_data, 'quiz': quiz}) for q_data in questions_data]
+        )
         return quiz
 
 
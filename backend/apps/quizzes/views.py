@@ -1,13 +1,19 @@
 """
 Quiz views - CRUD for quizzes/questions, submit/grade, results.
 """
+from django.db import transaction
+from django.db.models import Count, Max, Sum, prefetch_related_objects
+from django.db.models.functions import Coalesce
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.pagination import StandardPagination
+from apps.core.conditional import ConditionalRetrieveMixin
+from apps.core.pagination import KeysetPagination, StandardPagination
+from apps.core.serializers import FieldSelection
 from apps.core.permissions import IsStudent, IsTeacher, IsTeacherOrReadOnly
+from apps.courses.models import Course
 
 from .models import Quiz, QuizAttempt, QuizQuestion
 from .serializers import (
@@ -42,12 +48,20 @@ class QuizListCreateView(generics.ListCreateAPIView):
         # Students see only published quizzes
         if self.request.user.role == 'student':
             queryset = queryset.filter(is_published=True)
-        return queryset
+        serializer = self.get_serializer()
+        if 'questions' in serializer.fields:
+            queryset = queryset.prefetch_related('questions')
+        if 'question_count' in serializer.fields:
+            # Meta.ordering is not applied to aggregating queries.
+            queryset = queryset.annotate(questions_total=Count('questions')).order_by('-created_at')
+        return serializer.optimize_queryset(queryset)
 
     def create(self, request, *args, **kwargs):
         serializer = QuizCreateSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
-        quiz = serializer.save()
+        with transaction.atomic():
+            quiz = serializer.save()
+            Course.adjust_counters(quiz.course_id, quiz_count=1)
 
         # Trigger notifications for enrolled students
         try:
@@ -87,7 +101,7 @@ class QuizListCreateView(generics.ListCreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class QuizDetailView(generics.RetrieveUpdateDestroyAPIView):
+class QuizDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET    /api/v1/quizzes/<id>/  - Get quiz with questions
     PUT    /api/v1/quizzes/<id>/  - Update quiz (owner teacher)
@@ -100,12 +114,32 @@ class QuizDetailView(generics.RetrieveUpdateDestroyAPIView):
         return QuizDetailSerializer
 
     def get_queryset(self):
-        return Quiz.objects.prefetch_related('questions').select_related('course')
+        queryset = Quiz.objects.select_related('course').annotate(
+            questions_updated_at=Max('questions__updated_at'),
+            questions_total=Count('questions'),
+        )
+        if self.request.method == 'GET':
+            # Validators read updated_at and course.updated_at.
+            queryset = self.get_serializer().optimize_queryset(
+                queryset, keep=('updated_at', 'course__updated_at')
+            )
+        return queryset
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = QuizDetailSerializer(instance)
-        return Response({'success': True, 'data': serializer.data})
+    def get_validators(self, instance):
+        # Deleting a question leaves no timestamp behind: ETag only.
+        parts = (
+            instance.pk, instance.updated_at, instance.course.updated_at,
+            instance.questions_updated_at, instance.questions_total,
+        )
+        return parts, None
+
+    def get_retrieve_data(self, instance):
+        serializer = QuizDetailSerializer(
+            instance, context={'field_selection': FieldSelection.from_query_params(self.request.query_params)}
+        )
+        if 'questions' in serializer.fields:
+            prefetch_related_objects([instance], 'questions')
+        return serializer.data
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -130,7 +164,16 @@ class QuizDetailView(generics.RetrieveUpdateDestroyAPIView):
                 {'success': False, 'error': {'message': 'Only the course teacher can delete quizzes.'}},
                 status=status.HTTP_403_FORBIDDEN,
             )
-        instance.delete()
+        with transaction.atomic():
+            # Attempts cascade with the quiz; take them off the course counters too.
+            attempts = instance.attempts.aggregate(n=Count('pk'), total=Coalesce(Sum('score'), 0))
+            instance.delete()
+            Course.adjust_counters(
+                instance.course_id,
+                quiz_count=-1,
+                attempt_count=-attempts['n'],
+                avg_quiz_score_sum=-attempts['total'],
+            )
         return Response({'success': True, 'message': 'Quiz deleted successfully.'})
 
 
@@ -224,14 +267,16 @@ class QuizSubmitView(APIView):
                 score += 1
 
         # Save attempt
-        attempt = QuizAttempt.objects.create(
-            quiz=quiz,
-            student=request.user,
-            score=score,
-            total_questions=total,
-            answers=submitted_answers,
-            time_taken=time_taken,
-        )
+        with transaction.atomic():
+            attempt = QuizAttempt.objects.create(
+                quiz=quiz,
+                student=request.user,
+                score=score,
+                total_questions=total,
+                answers=submitted_answers,
+                time_taken=time_taken,
+            )
+            Course.adjust_counters(quiz.course_id, attempt_count=1, avg_quiz_score_sum=score)
 
         return Response({
             'success': True,
@@ -247,7 +292,7 @@ class QuizAttemptsView(generics.ListAPIView):
     """
     serializer_class = QuizAttemptSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = StandardPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         quiz_id = self.kwargs['quiz_id']
@@ -257,4 +302,4 @@ class QuizAttemptsView(generics.ListAPIView):
         if user.role == 'student':
             queryset = queryset.filter(student=user)
 
-        return queryset.order_by('-completed_at')
+        return queryset.order_by('-created_at', '-id')
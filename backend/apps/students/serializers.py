@@ -5,6 +5,7 @@ Handles student dashboard, enrolled courses, progress, and student-facing data.
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from apps.core.serializers import SparseFieldsetMixin
 from apps.courses.models import Course
 from apps.enrollments.models import Enrollment
 from apps.progress.models import CourseProgress, LessonProgress
@@ -13,7 +14,7 @@ from apps.quizzes.models import QuizAttempt
 User = get_user_model()
 
 
-class StudentCourseSerializer(serializers.ModelSerializer):
+class StudentCourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Course data as seen by a student (with progress info)."""
     teacher_name = serializers.CharField(source='teacher.name', read_only=True)
     total_lessons = serializers.SerializerMethodField()
@@ -29,23 +30,48 @@ class StudentCourseSerializer(serializers.ModelSerializer):
             'total_lessons', 'completed_lessons', 'progress_percentage',
             'is_enrolled', 'created_at',
         ]
+        field_dependencies = {
+            'total_lessons': ('lesson_count',),
+            'completed_lessons': (),
+            'progress_percentage': (),
+            'is_enrolled': (),
+        }
+
+    # Output key -> with_stats(viewer=...) annotation (see CatalogCacheMixin).
+    VIEWER_FIELDS = {
+        'is_enrolled': 'viewer_is_enrolled',
+        'completed_lessons': 'viewer_completed_lessons',
+        'progress_percentage': 'viewer_progress',
+    }
+
+    # Each getter reads the with_stats(viewer=...) annotation when present.
+
+    def _viewer(self):
+        # None while building the shared catalog payload (see CatalogCacheMixin);
+        # viewer fields are merged in afterwards.
+        request = self.context.get('request')
+        if request is None or self.context.get('shared_payload'):
+            return None
+        return request.user
 
     def get_total_lessons(self, obj):
-        return obj.lessons.count()
+        return obj.lesson_count
 
     def get_completed_lessons(self, obj):
-        user = self.context.get('request')
-        if user and hasattr(user, 'user'):
-            user = user.user
+        if hasattr(obj, 'viewer_completed_lessons'):
+            return obj.viewer_completed_lessons
+        user = self._viewer()
+        if user:
             return LessonProgress.objects.filter(
                 student=user, lesson__course=obj, completed=True
             ).count()
         return 0
 
     def get_progress_percentage(self, obj):
-        user = self.context.get('request')
-        if user and hasattr(user, 'user'):
-            user = user.user
+        if hasattr(obj, 'viewer_progress'):
+            return obj.viewer_progress
+        user = self._viewer()
+        if user:
             try:
                 progress = CourseProgress.objects.get(student=user, course=obj)
                 return progress.progress_percentage
@@ -54,9 +80,10 @@ class StudentCourseSerializer(serializers.ModelSerializer):
         return 0
 
     def get_is_enrolled(self, obj):
-        user = self.context.get('request')
-        if user and hasattr(user, 'user'):
-            user = user.user
+        if hasattr(obj, 'viewer_is_enrolled'):
+            return obj.viewer_is_enrolled
+        user = self._viewer()
+        if user:
             return Enrollment.objects.filter(
                 student=user, course=obj, is_active=True
             ).exists()
@@ -3,15 +3,20 @@ Student-specific views.
 All endpoints here are restricted to users with role='student'.
 """
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Count
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.core.pagination import StandardPagination
+from apps.core.access import get_course_access
+from apps.core.pagination import EstimatedCountPagination, KeysetPagination, StandardPagination
 from apps.core.permissions import IsStudent
+from apps.courses.catalog import CatalogCacheMixin
 from apps.courses.models import Course
+from apps.courses.recommendations import recommended_courses
+from apps.courses.serializers import CourseListSerializer
+from apps.courses.search import search_courses
 from apps.enrollments.models import Enrollment
 from apps.lessons.models import Lesson
 from apps.progress.models import CourseProgress, LessonProgress
@@ -70,6 +75,9 @@ class StudentDashboardView(APIView):
         # Recent 5 courses
         recent_courses = enrolled_courses.order_by('-updated_at')[:5]
 
+        # "Recommended for you": precomputed neighbours of the enrolled courses
+        recommended = recommended_courses(get_course_access(student).enrolled, 5)
+
         data = {
             'total_enrolled_courses': total_enrolled,
             'completed_courses': completed,
@@ -81,6 +89,7 @@ class StudentDashboardView(APIView):
                 recent_courses, many=True, context={'request': request}
             ).data,
             'overall_progress': round(overall, 1),
+            'recommended_courses': CourseListSerializer(recommended, many=True).data,
         }
 
         return Response({'success': True, 'data': data})
@@ -99,7 +108,11 @@ class StudentEnrolledCoursesView(generics.ListAPIView):
         enrolled_ids = Enrollment.objects.filter(
             student=self.request.user, is_active=True
         ).values_list('course_id', flat=True)
-        return Course.objects.filter(id__in=enrolled_ids).select_related('teacher')
+        return (
+            Course.objects.filter(id__in=enrolled_ids)
+            .select_related('teacher')
+            .with_stats(viewer=self.request.user)
+        )
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
@@ -168,36 +181,30 @@ class StudentQuizHistoryView(generics.ListAPIView):
     """
     serializer_class = StudentQuizResultSerializer
     permission_classes = [IsAuthenticated, IsStudent]
-    pagination_class = StandardPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         return QuizAttempt.objects.filter(
             student=self.request.user
-        ).select_related('quiz', 'quiz__course').order_by('-completed_at')
+        ).select_related('quiz', 'quiz__course').order_by('-created_at', '-id')
 
 
-class StudentBrowseCoursesView(generics.ListAPIView):
+class StudentBrowseCoursesView(CatalogCacheMixin, generics.ListAPIView):
     """
     GET /api/v1/students/browse/
     Browse all available courses with search & filter.
     """
     serializer_class = StudentCourseSerializer
     permission_classes = [IsAuthenticated, IsStudent]
-    pagination_class = StandardPagination
+    pagination_class = EstimatedCountPagination
+    catalog_cache_name = 'student_browse'
 
     def get_queryset(self):
+        user = self.request.user
+        wants_viewer = not self.building_shared_payload and self.get_viewer_fields(user)
         queryset = Course.objects.filter(
             is_published=True, is_deleted=False
-        ).select_related('teacher')
-
-        # Search
-        search = self.request.query_params.get('search', '')
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(category__icontains=search)
-            )
+        ).select_related('teacher').with_stats(viewer=user if wants_viewer else None)
 
         # Filter by category
         category = self.request.query_params.get('category', '')
@@ -209,10 +216,16 @@ class StudentBrowseCoursesView(generics.ListAPIView):
         if level:
             queryset = queryset.filter(level__iexact=level)
 
+        # Search (ranked by relevance unless an explicit sort is requested)
+        search = self.request.query_params.get('search', '')
+        if search:
+            queryset = search_courses(queryset, search)
+
         # Sorting
-        sort = self.request.query_params.get('sort', '-created_at')
+        default_sort = None if search else '-created_at'
+        sort = self.request.query_params.get('sort', default_sort)
         allowed_sorts = ['created_at', '-created_at', 'title', '-title']
         if sort in allowed_sorts:
             queryset = queryset.order_by(sort)
 
-        return queryset
+        return self.get_serializer().optimize_queryset(queryset)
@@ -3,12 +3,11 @@ Teacher-specific serializers.
 Handles teacher dashboard, course management stats, student analytics.
 """
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count
+from django.db.models import Count
 from rest_framework import serializers
 
 from apps.courses.models import Course
-from apps.enrollments.models import Enrollment
-from apps.quizzes.models import QuizAttempt
+from apps.media.images import image_srcset
 
 User = get_user_model()
 
@@ -20,6 +19,7 @@ class TeacherCourseStatsSerializer(serializers.ModelSerializer):
     total_quizzes = serializers.SerializerMethodField()
     avg_quiz_score = serializers.SerializerMethodField()
     cover_image_url = serializers.SerializerMethodField()
+    cover_image_srcset = serializers.SerializerMethodField()
     teacher_id = serializers.UUIDField(source='teacher.id', read_only=True)
     teacher_name = serializers.CharField(source='teacher.name', read_only=True)
 
@@ -27,31 +27,31 @@ class TeacherCourseStatsSerializer(serializers.ModelSerializer):
         model = Course
         fields = [
             'id', 'title', 'description', 'category', 'level',
-            'cover_image_url', 'is_published', 'duration',
+            'cover_image_url', 'cover_image_srcset', 'is_published', 'duration',
             'total_students', 'total_lessons', 'total_quizzes',
             'avg_quiz_score', 'created_at', 'updated_at', 'teacher_id', 'teacher_name',
         ]
 
     def get_total_students(self, obj):
-        return Enrollment.objects.filter(course=obj, is_active=True).count()
+        return obj.active_student_count
 
     def get_total_lessons(self, obj):
-        return obj.lessons.count()
+        return obj.lesson_count
 
     def get_total_quizzes(self, obj):
-        return obj.quizzes.count()
+        return obj.quiz_count
 
     def get_avg_quiz_score(self, obj):
-        avg = QuizAttempt.objects.filter(
-            quiz__course=obj
-        ).aggregate(avg=Avg('score'))['avg']
-        return round(avg, 1) if avg else None
+        return obj.avg_quiz_score or None
 
     def get_cover_image_url(self, obj):
         if obj.cover_image:
             return obj.cover_image.url
         return None
 
+    def get_cover_image_srcset(self, obj):
+        return image_srcset(obj.cover_image, obj.cover_image_variants)
+
 
 class TeacherDashboardSerializer(serializers.Serializer):
     """Aggregated dashboard data for the teacher."""
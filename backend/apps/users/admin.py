@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from .authentication import revoke_user_tokens
 from .models import User
 
 
@@ -22,3 +23,13 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('email', 'name', 'role', 'password1', 'password2'),
         }),
     )
+
+    # Fields whose value is carried in, or decides, the user's access tokens.
+    TOKEN_FIELDS = ('is_active', 'is_staff', 'is_superuser', 'role')
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Permissions trust role/is_staff from the token: changing them, or
+        # deactivating the user, must end the tokens issued before.
+        if change and set(self.TOKEN_FIELDS) & set(form.changed_data):
+            revoke_user_tokens(obj.pk)
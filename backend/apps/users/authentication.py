@@ -0,0 +1,84 @@
+"""
+Stateless JWT authentication and the access-token deny-list.
+
+StatelessJWTAuthentication trusts the claims embedded by
+CustomTokenObtainPairSerializer instead of fetching the user row on every
+request. Because is_active is no longer checked per request, tokens that must
+stop working before they expire are put on a deny-list in the shared cache:
+single tokens by jti (logout) or every token of a user issued up to a point in
+time (deactivation).
+"""
+import time
+
+from django.core.cache import caches
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import TokenUser
+
+# The deny-list must be visible to every worker immediately, so it bypasses
+# the per-process L1 of the default cache.
+DENY_LIST_CACHE_ALIAS = 'shared'
+
+
+def _jti_key(jti):
+    return f'jwt_deny:jti:{jti}'
+
+
+def _user_key(user_id):
+    return f'jwt_deny:user:{user_id}'
+
+
+def revoke_token(token):
+    """Deny a single access token until it expires."""
+    jti = token.get(api_settings.JTI_CLAIM)
+    if not jti:
+        return
+    ttl = int(token.get('exp', 0) - time.time())
+    if ttl > 0:
+        caches[DENY_LIST_CACHE_ALIAS].set(_jti_key(jti), True, ttl)
+
+
+def revoke_user_tokens(*user_ids):
+    """Deny every access token issued to the given users up to now."""
+    if not user_ids:
+        return
+    now = int(time.time())
+    ttl = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()) + 1
+    caches[DENY_LIST_CACHE_ALIAS].set_many({_user_key(uid): now for uid in user_ids}, ttl)
+
+
+def is_token_revoked(token):
+    keys = [_user_key(token[api_settings.USER_ID_CLAIM])]
+    jti = token.get(api_settings.JTI_CLAIM)
+    if jti:
+        keys.append(_jti_key(jti))
+    denied = caches[DENY_LIST_CACHE_ALIAS].get_many(keys)
+    if len(keys) > 1 and denied.get(keys[1]):
+        return True
+    revoked_at = denied.get(keys[0])
+    return revoked_at is not None and token.get('iat', 0) <= revoked_at
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds request.user from token claims.
+
+    Permission checks that only read id/role/is_staff cost no query; views
+    that touch any other user field load the row lazily (see TokenUser).
+    Claims are as fresh as the token, i.e. at most ACCESS_TOKEN_LIFETIME old.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        if is_token_revoked(validated_token):
+            raise AuthenticationFailed('Token has been revoked.', code='token_revoked')
+
+        return TokenUser.from_token(
+            validated_token, api_settings.USER_ID_FIELD, api_settings.USER_ID_CLAIM
+        )
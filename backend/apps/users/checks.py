@@ -0,0 +1,21 @@
+"""
+System checks for the users app.
+"""
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from .authentication import DENY_LIST_CACHE_ALIAS
+
+
+@register(Tags.security, Tags.caches)
+def check_deny_list_cache(app_configs, **kwargs):
+    """The token deny-list only works when every worker reads the same cache."""
+    backend = settings.CACHES.get(DENY_LIST_CACHE_ALIAS, {}).get('BACKEND', '')
+    if settings.DEBUG or 'locmem' not in backend.lower():
+        return []
+    return [Warning(
+        f"The '{DENY_LIST_CACHE_ALIAS}' cache is per-process local memory, so revoked "
+        "access tokens (logout, deactivation, role changes) stay valid in other workers.",
+        hint='Set REDIS_URL so the shared cache is Redis.',
+        id='users.W001',
+    )]
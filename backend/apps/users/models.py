@@ -2,8 +2,9 @@
 Custom User model with role-based authentication.
 """
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, router
 from apps.core.models import TimeStampedModel
+from apps.media.images import enqueue_image_variants, image_changed
 
 
 class UserManager(BaseUserManager):
@@ -62,6 +63,11 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
         blank=True,
         null=True,
     )
+    # Written by apps.media.images with UPDATEs; save() never writes it on an
+    # existing row.
+    profile_image_variants = models.JSONField(
+        default=dict, blank=True, editable=False,
+        help_text='Resized copies of profile_image by format and width (apps.media.images)')
     phone_number = models.CharField(max_length=20, blank=True, default='')
 
     # Status fields
@@ -94,6 +100,19 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
     def __str__(self):
         return f"{self.name} ({self.email})"
 
+    def save(self, *args, **kwargs):
+        if kwargs.get('update_fields') is None and not self._state.adding and not kwargs.get('force_insert'):
+            # A full save of a loaded instance would put back the variants it
+            # was loaded with, losing ones generated since.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'profile_image_variants'
+            ]
+        image_was_changed = image_changed(self, 'profile_image', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+        if image_was_changed:
+            enqueue_image_variants(self, 'profile-image')
+
     @property
     def is_teacher(self):
         return self.role == self.RoleChoices.TEACHER
@@ -113,6 +132,51 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
         return None
 
 
+class TokenUser(User):
+    """
+    User built from access-token claims by StatelessJWTAuthentication.
+
+    Only the fields carried in the token (id, role, name, email, is_staff) are
+    populated; the first access to any other field loads the rest of the row
+    in a single query. Being a proxy it compares equal to, and can be assigned
+    or filtered on wherever, a regular User.
+    """
+
+    CLAIM_FIELDS = ('role', 'name', 'email', 'is_staff')
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_token(cls, token, user_id_field, user_id_claim):
+        values = {user_id_field: cls._meta.get_field(user_id_field).to_python(token[user_id_claim])}
+        for claim in cls.CLAIM_FIELDS:
+            if claim in token:
+                values[claim] = token[claim]
+        field_names = [f.attname for f in cls._meta.concrete_fields if f.attname in values]
+        db = router.db_for_read(cls)
+        return cls.from_db(db, field_names, [values[name] for name in field_names])
+
+    def save(self, *args, **kwargs):
+        # Claim values may be older than the row; writing them back would undo
+        # e.g. an admin role change. Writes go through a freshly loaded User.
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & set(self.CLAIM_FIELDS):
+            raise TypeError(
+                'TokenUser carries token claims, not the stored row; '
+                'save a User loaded with User.objects.get(pk=...) instead.'
+            )
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        # A deferred field was touched: fetch every missing field at once
+        # instead of one query per attribute.
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred.intersection(fields):
+            fields = list(deferred)
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+
+
 class PhoneOTP(TimeStampedModel):
     """Model to store OTP codes for phone verification."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='phone_otps')
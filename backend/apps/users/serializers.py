@@ -6,6 +6,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from apps.media.images import image_srcset
+
 User = get_user_model()
 
 
@@ -36,6 +38,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['role'] = user.role
         token['name'] = user.name
         token['email'] = user.email
+        token['is_staff'] = user.is_staff
         return token
 
 
@@ -75,16 +78,20 @@ class RegisterSerializer(serializers.ModelSerializer):
 class UserProfileSerializer(serializers.ModelSerializer):
     """Full user profile serializer."""
     profile_image_url = serializers.ReadOnlyField()
+    profile_image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = [
             'id', 'email', 'name', 'role', 'bio', 'phone_number',
-            'profile_image', 'profile_image_url',
+            'profile_image', 'profile_image_url', 'profile_image_srcset',
             'is_email_verified', 'is_phone_verified', 'created_at', 'updated_at',
         ]
         read_only_fields = ['id', 'email', 'role', 'is_email_verified', 'is_phone_verified', 'created_at', 'updated_at']
 
+    def get_profile_image_srcset(self, obj):
+        return image_srcset(obj.profile_image, obj.profile_image_variants)
+
 
 class UserUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating user profile."""
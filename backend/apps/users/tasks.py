@@ -74,5 +74,9 @@ def deactivate_unverified_accounts():
         created_at__lt=cutoff,
     ).exclude(is_staff=True)
 
-    count = unverified.update(is_active=False)
+    user_ids = list(unverified.values_list('id', flat=True))
+    count = User.objects.filter(id__in=user_ids).update(is_active=False)
+    # Access tokens are not re-checked against the database; deny them.
+    from .authentication import revoke_user_tokens
+    revoke_user_tokens(*user_ids)
     logger.info(f"Deactivated {count} unverified accounts.")
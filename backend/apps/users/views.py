@@ -9,9 +9,12 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from apps.core.conditional import ConditionalRetrieveMixin
+
 import random
 from datetime import timedelta
 from django.utils import timezone
+from .authentication import revoke_token
 from .models import PhoneOTP
 from .serializers import (
     ChangePasswordSerializer,
@@ -42,8 +45,8 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
 
-        # Generate tokens for the new user
-        refresh = RefreshToken.for_user(user)
+        # Generate tokens for the new user (with the same claims as login)
+        refresh = CustomTokenObtainPairSerializer.get_token(user)
         return Response({
             'success': True,
             'message': 'Account created successfully.',
@@ -66,10 +69,12 @@ class RegisterView(generics.CreateAPIView):
 
 
 class LogoutView(APIView):
-    """Logout - blacklists the refresh token."""
+    """Logout - blacklists the refresh token and denies the access token."""
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        if request.auth is not None:
+            revoke_token(request.auth)
         try:
             refresh_token = request.data.get('refresh')
             if refresh_token:
@@ -86,7 +91,7 @@ class LogoutView(APIView):
             }, status=status.HTTP_200_OK)
 
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(ConditionalRetrieveMixin, generics.RetrieveUpdateAPIView):
     """Get or update the current user's profile."""
     permission_classes = [IsAuthenticated]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser, parsers.JSONParser]
@@ -97,24 +102,22 @@ class ProfileView(generics.RetrieveUpdateAPIView):
         return UserProfileSerializer
 
     def get_object(self):
-        return self.request.user
+        # The stored row, not request.user: token claims may be out of date.
+        return User.objects.get(pk=self.request.user.pk)
 
-    def retrieve(self, request, *args, **kwargs):
-        serializer = UserProfileSerializer(request.user)
-        return Response({
-            'success': True,
-            'data': serializer.data
-        })
+    def get_retrieve_data(self, instance):
+        return UserProfileSerializer(instance).data
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
-        serializer = UserUpdateSerializer(request.user, data=request.data, partial=partial)
+        user = self.get_object()
+        serializer = UserUpdateSerializer(user, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response({
             'success': True,
             'message': 'Profile updated successfully.',
-            'data': UserProfileSerializer(request.user).data
+            'data': UserProfileSerializer(user).data
         })
 
 
@@ -126,8 +129,9 @@ class ChangePasswordView(APIView):
         serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
 
-        request.user.set_password(serializer.validated_data['new_password'])
-        request.user.save()
+        user = User.objects.get(pk=request.user.pk)
+        user.set_password(serializer.validated_data['new_password'])
+        user.save(update_fields=['password', 'updated_at'])
 
         return Response({
             'success': True,
@@ -170,7 +174,7 @@ class RequestPhoneOTPView(APIView):
         if phone_number != user.phone_number:
             user.phone_number = phone_number
             user.is_phone_verified = False
-            user.save(update_fields=['phone_number', 'is_phone_verified'])
+            user.save(update_fields=['phone_number', 'is_phone_verified', 'updated_at'])
 
         # Generate a 4-digit OTP
         otp_code = str(random.randint(1000, 9999))
@@ -227,8 +231,9 @@ class VerifyPhoneOTPView(APIView):
         otp_obj.is_used = True
         otp_obj.save()
 
+        user = User.objects.get(pk=user.pk)
         user.is_phone_verified = True
-        user.save(update_fields=['is_phone_verified'])
+        user.save(update_fields=['is_phone_verified', 'updated_at'])
 
         return Response({
             'success': True,
@@ -35,6 +35,16 @@ app.conf.beat_schedule = {
         'task': 'apps.notifications.tasks.send_weekly_progress_reminders',
         'schedule': crontab(hour=9, minute=0, day_of_week=1),
     },
+    # Rebuild co-enrollment course recommendations nightly at 2 AM
+    'rebuild-related-courses': {
+        'task': 'apps.courses.tasks.rebuild_related_courses',
+        'schedule': crontab(hour=2, minute=0),
+    },
+    # Drop abandoned resumable uploads every hour
+    'expire-upload-sessions': {
+        'task': 'apps.media.tasks.expire_upload_sessions',
+        'schedule': crontab(minute=30),
+    },
 }
 
 
@@ -149,7 +149,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Builds request.user from token claims; no per-request user query.
+        'apps.users.authentication.StatelessJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -163,8 +164,8 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'apps.core.throttling.SharedAnonRateThrottle',
+        'apps.core.throttling.SharedUserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
@@ -204,18 +205,48 @@ CORS_ALLOW_METHODS = [
     'PUT',
 ]
 
-# Redis Cache Configuration - Using local memory cache for development
-CACHES = {
-    'default': {
+# Cache Configuration
+# 'shared' is the cross-process tier: Redis when REDIS_URL is set, otherwise a
+# local-memory stand-in for development and tests. Production needs REDIS_URL:
+# the JWT deny-list lives here (check users.W001). 'default' fronts it with a
+# bounded per-process LRU that is invalidated across workers over Redis pub/sub.
+REDIS_URL = env.str('REDIS_URL', '')
+
+if REDIS_URL:
+    SHARED_CACHE = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_URL,
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+        },
+    }
+else:
+    SHARED_CACHE = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'mentiq-cache',
         'TIMEOUT': 300,
     }
+
+CACHES = {
+    'default': {
+        'BACKEND': 'apps.core.cache.TieredCache',
+        'LOCATION': 'mentiq-tiered',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'L2_ALIAS': 'shared',
+            'L1_MAX_ENTRIES': env.int('CACHE_L1_MAX_ENTRIES', 1000),
+            'L1_TIMEOUT': env.int('CACHE_L1_TIMEOUT', 30),
+            'INVALIDATION_URL': REDIS_URL,
+            'INVALIDATION_CHANNEL': 'mentiq:cache:invalidate',
+        },
+    },
+    'shared': SHARED_CACHE,
 }
 
-# Session Configuration
+# Session Configuration - sessions and throttles read the shared tier directly
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
-SESSION_CACHE_ALIAS = 'default'
+SESSION_CACHE_ALIAS = 'shared'
 
 # Celery Configuration
 CELERY_BROKER_URL = env.str('CELERY_BROKER_URL', 'redis://localhost:6379/1')
@@ -272,6 +303,68 @@ ALLOWED_IMAGE_TYPES = ['jpg', 'jpeg', 'png', 'gif', 'webp']
 ALLOWED_VIDEO_TYPES = ['mp4', 'mov', 'avi', 'mkv', 'webm']
 ALLOWED_DOCUMENT_TYPES = ['pdf', 'doc', 'docx', 'ppt', 'pptx', 'txt', 'zip']
 
+# Lesson video processing (apps.media): ffprobe metadata and HLS renditions.
+# Renditions are height:kbps pairs; those taller than the source are skipped.
+MEDIA_FFMPEG_BINARY = env.str('MEDIA_FFMPEG_BINARY', 'ffmpeg')
+MEDIA_FFPROBE_BINARY = env.str('MEDIA_FFPROBE_BINARY', 'ffprobe')
+MEDIA_HLS_RENDITIONS = env.str('MEDIA_HLS_RENDITIONS', '1080:5000,720:2800,480:1400,360:800')
+MEDIA_HLS_SEGMENT_SECONDS = env.int('MEDIA_HLS_SEGMENT_SECONDS', 6)
+MEDIA_X264_PRESET = env.str('MEDIA_X264_PRESET', 'veryfast')
+MEDIA_TRANSCODE_TIMEOUT = env.int('MEDIA_TRANSCODE_TIMEOUT', 3600)  # seconds
+
+# Resumable (tus) uploads. Partial files must live on the same filesystem as
+# MEDIA_ROOT so finished uploads are moved into place without a copy.
+RESUMABLE_UPLOAD_DIR = env.str('RESUMABLE_UPLOAD_DIR', str(MEDIA_ROOT / '.partial'))
+RESUMABLE_UPLOAD_MAX_SIZE = env.int('RESUMABLE_UPLOAD_MAX_SIZE', 2147483648)  # 2GB
+RESUMABLE_UPLOAD_EXPIRY_HOURS = env.int('RESUMABLE_UPLOAD_EXPIRY_HOURS', 24)
+
+# Media serving (apps.media.serving): 'django' (FileResponse with Range support),
+# 'accel' (nginx X-Accel-Redirect) or 'sendfile' (X-Sendfile). For 'accel', map
+# the prefix to MEDIA_ROOT in nginx:
+#     location /protected-media/ { internal; alias /path/to/media/; }
+MEDIA_SERVE_MODE = env.str('MEDIA_SERVE_MODE', 'django')
+MEDIA_ACCEL_REDIRECT_PREFIX = env.str('MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+MEDIA_PUBLIC_MAX_AGE = env.int('MEDIA_PUBLIC_MAX_AGE', 86400)  # seconds
+MEDIA_PRIVATE_MAX_AGE = env.int('MEDIA_PRIVATE_MAX_AGE', 3600)  # seconds
+# Lifetime of signed media URLs (apps.media.signing) handed to players; a URL
+# is valid for between half and all of it.
+MEDIA_SIGNED_URL_TTL = env.int('MEDIA_SIGNED_URL_TTL', 14400)  # seconds
+
+# Responsive image variants (apps.media.images): comma-separated widths in px
+COURSE_COVER_VARIANT_WIDTHS = env.str('COURSE_COVER_VARIANT_WIDTHS', '320,640,1280')
+PROFILE_IMAGE_VARIANT_WIDTHS = env.str('PROFILE_IMAGE_VARIANT_WIDTHS', '64,128,256')
+IMAGE_VARIANT_QUALITY = env.int('IMAGE_VARIANT_QUALITY', 80)
+
+# Pagination totals: 'exact', 'cached' (exact, cached per queryset) or 'estimated' (Postgres planner)
+PAGINATION_COUNT_STRATEGY = env.str('PAGINATION_COUNT_STRATEGY', 'exact')
+PAGINATION_COUNT_CACHE_TTL = env.int('PAGINATION_COUNT_CACHE_TTL', 60)  # seconds
+PAGINATION_ESTIMATE_THRESHOLD = env.int('PAGINATION_ESTIMATE_THRESHOLD', 1000)  # rows
+
+# Course title autocomplete: 'memory' (in-process index) or 'database' (pg_trgm, PostgreSQL only)
+COURSE_SUGGEST_BACKEND = env.str('COURSE_SUGGEST_BACKEND', 'memory')
+COURSE_SUGGEST_MAX_RESULTS = env.int('COURSE_SUGGEST_MAX_RESULTS', 20)
+
+# Published catalog listings are cached per query and catalog version; the TTL
+# bounds how stale student counts (not versioned) can get.
+CATALOG_CACHE_TTL = env.int('CATALOG_CACHE_TTL', 120)  # seconds
+
+# "Students also enrolled in": neighbours kept per course, and the minimum
+# number of shared students before two courses count as related.
+RELATED_COURSES_TOP_K = env.int('RELATED_COURSES_TOP_K', 10)
+RELATED_COURSES_MIN_SUPPORT = env.int('RELATED_COURSES_MIN_SUPPORT', 2)
+
+# Bulk course import: rows (courses + lessons + quizzes + questions) per bulk_create batch.
+COURSE_IMPORT_BATCH_SIZE = env.int('COURSE_IMPORT_BATCH_SIZE', 1000)
+
+# Sanitized, gzip-compressed lesson HTML is cached per lesson and updated_at.
+LESSON_CONTENT_CACHE_TTL = env.int('LESSON_CONTENT_CACHE_TTL', 86400)  # seconds
+
+# Request Monitoring
+# Seconds between background dependency probes behind /api/health/ endpoints.
+HEALTH_CHECK_INTERVAL = env.int('HEALTH_CHECK_INTERVAL', 15)
+# A statement fingerprint repeated this many times in one request is logged as a possible N+1 (0 disables)
+N_PLUS_ONE_THRESHOLD = env.int('N_PLUS_ONE_THRESHOLD', 5)
+
 # DRF Spectacular (API Documentation)
 SPECTACULAR_SETTINGS = {
     'TITLE': 'MentiQ E-Learning API',
@@ -283,14 +376,20 @@ SPECTACULAR_SETTINGS = {
 }
 
 # Logging Configuration
+# Records are queued in the request thread and written as JSON lines by a
+# listener thread (apps.core.log_pipeline). LOG_OUTPUT=file appends to
+# logs/django.log, rotated externally (logrotate), not by the workers.
+LOG_OUTPUT = env.str('LOG_OUTPUT', 'stdout')
+LOG_QUEUE_SIZE = env.int('LOG_QUEUE_SIZE', 10000)
+# Fraction of successful requests faster than LOG_SLOW_REQUEST_MS to log;
+# failed and slow requests are always logged.
+LOG_SAMPLE_RATE = env.float('LOG_SAMPLE_RATE', 1.0)
+LOG_SLOW_REQUEST_MS = env.int('LOG_SLOW_REQUEST_MS', 1000)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
-        },
         'simple': {
             'format': '{levelname} {message}',
             'style': '{',
@@ -300,6 +399,11 @@ LOGGING = {
         'require_debug_true': {
             '()': 'django.utils.log.RequireDebugTrue',
         },
+        'request_sampling': {
+            '()': 'apps.core.log_pipeline.RequestSampleFilter',
+            'sample_rate': LOG_SAMPLE_RATE,
+            'slow_ms': LOG_SLOW_REQUEST_MS,
+        },
     },
     'handlers': {
         'console': {
@@ -307,32 +411,32 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple'
         },
-        'file': {
+        'queue': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            'class': 'apps.core.log_pipeline.QueuedHandler',
+            'output': LOG_OUTPUT,
             'filename': BASE_DIR / 'logs' / 'django.log',
-            'maxBytes': 1024 * 1024 * 15,  # 15MB
-            'backupCount': 10,
-            'formatter': 'verbose',
+            'queue_size': LOG_QUEUE_SIZE,
+            'filters': ['request_sampling'],
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': env.str('LOG_LEVEL', 'INFO'),
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'ERROR',
             'propagate': False,
         },
         'celery': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
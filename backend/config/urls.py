@@ -12,7 +12,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
-from apps.core.views import HealthCheckView
+from apps.core.views import HealthCheckView, LivenessView, ReadinessView
+from apps.media.views import ProtectedMediaView
 
 urlpatterns = [
     # Admin
@@ -20,6 +21,8 @@ urlpatterns = [
 
     # Health Check
     path('api/health/', HealthCheckView.as_view(), name='health-check'),
+    path('api/health/live/', LivenessView.as_view(), name='health-live'),
+    path('api/health/ready/', ReadinessView.as_view(), name='health-ready'),
 
     # API v1
     path('api/v1/auth/', include('apps.users.urls')),
@@ -43,7 +46,15 @@ urlpatterns = [
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 ]
 
-# Serve media files in development
+# Media files, access-checked (see apps.media.serving)
+urlpatterns += [
+    path(
+        f"{settings.MEDIA_URL.lstrip('/')}signed/<int:expires>/<str:signature>/<path:path>",
+        ProtectedMediaView.as_view(), name='media-file-signed',
+    ),
+    path(f"{settings.MEDIA_URL.lstrip('/')}<path:path>", ProtectedMediaView.as_view(), name='media-file'),
+]
+
+# Serve static files in development
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -147,6 +147,8 @@ async function apiRequest<T = any>(
   const contentType = res.headers.get('content-type');
   if (contentType && contentType.includes('application/json')) {
     data = await res.json();
+  } else if (contentType && contentType.startsWith('text/')) {
+    data = await res.text();
   }
 
   if (!res.ok) {
@@ -300,6 +302,12 @@ export const lessonApi = {
   get: (id: string | number) =>
     api.get(`/v1/lessons/${id}/`),
 
+  // Sanitized HTML, whole or one section (index or anchor from content_sections)
+  getContent: (id: string | number, section?: string | number) => {
+    const query = section !== undefined ? `?section=${encodeURIComponent(String(section))}` : '';
+    return api.get<string>(`/v1/lessons/${id}/content/${query}`);
+  },
+
   create: (data: {
     course: string | number;
     title: string;
@@ -11,12 +11,13 @@ export interface MediaUploadOptions {
   type: 'image' | 'video' | 'file';
   category: 'profile' | 'course-cover' | 'lesson-video' | 'course-file' | 'announcement';
   userId?: string;
+  /** Course id; required for 'lesson-video' and 'course-file' so enrolled students can read the file. */
   relatedId?: string;
 }
 
 export const uploadMediaFile = async (options: MediaUploadOptions): Promise<string> => {
   try {
-    const { uri, type, category } = options;
+    const { uri, type, category, relatedId } = options;
 
     // Determine file extension and MIME type
     const extension = uri.split('.').pop()?.toLowerCase() || 'jpg';
@@ -43,6 +44,9 @@ export const uploadMediaFile = async (options: MediaUploadOptions): Promise<stri
     } as any);
     formData.append('category', category);
     formData.append('type', type);
+    if (relatedId) {
+      formData.append('course', relatedId);
+    }
 
     const { data } = await mediaApi.upload(formData);
 
@@ -36,6 +36,21 @@ export interface Lesson {
   updatedAt?: string;
 }
 
+// Lesson content arrives as sanitized HTML; the lesson screen shows plain text.
+function htmlToText(html: string): string {
+  return html
+    .replace(/<br\s*\/?>/gi, '\n')
+    .replace(/<\/(p|div|li|h[1-6]|tr|blockquote|pre)>/gi, '\n\n')
+    .replace(/<[^>]+>/g, '')
+    .replace(/&lt;/g, '<')
+    .replace(/&gt;/g, '>')
+    .replace(/&quot;/g, '"')
+    .replace(/&#x27;|&#39;/g, "'")
+    .replace(/&amp;/g, '&')
+    .replace(/\n{3,}/g, '\n\n')
+    .trim();
+}
+
 // Normalize API response to frontend format
 function normalizeCourse(raw: any): Course {
   return {
@@ -247,7 +262,13 @@ export const useCourseStore = create<CourseState>((set) => ({
   getLessonById: async (lessonId) => {
     try {
       const { data } = await lessonApi.get(lessonId);
-      return normalizeLesson(data);
+      const raw = data.data || data;
+      // The detail omits the content body; fetch it from /content/ when there is any.
+      if (raw.content_sections?.length) {
+        const { data: html } = await lessonApi.getContent(lessonId);
+        raw.content = htmlToText(html || '');
+      }
+      return normalizeLesson(raw);
     } catch (error) {
       console.error('Error fetching lesson:', error);
       return null;